@@ -69,12 +69,13 @@ class ListCommand(BaseCommand):
         """Handle snapmirror relationships listing."""
         svm_name = None
         cluster_name = None
+        include_source_relationships = False
         
         try:
             opts, _ = getopt.getopt(
                 self.args[3:], 
-                "hv:u:", 
-                ["cluster-name=", "help", "svm="]
+                "hv:u:a", 
+                ["cluster-name=", "help", "svm=", "include-source"]
             )
         except Exception as err:
             logger.error(err)
@@ -88,9 +89,12 @@ class ListCommand(BaseCommand):
                 svm_name = arg
             elif opt in ("-u", "--cluster-name"):
                 cluster_name = arg
+            elif opt in ("-a", "--include-source"):
+                include_source_relationships = True
         
         try:
-            list_snap_mirror_relationships(print_output=True, cluster_name=cluster_name)
+            list_snap_mirror_relationships(print_output=True, cluster_name=cluster_name,
+                                           include_source_relationships=include_source_relationships)
         except (InvalidConfigError, APIConnectionError):
             sys.exit(1)
     
@@ -9,6 +9,7 @@ from netapp_dataops.help_text import (
     HELP_TEXT_PUSH_TO_S3_DIRECTORY,
     HELP_TEXT_PUSH_TO_S3_FILE
 )
+from netapp_dataops.traditional.core import _convert_size_string_to_bytes
 from netapp_dataops.traditional import (
     pull_bucket_from_s3,
     pull_object_from_s3,
@@ -18,6 +19,25 @@ from netapp_dataops.traditional import (
     APIConnectionError
 )
 
+# Multipart transfer options shared by all S3 commands, mapped to function arguments
+TRANSFER_OPTIONS = {
+    "--multipart-threshold": "multipart_threshold",
+    "--part-size": "multipart_chunksize",
+    "--max-concurrency": "max_concurrency",
+    "--max-connections": "max_connections",
+}
+TRANSFER_LONG_OPTIONS = [opt[2:] + "=" for opt in TRANSFER_OPTIONS]
+
+# Bulk transfer options, valid for the bucket and directory commands only
+BULK_TRANSFER_OPTIONS = {
+    "--max-listers": "max_listers",
+    "--max-retries": "max_retries",
+    "--max-scanners": "max_scanners",
+    "--max-bandwidth": "max_bandwidth",
+    "--max-request-rate": "max_requests_per_second",
+}
+BULK_TRANSFER_LONG_OPTIONS = [opt[2:] + "=" for opt in BULK_TRANSFER_OPTIONS]
+
 
 class S3Command(BaseCommand):
     """Handle S3-related command requests."""
@@ -31,6 +51,26 @@ class S3Command(BaseCommand):
         else:
             self.handle_invalid_command()
     
+    def _set_transfer_option(self, opt: str, arg: str, transfer_options: dict, help_text: str) -> None:
+        """Parse a multipart or bulk transfer option into the given keyword arguments."""
+        try:
+            if opt in ("--multipart-threshold", "--part-size", "--max-bandwidth"):
+                value = _convert_size_string_to_bytes(arg)
+            else:
+                value = int(arg)
+        except ValueError:
+            logger.error("Error: Invalid value for %s: '%s'.", opt[2:], arg)
+            self.handle_invalid_command(help_text=help_text, invalid_opt_arg=True)
+        if opt == "--max-retries":
+            # Zero disables retries
+            if value < 0:
+                logger.error("Error: %s must not be negative.", opt[2:])
+                self.handle_invalid_command(help_text=help_text, invalid_opt_arg=True)
+        elif value < 1:
+            logger.error("Error: %s must be greater than 0.", opt[2:])
+            self.handle_invalid_command(help_text=help_text, invalid_opt_arg=True)
+        transfer_options[TRANSFER_OPTIONS.get(opt) or BULK_TRANSFER_OPTIONS[opt]] = value
+
     def _handle_pull_from_s3(self) -> None:
         """Handle pull from S3 operations."""
         target = self.get_target()
@@ -58,12 +98,21 @@ class S3Command(BaseCommand):
         s3_bucket = None
         s3_object_key_prefix = ""
         local_directory = None
+        sync = False
+        delete = False
+        manifest_file = None
+        sharded = False
+        shard_files = None
+        journal_file = None
+        metrics_file = None
+        transfer_options = {}
         
         try:
             opts, _ = getopt.getopt(
                 self.args[3:], 
-                "hb:p:d:e:", 
-                ["help", "bucket=", "key-prefix=", "directory="]
+                "hb:p:d:e:sxm:", 
+                ["help", "bucket=", "key-prefix=", "directory=", "sync", "delete", "manifest=", "sharded", "shard-files=",
+                 "journal=", "metrics-file="] + TRANSFER_LONG_OPTIONS + BULK_TRANSFER_LONG_OPTIONS
             )
         except Exception as err:
             logger.error(err)
@@ -79,31 +128,68 @@ class S3Command(BaseCommand):
                 s3_object_key_prefix = arg
             elif opt in ("-d", "--directory"):
                 local_directory = arg
+            elif opt in ("-s", "--sync"):
+                sync = True
+            elif opt in ("-x", "--delete"):
+                delete = True
+            elif opt in ("-m", "--manifest"):
+                manifest_file = arg
+            elif opt == "--sharded":
+                sharded = True
+            elif opt == "--shard-files":
+                shard_files = arg.split(",")
+            elif opt == "--journal":
+                journal_file = arg
+            elif opt == "--metrics-file":
+                metrics_file = arg
+            elif opt in TRANSFER_OPTIONS or opt in BULK_TRANSFER_OPTIONS:
+                self._set_transfer_option(opt, arg, transfer_options, HELP_TEXT_PULL_FROM_S3_BUCKET)
         
         if not s3_bucket or not local_directory:
             self.handle_invalid_command(help_text=HELP_TEXT_PULL_FROM_S3_BUCKET, invalid_opt_arg=True)
         
+        # Deleting extraneous files is only meaningful when syncing
+        if delete and not sync:
+            self.handle_invalid_command(help_text=HELP_TEXT_PULL_FROM_S3_BUCKET, invalid_opt_arg=True)
+        
+        # Selected files are extracted from shards; shards are never synced
+        if shard_files:
+            sharded = True
+        if sharded and (sync or journal_file):
+            self.handle_invalid_command(help_text=HELP_TEXT_PULL_FROM_S3_BUCKET, invalid_opt_arg=True)
+        
         try:
-            pull_bucket_from_s3(
+            result = pull_bucket_from_s3(
                 s3_bucket=s3_bucket, 
                 local_directory=local_directory, 
                 s3_object_key_prefix=s3_object_key_prefix, 
-                print_output=True
+                print_output=True,
+                sync=sync,
+                delete=delete,
+                manifest_file=manifest_file,
+                sharded=sharded,
+                shard_files=shard_files,
+                journal_file=journal_file,
+                metrics_file=metrics_file,
+                **transfer_options
             )
         except (InvalidConfigError, APIConnectionError):
             sys.exit(1)
+        if result.failures:
+            sys.exit(1)
     
     def _pull_object_from_s3(self) -> None:
         """Handle pulling object from S3."""
         s3_bucket = None
         s3_object_key = None
         local_file = None
+        transfer_options = {}
         
         try:
             opts, _ = getopt.getopt(
                 self.args[3:], 
                 "hb:k:f:", 
-                ["help", "bucket=", "key=", "file=", "extra-args="]
+                ["help", "bucket=", "key=", "file=", "extra-args="] + TRANSFER_LONG_OPTIONS
             )
         except Exception as err:
             logger.error(err)
@@ -119,6 +205,8 @@ class S3Command(BaseCommand):
                 s3_object_key = arg
             elif opt in ("-f", "--file"):
                 local_file = arg
+            elif opt in TRANSFER_OPTIONS:
+                self._set_transfer_option(opt, arg, transfer_options, HELP_TEXT_PULL_FROM_S3_OBJECT)
         
         if not s3_bucket or not s3_object_key:
             self.handle_invalid_command(help_text=HELP_TEXT_PULL_FROM_S3_OBJECT, invalid_opt_arg=True)
@@ -128,7 +216,8 @@ class S3Command(BaseCommand):
                 s3_bucket=s3_bucket, 
                 s3_object_key=s3_object_key, 
                 local_file=local_file, 
-                print_output=True
+                print_output=True,
+                **transfer_options
             )
         except (InvalidConfigError, APIConnectionError):
             sys.exit(1)
@@ -139,12 +228,22 @@ class S3Command(BaseCommand):
         s3_object_key_prefix = ""
         local_directory = None
         s3_extra_args = None
+        sync = False
+        delete = False
+        manifest_file = None
+        shard_size = None
+        shard_staging_directory = None
+        journal_file = None
+        metrics_file = None
+        transfer_options = {}
         
         try:
             opts, _ = getopt.getopt(
                 self.args[3:], 
-                "hb:p:d:e:", 
-                ["help", "bucket=", "key-prefix=", "directory=", "extra-args="]
+                "hb:p:d:e:sxm:", 
+                ["help", "bucket=", "key-prefix=", "directory=", "extra-args=", "sync", "delete", "manifest=",
+                 "shard-size=", "shard-staging-directory=", "journal=",
+                 "metrics-file="] + TRANSFER_LONG_OPTIONS + BULK_TRANSFER_LONG_OPTIONS
             )
         except Exception as err:
             logger.error(err)
@@ -162,20 +261,63 @@ class S3Command(BaseCommand):
                 local_directory = arg
             elif opt in ("-e", "--extra-args"):
                 s3_extra_args = arg
+            elif opt in ("-s", "--sync"):
+                sync = True
+            elif opt in ("-x", "--delete"):
+                delete = True
+            elif opt in ("-m", "--manifest"):
+                manifest_file = arg
+            elif opt == "--shard-size":
+                try:
+                    shard_size = _convert_size_string_to_bytes(arg)
+                except ValueError:
+                    logger.error("Error: Invalid value for shard-size: '%s'.", arg)
+                    self.handle_invalid_command(help_text=HELP_TEXT_PUSH_TO_S3_DIRECTORY, invalid_opt_arg=True)
+            elif opt == "--shard-staging-directory":
+                shard_staging_directory = arg
+            elif opt == "--journal":
+                journal_file = arg
+            elif opt == "--metrics-file":
+                metrics_file = arg
+            elif opt in TRANSFER_OPTIONS or opt in BULK_TRANSFER_OPTIONS:
+                self._set_transfer_option(opt, arg, transfer_options, HELP_TEXT_PUSH_TO_S3_DIRECTORY)
         
         if not s3_bucket or not local_directory:
             self.handle_invalid_command(help_text=HELP_TEXT_PUSH_TO_S3_DIRECTORY, invalid_opt_arg=True)
         
+        # Deleting extraneous objects is only meaningful when syncing
+        if delete and not sync:
+            self.handle_invalid_command(help_text=HELP_TEXT_PUSH_TO_S3_DIRECTORY, invalid_opt_arg=True)
+        
+        # Shards are always pushed in full
+        if shard_size and (sync or journal_file):
+            self.handle_invalid_command(help_text=HELP_TEXT_PUSH_TO_S3_DIRECTORY, invalid_opt_arg=True)
+        
+        # Deleting below a prefix such as "run1" would also reach "run10/..."
+        if sync and delete and s3_object_key_prefix and not s3_object_key_prefix.endswith("/"):
+            logger.error("Error: --delete requires a key prefix that ends with '/'.")
+            self.handle_invalid_command(help_text=HELP_TEXT_PUSH_TO_S3_DIRECTORY, invalid_opt_arg=True)
+        
         try:
-            push_directory_to_s3(
+            result = push_directory_to_s3(
                 s3_bucket=s3_bucket, 
                 local_directory=local_directory, 
                 s3_object_key_prefix=s3_object_key_prefix, 
                 s3_extra_args=s3_extra_args, 
-                print_output=True
+                print_output=True,
+                sync=sync,
+                delete=delete,
+                manifest_file=manifest_file,
+                shard_size=shard_size,
+                shard_staging_directory=shard_staging_directory,
+                journal_file=journal_file,
+                metrics_file=metrics_file,
+                **transfer_options
             )
         except (InvalidConfigError, APIConnectionError):
             sys.exit(1)
+        if result.failures:
+            sys.exit(1)
     
     def _push_file_to_s3(self) -> None:
         """Handle pushing file to S3."""
@@ -183,12 +325,13 @@ class S3Command(BaseCommand):
         s3_object_key = None
         local_file = None
         s3_extra_args = None
+        transfer_options = {}
         
         try:
             opts, _ = getopt.getopt(
                 self.args[3:], 
                 "hb:k:f:e:", 
-                ["help", "bucket=", "key=", "file=", "extra-args="]
+                ["help", "bucket=", "key=", "file=", "extra-args="] + TRANSFER_LONG_OPTIONS
             )
         except Exception as err:
             logger.error(err)
@@ -206,6 +349,8 @@ class S3Command(BaseCommand):
                 local_file = arg
             elif opt in ("-e", "--extra-args"):
                 s3_extra_args = arg
+            elif opt in TRANSFER_OPTIONS:
+                self._set_transfer_option(opt, arg, transfer_options, HELP_TEXT_PUSH_TO_S3_FILE)
         
         if not s3_bucket or not local_file:
             self.handle_invalid_command(help_text=HELP_TEXT_PUSH_TO_S3_FILE, invalid_opt_arg=True)
@@ -216,7 +361,8 @@ class S3Command(BaseCommand):
                 s3_object_key=s3_object_key, 
                 local_file=local_file, 
                 s3_extra_args=s3_extra_args, 
-                print_output=True
+                print_output=True,
+                **transfer_options
             )
         except (InvalidConfigError, APIConnectionError):
             sys.exit(1)
@@ -10,12 +10,14 @@ from netapp_dataops.help_text import (
 from netapp_dataops.traditional import (
     sync_cloud_sync_relationship,
     sync_snap_mirror_relationship,
+    sync_snap_mirror_relationships,
     InvalidConfigError,
     APIConnectionError,
     CloudSyncSyncOperationError,
     InvalidSnapMirrorParameterError,
     SnapMirrorSyncOperationError
 )
+from netapp_dataops.traditional.ontap.snapmirror_operations import SNAPMIRROR_WAIT_TIMEOUT
 
 
 class SyncCommand(BaseCommand):
@@ -75,12 +77,13 @@ class SyncCommand(BaseCommand):
         svm_name = None
         cluster_name = None
         wait_until_complete = False
+        timeout = SNAPMIRROR_WAIT_TIMEOUT
         
         try:
             opts, _ = getopt.getopt(
                 self.args[3:], 
-                "hi:wn:u:v:", 
-                ["help", "cluster-name=", "svm=", "name=", "uuid=", "wait"]
+                "hi:wn:u:v:t:", 
+                ["help", "cluster-name=", "svm=", "name=", "uuid=", "wait", "timeout="]
             )
         except Exception as err:
             logger.error(err)
@@ -100,12 +103,33 @@ class SyncCommand(BaseCommand):
                 uuid = arg
             elif opt in ("-w", "--wait"):
                 wait_until_complete = True
+            elif opt in ("-t", "--timeout"):
+                try:
+                    timeout = int(arg)
+                except ValueError:
+                    self.handle_invalid_command(help_text=HELP_TEXT_SYNC_SNAPMIRROR_RELATIONSHIP, invalid_opt_arg=True)
         
         if not uuid and not volume_name:
             self.handle_invalid_command(help_text=HELP_TEXT_SYNC_SNAPMIRROR_RELATIONSHIP, invalid_opt_arg=True)
         
         if uuid and volume_name:
             self.handle_invalid_command(help_text=HELP_TEXT_SYNC_SNAPMIRROR_RELATIONSHIP, invalid_opt_arg=True)
+
+        # Multiple comma-separated UUIDs are synced together
+        if uuid and "," in uuid:
+            try:
+                results = sync_snap_mirror_relationships(
+                    uuids=[u.strip() for u in uuid.split(",") if u.strip()],
+                    cluster_name=cluster_name,
+                    wait_until_complete=wait_until_complete,
+                    print_output=True,
+                    timeout=timeout
+                )
+            except (InvalidConfigError, APIConnectionError):
+                sys.exit(1)
+            if any(result["Status"] == "failed" for result in results):
+                sys.exit(1)
+            return
         
         try:
             sync_snap_mirror_relationship(
@@ -114,7 +138,8 @@ class SyncCommand(BaseCommand):
                 volume_name=volume_name, 
                 cluster_name=cluster_name, 
                 wait_until_complete=wait_until_complete, 
-                print_output=True
+                print_output=True,
+                timeout=timeout
             )
         except (InvalidConfigError, APIConnectionError, InvalidSnapMirrorParameterError, SnapMirrorSyncOperationError):
             sys.exit(1)
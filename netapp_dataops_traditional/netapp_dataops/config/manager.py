@@ -22,6 +22,7 @@ from .exceptions import (
     ConfigCreationError
 )
 from netapp_dataops.constants import KEYRING_SERVICE_NAME
+from netapp_dataops.traditional.core.config import invalidate_config_cache
 
 logger = setup_logger(__name__)
 from .dataset_manager import DatasetManagerConfigurator
@@ -178,6 +179,8 @@ class ConfigManager:
             keyring.set_password(KEYRING_SERVICE_NAME, "username", username)
         if passwordString is not None:
             keyring.set_password(KEYRING_SERVICE_NAME, "password", passwordString)
+        # Drop any credentials cached earlier in this process
+        invalidate_config_cache()
 
         ssl_cert_path = self._prompt_ssl_cert_path()
         
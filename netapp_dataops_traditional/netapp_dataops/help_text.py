@@ -438,6 +438,7 @@ List all SnapMirror relationships.
 Optional Options/Arguments:
 \t-u, --cluster-name=\tNon default hosting cluster
 \t-s, --svm=\t\tNon default svm.
+\t-a, --include-source\tAlso list relationships for which the source volume resides on the cluster.
 \t-h, --help\t\tPrint help text.
 '''
 
@@ -449,7 +450,7 @@ Trigger a sync operation for an existing SnapMirror relationship.
 Tip: Run `netapp_dataops_cli.py list snapmirror-relationships` to obtain relationship UUID.
 
 Required Options/Arguments:
-\t-i, --uuid=\tUUID of the relationship for which the sync operation is to be triggered.
+\t-i, --uuid=\tUUID of the relationship for which the sync operation is to be triggered. Multiple comma-separated UUIDs are synced together.
 or
 \t-n, --name=\tName of target volume to be sync .
 
@@ -457,12 +458,15 @@ Optional Options/Arguments:
 \t-u, --cluster-name=\tnon default hosting cluster
 \t-v, --svm \t\tnon default target SVM name
 \t-h, --help\t\tPrint help text.
-\t-w, --wait\t\tWait for sync operation to complete before exiting.
+\t-w, --wait\t\tWait for sync operation(s) to complete before exiting.
+\t-t, --timeout=\t\tSeconds to wait for sync operation(s) to complete before giving up (default: 86400).
 
 Examples:
 \tnetapp_dataops_cli.py sync snapmirror-relationship --uuid=132aab2c-4557-11eb-b542-005056932373
 \tnetapp_dataops_cli.py sync snapmirror-relationship -i 132aab2c-4557-11eb-b542-005056932373 -w
+\tnetapp_dataops_cli.py sync snapmirror-relationship -i 132aab2c-4557-11eb-b542-005056932373 -w -t 3600
 \tnetapp_dataops_cli.py sync snapmirror-relationship -u cluster1 -v svm1 -n vol1 -w
+\tnetapp_dataops_cli.py sync snapmirror-relationship --uuid=132aab2c-4557-11eb-b542-005056932373,5f2b6c1e-4557-11eb-b542-005056932373 -w
 '''
 
 # Cloud Sync management help text
@@ -509,11 +513,31 @@ Required Options/Arguments:
 
 Optional Options/Arguments:
 \t-h, --help\t\tPrint help text.
+\t-m, --manifest=\t\tSync manifest file to use (default: .netapp_dataops_s3_sync.json in the local directory).
 \t-p, --key-prefix=\tObject key prefix (pull will be limited to objects with key that starts with this prefix).
+\t-s, --sync\t\tOnly pull objects that are missing locally or have changed since the last sync.
+\t-x, --delete\t\tWhen syncing, delete local files that do not exist in the bucket (limited to the key prefix).
+\t    --sharded\t\tExtract the tar shards written by 'push-to-s3 directory --shard-size' instead of pulling individual objects.
+\t    --shard-files=\tComma-separated list of files to extract from the shards, fetched using the shard index (implies --sharded).
+\t    --multipart-threshold=\tSize at or above which objects are transferred in parts (e.g. '64MB'; default: 8MB).
+\t    --part-size=\t\tSize of each part (e.g. '128MB'; default: tuned to the object size).
+\t    --max-concurrency=\tMaximum number of parts of one object transferred concurrently (default: tuned to the object size).
+\t    --max-connections=\tMaximum number of connections to S3 (default: 10 per download thread).
+\t    --max-listers=\tMaximum number of concurrent list requests; prefixes are split at '/' into partitions that are listed in parallel (default: 8).
+\t    --journal=\t\tTransfer journal file; if the pull is interrupted, rerunning it with the same journal skips the objects already pulled.
+\t    --max-retries=\tNumber of times a failed object is retried, with exponential backoff (default: 3).
+\t    --max-scanners=\tMaximum number of local directories read concurrently when deleting extraneous files in sync mode (default: 8).
+\t    --metrics-file=\tWrite the transfer statistics (throughput, time per object, counts and settings) to this file as JSON.
+\t    --max-bandwidth=\tMaximum transfer rate per second, shared by all download threads (e.g. '100MB').
+\t    --max-request-rate=\tMaximum number of S3 requests per second, shared by all download threads.
 
 Examples:
 \tnetapp_dataops_cli.py pull-from-s3 bucket --bucket=project1 --directory=/mnt/project1
 \tnetapp_dataops_cli.py pull-from-s3 bucket -b project1 -p project1/ -d ./project1/
+\tnetapp_dataops_cli.py pull-from-s3 bucket -b project1 -d /mnt/project1 --sync --delete
+\tnetapp_dataops_cli.py pull-from-s3 bucket -b project1 -d /mnt/project1 --journal=/tmp/project1-pull.journal
+\tnetapp_dataops_cli.py pull-from-s3 bucket -b project1 -p images/ -d /mnt/project1/images --sharded
+\tnetapp_dataops_cli.py pull-from-s3 bucket -b project1 -p images/ -d ./images --shard-files=train/img_1.jpg,train/img_2.jpg
 '''
 
 HELP_TEXT_PULL_FROM_S3_OBJECT = '''
@@ -530,10 +554,15 @@ Required Options/Arguments:
 Optional Options/Arguments:
 \t-f, --file=\t\tLocal filepath (including filename) to save object to (if not specified, value of -k/--key argument will be used)
 \t-h, --help\t\tPrint help text.
+\t    --multipart-threshold=\tSize at or above which objects are transferred in parts (e.g. '64MB'; default: 8MB).
+\t    --part-size=\t\tSize of each part (e.g. '128MB'; default: tuned to the object size).
+\t    --max-concurrency=\tMaximum number of parts of one object transferred concurrently (default: tuned to the object size).
+\t    --max-connections=\tMaximum number of connections to S3 (default: 64).
 
 Examples:
 \tnetapp_dataops_cli.py pull-from-s3 object --bucket=project1 --key=data.csv --file=./project1/data.csv
 \tnetapp_dataops_cli.py pull-from-s3 object -b project1 -k data.csv
+\tnetapp_dataops_cli.py pull-from-s3 object -b project1 -k checkpoint.pt --part-size=256MB --max-connections=128
 '''
 
 HELP_TEXT_PUSH_TO_S3_DIRECTORY = '''
@@ -552,11 +581,31 @@ Required Options/Arguments:
 Optional Options/Arguments:
 \t-e, --extra-args=\tExtra args to apply to newly-pushed S3 objects (For details on this field, refer to https://boto3.amazonaws.com/v1/documentation/api/latest/guide/s3-uploading-files.html#the-extraargs-parameter).
 \t-h, --help\t\tPrint help text.
+\t-m, --manifest=\t\tSync manifest file to use (default: .netapp_dataops_s3_sync.json in the local directory).
 \t-p, --key-prefix=\tPrefix to add to key for newly-pushed S3 objects (Note: by default, key will be local filepath relative to directory being pushed).
+\t-s, --sync\t\tOnly push files that are missing in S3 or have changed since the last sync.
+\t-x, --delete\t\tWhen syncing, delete S3 objects under the key prefix that do not exist locally (skipped if a local directory cannot be read). A key prefix must end with '/'.
+\t    --shard-size=\tPack files into tar shards of about this size (e.g. '1GB') and push the shards, plus an index of the files in each shard, instead of individual files.
+\t    --shard-staging-directory=\tLocal directory in which shards are staged before upload (default: system temp directory).
+\t    --multipart-threshold=\tSize at or above which objects are transferred in parts (e.g. '64MB'; default: 8MB).
+\t    --part-size=\t\tSize of each part (e.g. '128MB'; default: tuned to the object size).
+\t    --max-concurrency=\tMaximum number of parts of one object transferred concurrently (default: tuned to the object size).
+\t    --max-connections=\tMaximum number of connections to S3 (default: 10 per upload thread).
+\t    --max-listers=\tMaximum number of concurrent list requests when listing the key prefix in sync mode (default: 8).
+\t    --journal=\t\tTransfer journal file; if the push is interrupted, rerunning it with the same journal skips the files already pushed and resumes multipart uploads.
+\t    --max-retries=\tNumber of times a failed file is retried, with exponential backoff (default: 3).
+\t    --max-scanners=\tMaximum number of local directories read concurrently; files are queued for upload as soon as they are found (default: 8).
+\t    --metrics-file=\tWrite the transfer statistics (throughput, time per object, counts and settings) to this file as JSON.
+\t    --max-bandwidth=\tMaximum transfer rate per second, shared by all upload threads (e.g. '100MB').
+\t    --max-request-rate=\tMaximum number of S3 requests per second, shared by all upload threads.
 
 Examples:
 \tnetapp_dataops_cli.py push-to-s3 directory --bucket=project1 --directory=/mnt/project1
 \tnetapp_dataops_cli.py push-to-s3 directory -b project1 -d /mnt/project1 -p project1/ -e '{"Metadata": {"mykey": "myvalue"}}'
+\tnetapp_dataops_cli.py push-to-s3 directory -b project1 -d /mnt/project1 -p project1/ --sync --delete
+\tnetapp_dataops_cli.py push-to-s3 directory -b project1 -d /mnt/project1 -p project1/ --journal=/tmp/project1-push.journal
+\tnetapp_dataops_cli.py push-to-s3 directory -b project1 -d /mnt/project1 -p project1/ --max-bandwidth=200MB --max-request-rate=500
+\tnetapp_dataops_cli.py push-to-s3 directory -b project1 -d /mnt/project1/images -p images/ --shard-size=1GB
 '''
 
 HELP_TEXT_PUSH_TO_S3_FILE = '''
@@ -574,10 +623,15 @@ Optional Options/Arguments:
 \t-e, --extra-args=\tExtra args to apply to newly-pushed S3 object (For details on this field, refer to https://boto3.amazonaws.com/v1/documentation/api/latest/guide/s3-uploading-files.html#the-extraargs-parameter).
 \t-h, --help\t\tPrint help text.
 \t-k, --key=\t\tKey to assign to newly-pushed S3 object (if not specified, key will be set to value of -f/--file argument).
+\t    --multipart-threshold=\tSize at or above which objects are transferred in parts (e.g. '64MB'; default: 8MB).
+\t    --part-size=\t\tSize of each part (e.g. '128MB'; default: tuned to the object size).
+\t    --max-concurrency=\tMaximum number of parts of one object transferred concurrently (default: tuned to the object size).
+\t    --max-connections=\tMaximum number of connections to S3 (default: 64).
 
 Examples:
 \tnetapp_dataops_cli.py push-to-s3 file --bucket=project1 --file=data.csv
 \tnetapp_dataops_cli.py push-to-s3 file -b project1 -k data.csv -f /mnt/project1/data.csv -e '{"Metadata": {"mykey": "myvalue"}}'
+\tnetapp_dataops_cli.py push-to-s3 file -b project1 -f /mnt/project1/checkpoint.pt --part-size=256MB --max-connections=128
 '''
 
 # FlexCache operations help text
@@ -27,6 +27,7 @@ from netapp_dataops.traditional.ontap import (
     get_qtree,
     get_qtree_metrics
 )
+from netapp_dataops.traditional.core.connection import close_connections
 
 #Sets up logging
 from netapp_dataops.logging_utils import setup_logger
@@ -961,3 +962,7 @@ if __name__ == "__main__":
         # Logs and prints any startup errors, then exits with an error code
         logging.error(f"Server startup failed: {e}")
         sys.exit(1)
+
+    finally:
+        # Releases pooled ONTAP connections on shutdown
+        close_connections()
@@ -28,14 +28,18 @@ from .datasets.exceptions import (
     DatasetVolumeError
 )
 
+from .core.connection import close_connections, ontap_connection
+
 # Import volume operations from ontap package
 from .ontap.volume_operations import (
     clone_volume,
+    clone_volumes,
     create_volume,
     delete_volume,
     mount_volume,
     unmount_volume,
-    list_volumes
+    list_volumes,
+    list_volumes_multi
 )
 
 from .ontap.snapshot_operations import (
@@ -48,7 +52,8 @@ from .ontap.snapshot_operations import (
 from .ontap.snapmirror_operations import (
     list_snap_mirror_relationships,
     create_snap_mirror_relationship,
-    sync_snap_mirror_relationship
+    sync_snap_mirror_relationship,
+    sync_snap_mirror_relationships
 )
 
 from .data_movement.cloud_sync_operations import (
@@ -66,7 +71,9 @@ from .data_movement.s3_operations import (
     pull_bucket_from_s3,
     pull_object_from_s3,
     push_directory_to_s3,
-    push_file_to_s3
+    push_file_to_s3,
+    S3TransferResult,
+    S3TransferProgress
 )
 
 from .ontap.flexcache_operations import (
@@ -77,6 +84,8 @@ from .ontap.flexcache_operations import (
     update_flexcache
 )
 
+from .ontap.job_tracker import wait_for_jobs
+
 from .ontap.qtree_operations import (
     create_qtree,
     list_qtrees,
@@ -96,11 +105,13 @@ __all__ = [
     'SnapMirrorSyncOperationError',
     'CloudSyncSyncOperationError',
     'clone_volume',
+    'clone_volumes',
     'create_volume',
     'delete_volume',
     'mount_volume',
     'unmount_volume',
     'list_volumes',
+    'list_volumes_multi',
     'create_snapshot',
     'delete_snapshot',
     'restore_snapshot',
@@ -108,12 +119,15 @@ __all__ = [
     'list_snap_mirror_relationships',
     'create_snap_mirror_relationship',
     'sync_snap_mirror_relationship',
+    'sync_snap_mirror_relationships',
     'list_cloud_sync_relationships',
     'sync_cloud_sync_relationship',
     'pull_bucket_from_s3',
     'pull_object_from_s3',
     'push_directory_to_s3',
     'push_file_to_s3',
+    'S3TransferResult',
+    'S3TransferProgress',
     'prepopulate_flex_cache',
     'create_cifs_share',
     'list_cifs_shares',
@@ -126,6 +140,9 @@ __all__ = [
     'get_flexcache_origin',
     'create_flexcache',
     'update_flexcache',
+    'close_connections',
+    'ontap_connection',
+    'wait_for_jobs',
 ]
 
 _lazy_modules = {}
@@ -1,18 +1,23 @@
 """Core utilities for NetApp DataOps traditional operations."""
 
-from .connection import _instantiate_connection, _instantiate_s3_session
-from .config import _retrieve_config, _retrieve_cloud_central_refresh_token, _retrieve_s3_access_details, _print_invalid_config_error
-from .utilities import _convert_bytes_to_pretty_size, _convert_size_string_to_bytes, _sizes_are_equivalent, deprecated
+from .connection import _instantiate_connection, _instantiate_s3_session, close_connections, ontap_connection
+from .config import _retrieve_config, _retrieve_cloud_central_refresh_token, _retrieve_s3_access_details, _print_invalid_config_error, invalidate_config_cache
+from .utilities import _convert_bytes_to_pretty_size, _convert_size_string_to_bytes, _sizes_are_equivalent, _crawl_in_parallel, _scan_directory_tree, deprecated
 
 __all__ = [
     '_instantiate_connection',
     '_instantiate_s3_session',
+    'close_connections',
+    'ontap_connection',
     '_retrieve_config',
     '_retrieve_cloud_central_refresh_token',
     '_retrieve_s3_access_details',
     '_print_invalid_config_error',
+    'invalidate_config_cache',
     '_convert_bytes_to_pretty_size',
     '_convert_size_string_to_bytes',
     '_sizes_are_equivalent',
+    '_crawl_in_parallel',
+    '_scan_directory_tree',
     'deprecated',
 ]
@@ -1,32 +1,94 @@
 """Configuration management utilities for NetApp DataOps operations."""
 
 import base64
+import copy
 import json
 import os
+import threading
 import keyring
-from typing import Dict, Tuple
+from typing import Dict, Optional, Tuple
 
 from netapp_dataops.logging_utils import setup_logger
 from ..exceptions import InvalidConfigError
+from .connection import _get_context_cluster_name
 from netapp_dataops.constants import KEYRING_SERVICE_NAME
 
 logger = setup_logger(__name__)
 
+# Parsed config files keyed by absolute path. Each entry records the file's
+# (mtime_ns, size) signature so that edits on disk invalidate the entry.
+_config_file_cache: Dict[str, Tuple[Tuple[int, int], Dict]] = {}
+
+# Credentials retrieved from the os-default credential manager. Lookups can
+# involve a D-Bus/SecretService round-trip, so they are kept for the process
+# lifetime unless explicitly invalidated.
+_credential_cache: Dict[str, str] = {}
+
+_config_cache_lock = threading.Lock()
+
 
 def _print_invalid_config_error() -> None:
     logger.error("Error: Missing or invalid config file. Run `netapp_dataops_cli.py config` to create config file.")
 
 
+def invalidate_config_cache() -> None:
+    """Discard cached config file contents and credentials.
+
+    The next call to ``_retrieve_config`` re-reads the config file and
+    re-queries the credential manager. Call this after updating credentials
+    in the keyring from within a running process.
+    """
+    with _config_cache_lock:
+        _config_file_cache.clear()
+        _credential_cache.clear()
+
+
+def _load_config_file(configFilePath: str) -> Dict:
+    fileStat = os.stat(configFilePath)
+    signature = (fileStat.st_mtime_ns, fileStat.st_size)
+
+    with _config_cache_lock:
+        cached = _config_file_cache.get(configFilePath)
+        if cached and cached[0] == signature:
+            return copy.deepcopy(cached[1])
+
+    with open(configFilePath, 'r') as configFile:
+        config = json.load(configFile)
+
+    with _config_cache_lock:
+        _config_file_cache[configFilePath] = (signature, config)
+    return copy.deepcopy(config)
+
+
+def _get_credential(name: str) -> Optional[str]:
+    with _config_cache_lock:
+        if name in _credential_cache:
+            return _credential_cache[name]
+
+    value = keyring.get_password(KEYRING_SERVICE_NAME, name)
+
+    # Only cache successful lookups so that credentials added later are picked up
+    if value:
+        with _config_cache_lock:
+            _credential_cache[name] = value
+    return value
+
+
 def _retrieve_config(configDirPath: str = "~/.netapp_dataops", configFilename: str = "config.json",
                    print_output: bool = False) -> Dict:
     configDirPath = os.path.expanduser(configDirPath)
-    configFilePath = os.path.join(configDirPath, configFilename)
+    configFilePath = os.path.abspath(os.path.join(configDirPath, configFilename))
     try:
-        with open(configFilePath, 'r') as configFile:
-            config = json.load(configFile)
+        # Config file contents are cached and re-read only when the file changes.
+        # Callers receive their own copy and are free to modify it.
+        config = _load_config_file(configFilePath)
+        # Apply the cluster selected for this thread via ontap_connection(), if any
+        contextClusterName = _get_context_cluster_name()
+        if contextClusterName:
+            config["hostname"] = contextClusterName
         # Retrieve username and password from os-default credential manager
-        username = keyring.get_password(KEYRING_SERVICE_NAME, "username")
-        password = keyring.get_password(KEYRING_SERVICE_NAME, "password")
+        username = _get_credential("username")
+        password = _get_credential("password")
 
         if username:
             config["username"] = username
@@ -1,19 +1,41 @@
 """Connection management utilities for NetApp DataOps operations."""
 
 import base64
+import functools
 import logging
 import ssl
-from typing import Dict, Any
+import threading
+from contextlib import contextmanager
+from typing import Callable, Dict, Any, Iterator, Optional, Tuple
 
 import boto3
 from botocore.config import Config as BotoConfig
-from netapp_ontap import config as netappConfig
 from netapp_ontap.host_connection import HostConnection as NetAppHostConnection
+from netapp_ontap.host_connection import LOCAL_DATA as netappHostContext
 
 from ..exceptions import InvalidConfigError, ConnectionTypeError
 
 logger = logging.getLogger(__name__)
 
+# Default number of keep-alive connections held open per ONTAP cluster.
+# Can be overridden per call or via the "connectionPoolSize" config key.
+DEFAULT_CONNECTION_POOL_SIZE = 10
+
+# Number of records requested per page when listing ONTAP collections.
+COLLECTION_PAGE_SIZE = 1000
+
+# Process-wide registry of warm ONTAP host connections, keyed by
+# (host, port, username, sslCertPath, pool size). Each entry holds the password
+# the connection was built with so that credential changes force a rebuild.
+# A rebuilt connection replaces the old one in the registry without closing it,
+# since other threads may still be in the middle of an operation that uses it;
+# its keep-alive connections are released once nothing references it anymore.
+_connection_cache: Dict[Tuple[str, Optional[int], str, str, int], Tuple[str, NetAppHostConnection]] = {}
+_connection_cache_lock = threading.Lock()
+
+# Per-thread connection state (cluster selected via ontap_connection()).
+_thread_state = threading.local()
+
 
 def _get_ssl_cert_path(config: Dict[str, Any]) -> str:
     """Extract the SSL certificate path from config, handling legacy keys.
@@ -33,7 +55,7 @@ def _get_ssl_cert_path(config: Dict[str, Any]) -> str:
     return ""
 
 
-def _apply_custom_ssl_context(conn, ca_cert_path: str) -> None:
+def _apply_custom_ssl_context(conn, ca_cert_path: str, pool_size: Optional[int] = None) -> None:
     """Patch the connection's session to pin a CA cert while skipping hostname checks.
 
     ONTAP clusters commonly use self-signed certificates without Subject
@@ -50,18 +72,140 @@ def _apply_custom_ssl_context(conn, ca_cert_path: str) -> None:
     ctx.verify_mode = ssl.CERT_REQUIRED
     ctx.load_verify_locations(ca_cert_path)
 
+    _init_pool_manager(conn, pool_size=pool_size, ssl_context=ctx, assert_hostname=False)
+
+
+def _init_pool_manager(conn, pool_size: Optional[int] = None, **pool_kwargs) -> None:
+    """(Re)initialize the urllib3 pool manager behind the connection's session.
+
+    ``pool_size`` sets the maximum number of keep-alive connections kept open
+    to the cluster; when omitted, the adapter's current size is retained.
+    """
     session = conn.session
     adapter = session.get_adapter(conn.origin)
     adapter.init_poolmanager(
         adapter._pool_connections,
-        adapter._pool_maxsize,
+        pool_size or adapter._pool_maxsize,
         adapter._pool_block,
-        ssl_context=ctx,
-        assert_hostname=False,
+        **pool_kwargs,
     )
 
 
-def _instantiate_connection(config: Dict[str, Any], connectionType: str = "ONTAP", print_output: bool = False) -> None:
+def _get_pooled_connection(host: str, port: Optional[int], username: str, password: str,
+                           ssl_cert_path: str, pool_size: int) -> NetAppHostConnection:
+    """Return a warm host connection from the registry, creating it if needed.
+
+    Connections are reused across calls so that the underlying requests
+    session (and its keep-alive TCP/TLS connections) survives between API
+    operations. Calls asking for a different pool size get a connection of
+    their own, sized as requested.
+    """
+    key = (host, port, username, ssl_cert_path, pool_size)
+    with _connection_cache_lock:
+        cached = _connection_cache.get(key)
+        if cached and cached[0] == password:
+            return cached[1]
+
+        connection_kwargs = dict(
+            host=host,
+            username=username,
+            password=password,
+            verify=True,
+        )
+        if port is not None:
+            connection_kwargs["port"] = port
+
+        # Security: verify is always True to enforce SSL certificate validation.
+        # When ssl_cert_path is provided, _apply_custom_ssl_context pins the
+        # CA cert and relaxes hostname/SAN checks (common for ONTAP self-signed
+        # certs) while still verifying the certificate chain.
+        conn = NetAppHostConnection(**connection_kwargs)
+        if ssl_cert_path:
+            _apply_custom_ssl_context(conn, ssl_cert_path, pool_size=pool_size)
+        else:
+            _init_pool_manager(conn, pool_size=pool_size)
+
+        _connection_cache[key] = (password, conn)
+        return conn
+
+
+def _close_host_connection(conn: NetAppHostConnection) -> None:
+    """Close the keep-alive connections held by a host connection's session.
+
+    The session itself is kept, along with the pool configuration applied by
+    _init_pool_manager(), so a thread still using the connection transparently
+    reconnects on its next request. The session is read from the private
+    attribute behind HostConnection.session, since the property would create
+    one when none exists yet; connections without the attribute are skipped.
+    """
+    session = getattr(conn, "_request_session", None)
+    if session is not None:
+        session.close()
+
+
+def close_connections() -> None:
+    """Close all pooled ONTAP connections held by this process.
+
+    Intended to be called on shutdown by long-running processes (automation
+    daemons, MCP servers). Subsequent API calls transparently open new
+    connections. Operations still running in other threads are not
+    interrupted; their next request reconnects.
+    """
+    with _connection_cache_lock:
+        for _, conn in _connection_cache.values():
+            _close_host_connection(conn)
+        _connection_cache.clear()
+
+
+@contextmanager
+def ontap_connection(cluster_name: str) -> Iterator[None]:
+    """Direct all ONTAP operations made by the current thread to a specific cluster.
+
+    Within the ``with`` block, every ONTAP function called from this thread
+    targets ``cluster_name`` (unless a ``cluster_name`` argument is passed to
+    the function explicitly). The setting is thread-local, so separate threads
+    can safely work against different clusters at the same time.
+
+    Example:
+        with ontap_connection("cluster-b.example.com"):
+            volumes = list_volumes()
+    """
+    previous_cluster_name = getattr(_thread_state, "cluster_name", None)
+    previous_host_context = NetAppHostConnection.get_host_context()
+    _thread_state.cluster_name = cluster_name
+    try:
+        yield
+    finally:
+        _thread_state.cluster_name = previous_cluster_name
+        netappHostContext.host_context = previous_host_context
+
+
+def _scoped_host_context(func: Callable) -> Callable:
+    """Decorator for ONTAP operations that call _instantiate_connection().
+
+    _instantiate_connection() binds the connection to the calling thread so that
+    the ONTAP library uses it for the rest of the operation. When the operation
+    returns, the thread's previous host context (for example from the caller's
+    own ``with HostConnection(...)`` block) is restored, so the binding never
+    outlives the operation.
+    """
+    @functools.wraps(func)
+    def scoped(*args: Any, **kwargs: Any) -> Any:
+        previous_host_context = NetAppHostConnection.get_host_context()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            netappHostContext.host_context = previous_host_context
+    return scoped
+
+
+def _get_context_cluster_name() -> Optional[str]:
+    """Return the cluster selected for the current thread via ontap_connection(), if any."""
+    return getattr(_thread_state, "cluster_name", None)
+
+
+def _instantiate_connection(config: Dict[str, Any], connectionType: str = "ONTAP", print_output: bool = False,
+                            pool_size: Optional[int] = None) -> NetAppHostConnection:
     if connectionType == "ONTAP":
         try:
             ontapClusterMgmtHostname = config["hostname"]
@@ -93,31 +237,40 @@ def _instantiate_connection(config: Dict[str, Any], connectionType: str = "ONTAP
                         "Port must be between 1 and 65535."
                     )
 
-        connection_kwargs = dict(
+        if not pool_size:
+            pool_size = config.get("connectionPoolSize", DEFAULT_CONNECTION_POOL_SIZE)
+        try:
+            pool_size = int(pool_size)
+        except (TypeError, ValueError):
+            raise InvalidConfigError(f"Invalid connection pool size '{pool_size}'. Value must be an integer.")
+
+        connection = _get_pooled_connection(
             host=ontapClusterMgmtHostname,
+            port=custom_port,
             username=ontapClusterAdminUsername,
             password=ontapClusterAdminPassword,
-            verify=True,
+            ssl_cert_path=ssl_cert_path,
+            pool_size=pool_size,
         )
-        if custom_port is not None:
-            connection_kwargs["port"] = custom_port
-
-        # Security: verify is always True to enforce SSL certificate validation.
-        # When ssl_cert_path is provided, _apply_custom_ssl_context pins the
-        # CA cert and relaxes hostname/SAN checks (common for ONTAP self-signed
-        # certs) while still verifying the certificate chain.
-        netappConfig.CONNECTION = NetAppHostConnection(**connection_kwargs)
 
-        if ssl_cert_path:
-            _apply_custom_ssl_context(netappConfig.CONNECTION, ssl_cert_path)
+        # Bind the connection to the calling thread for the duration of the
+        # operation (see _scoped_host_context). The library-wide default connection
+        # is left alone, so concurrent calls against different clusters do not
+        # interfere. Work handed to other threads must pass the connection explicitly.
+        netappHostContext.host_context = connection
+        return connection
 
     else:
         raise ConnectionTypeError()
 
 
-def _instantiate_s3_session(s3Endpoint: str, s3AccessKeyId: str, s3SecretAccessKey: str, s3VerifySSLCert: bool, s3CACertBundle: str, print_output: bool = False) -> Any:
+def _instantiate_s3_session(s3Endpoint: str, s3AccessKeyId: str, s3SecretAccessKey: str, s3VerifySSLCert: bool, s3CACertBundle: str, print_output: bool = False,
+                            max_pool_connections: Optional[int] = None) -> Any:
     session = boto3.session.Session(aws_access_key_id=s3AccessKeyId, aws_secret_access_key=s3SecretAccessKey)
-    config = BotoConfig(signature_version='s3v4')
+    if max_pool_connections:
+        config = BotoConfig(signature_version='s3v4', max_pool_connections=max_pool_connections)
+    else:
+        config = BotoConfig(signature_version='s3v4')
 
     if s3VerifySSLCert:
         if s3CACertBundle:
@@ -128,3 +281,33 @@ def _instantiate_s3_session(s3Endpoint: str, s3AccessKeyId: str, s3SecretAccessK
         s3 = session.resource(service_name='s3', endpoint_url=s3Endpoint, verify=False, config=config)
 
     return s3
+
+
+class _S3SessionPool:
+    """Hands out one S3 resource per thread for the duration of a bulk transfer.
+
+    boto3 sessions and resources are not thread safe, so each worker thread gets
+    its own, created on first use and reused for every object that thread
+    transfers. This avoids building a new session, credential chain and HTTP
+    connection pool per object. If given, on_create is called with each new
+    resource, e.g. to register event handlers on its client.
+    """
+
+    def __init__(self, s3Endpoint: str, s3AccessKeyId: str, s3SecretAccessKey: str, s3VerifySSLCert: bool, s3CACertBundle: str,
+                 max_pool_connections: Optional[int] = None, print_output: bool = False,
+                 on_create: Optional[Callable[[Any], Any]] = None):
+        self._sessionArgs = dict(s3Endpoint=s3Endpoint, s3AccessKeyId=s3AccessKeyId, s3SecretAccessKey=s3SecretAccessKey,
+                                 s3VerifySSLCert=s3VerifySSLCert, s3CACertBundle=s3CACertBundle, print_output=print_output,
+                                 max_pool_connections=max_pool_connections)
+        self._onCreate = on_create
+        self._local = threading.local()
+
+    def get(self) -> Any:
+        """Return the calling thread's S3 resource, creating it if needed."""
+        s3 = getattr(self._local, "s3", None)
+        if s3 is None:
+            s3 = _instantiate_s3_session(**self._sessionArgs)
+            if self._onCreate:
+                self._onCreate(s3)
+            self._local.s3 = s3
+        return s3
@@ -1,8 +1,11 @@
 """Utility functions for NetApp DataOps operations."""
 
 import functools
+import os
+import queue
+import threading
 import warnings
-from typing import Callable, Any
+from typing import Callable, Any, Iterator, List, Optional, Tuple
 import re
 
 
@@ -101,3 +104,129 @@ def _sizes_are_equivalent(size1: str, size2: str) -> bool:
     except ValueError:
         # If either size can't be parsed, fall back to string comparison
         return size1 == size2
+
+
+_CRAWL_DONE = object()
+
+
+def _crawl_in_parallel(root: Any, crawl: Callable[[Any, Callable[[Any], None]], Iterator[List[Any]]],
+                       maxWorkers: int) -> Iterator[Any]:
+    """Crawl a tree of work items on maxWorkers threads, yielding results as they are produced.
+
+    crawl(item, addItem) is called once for every work item, starting with
+    root, on whichever thread is free. It passes child items to addItem and
+    yields its results in batches. Results are yielded in no particular order.
+    At most maxWorkers * 2 batches are buffered, so crawlers pause while the
+    consumer falls behind. Errors raised by crawl are re-raised to the
+    consumer, and crawlers stop once the consumer stops iterating.
+    """
+    items = queue.Queue()  # type: queue.Queue
+    batches = queue.Queue(maxsize=maxWorkers * 2)  # type: queue.Queue
+    stopped = threading.Event()
+    lock = threading.Lock()
+    outstanding = [1]
+
+    def _put_batch(batch: Any) -> bool:
+        # Give up once the consumer has stopped, instead of blocking on a full queue forever
+        while not stopped.is_set():
+            try:
+                batches.put(batch, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _add_item(item: Any) -> None:
+        with lock:
+            outstanding[0] += 1
+        items.put(item)
+
+    def _crawler():
+        while True:
+            item = items.get()
+            if item is None:
+                return
+            try:
+                for batch in crawl(item, _add_item):
+                    if batch and not _put_batch(batch):
+                        return
+            except Exception as err:
+                _put_batch(err)
+            with lock:
+                outstanding[0] -= 1
+                finished = outstanding[0] == 0
+            if finished:
+                _put_batch(_CRAWL_DONE)
+
+    items.put(root)
+    crawlers = [threading.Thread(target=_crawler, daemon=True) for _ in range(maxWorkers)]
+    for crawler in crawlers:
+        crawler.start()
+    try:
+        while True:
+            batch = batches.get()
+            if batch is _CRAWL_DONE:
+                return
+            if isinstance(batch, Exception):
+                raise batch
+            yield from batch
+    finally:
+        stopped.set()
+        for _ in crawlers:
+            items.put(None)
+
+
+# Number of files handed over by a directory reader of _scan_directory_tree() at a time
+SCAN_BATCH_SIZE = 1000
+
+
+def _scan_directory_tree(root: str, maxWorkers: int, skipHidden: bool = False,
+                         unreadableDirectories: Optional[List[str]] = None, batchSize: int = SCAN_BATCH_SIZE
+                         ) -> Iterator[Tuple[str, str, Optional[os.stat_result]]]:
+    """Find all files in a directory tree, reading subdirectories concurrently on maxWorkers threads.
+
+    Yields (path, path relative to root, stat result) for each file, in no
+    particular order, as soon as its directory has been read. Whether an entry
+    is a directory is known from the directory listing itself on most
+    platforms; the stat result still costs one stat call per file, except on
+    Windows where the listing includes it. It is None if the file could not be
+    stat'ed (for example a broken symbolic link); callers decide whether that
+    is an error. Hidden files and directories are skipped if skipHidden is
+    set, and symbolic links to directories are not followed. Directories that
+    cannot be read are skipped, as with os.walk, and appended to
+    unreadableDirectories if given (including root itself), so that callers
+    can tell an incomplete scan from a complete one.
+    """
+    def _scan(directory: Tuple[str, str], addDirectory: Callable[[Any], None]
+              ) -> Iterator[List[Tuple[str, str, Optional[os.stat_result]]]]:
+        path, relativePath = directory
+        files = []
+        try:
+            entries = os.scandir(path)
+        except OSError:
+            if unreadableDirectories is not None:
+                unreadableDirectories.append(path)
+            return
+        with entries:
+            for entry in entries:
+                if skipHidden and entry.name[0] == '.':
+                    continue
+                try:
+                    isDir = entry.is_dir()
+                except OSError:
+                    isDir = False
+                if isDir:
+                    if not entry.is_symlink():
+                        addDirectory((entry.path, relativePath + entry.name + os.sep))
+                    continue
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    stat = None
+                files.append((entry.path, relativePath + entry.name, stat))
+                if len(files) >= batchSize:
+                    yield files
+                    files = []
+        yield files
+
+    return _crawl_in_parallel((root, ""), _scan, maxWorkers=maxWorkers)
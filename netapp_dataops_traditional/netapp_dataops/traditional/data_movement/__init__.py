@@ -4,7 +4,9 @@ from .s3_operations import (
     pull_bucket_from_s3,
     pull_object_from_s3,
     push_directory_to_s3,
-    push_file_to_s3
+    push_file_to_s3,
+    S3TransferResult,
+    S3TransferProgress
 )
 
 from .cloud_sync_operations import (
@@ -18,6 +20,8 @@ __all__ = [
     'pull_object_from_s3',
     'push_directory_to_s3',
     'push_file_to_s3',
+    'S3TransferResult',
+    'S3TransferProgress',
     # Cloud Sync operations
     'list_cloud_sync_relationships',
     'sync_cloud_sync_relationship',
@@ -1,13 +1,27 @@
 """S3 operations for NetApp DataOps traditional environments."""
 
-import base64
+import datetime
+import gzip
+import io
 import json
+import math
 import os
+import queue
+import random
+import shutil
+import tarfile
+import tempfile
+import threading
+import time
 from concurrent.futures import ThreadPoolExecutor
-from typing import Tuple, Optional
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Tuple, Optional
 
 import boto3
-from botocore.client import Config as BotoConfig
+from boto3.s3.transfer import TransferConfig
+from botocore.exceptions import BotoCoreError, ClientError
+from s3transfer.utils import ReadFileChunk
 
 from netapp_dataops.logging_utils import setup_logger
 from ..exceptions import (
@@ -15,23 +29,866 @@ from ..exceptions import (
     APIConnectionError
 )
 from ..core import (
-    _retrieve_config, 
-    _print_invalid_config_error,
+    _convert_bytes_to_pretty_size,
     deprecated
 )
-from ..core.connection import _instantiate_s3_session
+from ..core.connection import _instantiate_s3_session, _S3SessionPool
+from ..core.utilities import _crawl_in_parallel, _scan_directory_tree
 from ..core.config import _retrieve_s3_access_details
 
 logger = setup_logger(__name__)
 
+# Number of worker threads used for bulk transfers (same as the ThreadPoolExecutor
+# default). Each worker holds its own S3 session with a matching connection pool.
+S3_TRANSFER_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+
+# Default number of listed-but-not-yet-transferred objects per worker. Bounds the
+# memory used by bulk transfers regardless of the number of objects.
+S3_TRANSFER_QUEUE_DEPTH_PER_WORKER = 4
+
+# Name of the manifest written to the local directory by sync-mode bulk transfers
+S3_SYNC_MANIFEST_FILENAME = ".netapp_dataops_s3_sync.json"
+
+# Maximum number of keys accepted by a single S3 DeleteObjects request
+S3_DELETE_BATCH_SIZE = 1000
+
+# Multipart transfer tuning. Objects below the threshold are transferred in a
+# single request; larger objects are split into parts that are transferred
+# concurrently. S3 allows at most 10,000 parts per object.
+S3_MAX_PARTS = 10000
+S3_DEFAULT_PART_SIZE = 8 * 1024**2
+S3_LARGE_OBJECT_SIZE = 1024**3
+S3_LARGE_OBJECT_PART_SIZE = 64 * 1024**2
+S3_DEFAULT_MAX_CONCURRENCY = 10
+
+# Default number of connections available to a single-object transfer
+S3_SINGLE_TRANSFER_MAX_CONNECTIONS = 64
+
+# Retries per object in bulk transfers, with exponential backoff between attempts (in seconds)
+S3_TRANSFER_RETRIES = 3
+S3_RETRY_BASE_DELAY = 1.0
+S3_RETRY_MAX_DELAY = 30.0
+
+# Parallel listing: default number of concurrent list requests, and number of levels of
+# '/'-delimited common prefixes that are split into separately listed partitions
+S3_LIST_WORKERS = 8
+S3_LIST_PARTITION_DEPTH = 2
+
+# Parallel directory scanning: default number of directories read concurrently, and
+# maximum number of files handed over per batch
+S3_SCAN_WORKERS = 8
+S3_SCAN_BATCH_SIZE = 1000
+
+# Shard mode: default shard size, and names of the shard objects and of the index
+# object, relative to the object key prefix
+S3_DEFAULT_SHARD_SIZE = 1024**3
+S3_SHARD_KEY_FORMAT = "shard-%06d.tar"
+S3_SHARD_KEY_PREFIX = "shard-"
+S3_SHARD_INDEX_KEY = "shard-index.jsonl.gz"
+
+# Ranged downloads: attempts per byte range, and size of each read from a range's response stream
+S3_RANGE_ATTEMPTS = 4
+S3_RANGE_READ_SIZE = 1024**2
+
+# Progress reporting: minimum interval between calls to a progress callback, and between
+# progress messages when print_output is set (in seconds)
+S3_PROGRESS_CALLBACK_INTERVAL = 1.0
+S3_PROGRESS_LOG_INTERVAL = 10.0
+
+# Rate limiting: pause shared by all threads of a transfer after S3 responds with SlowDown (initial
+# and maximum pause, in seconds), and time over which a request rate reduced after SlowDown
+# responses recovers to the configured maximum (in seconds)
+S3_SLOWDOWN_BASE_DELAY = 0.5
+S3_SLOWDOWN_MAX_DELAY = 30.0
+S3_RATE_RECOVERY_SECONDS = 20.0
+
+# Per-object latency histogram: smallest bucket boundary (in seconds) and growth factor between buckets
+S3_LATENCY_MIN_SECONDS = 0.001
+S3_LATENCY_BUCKET_GROWTH = 1.05
+
+
+class _LatencyHistogram:
+    """Histogram of per-object transfer times, with buckets growing by 5%.
+
+    Percentiles are accurate to within one bucket, and memory use does not
+    depend on the number of objects. Histograms of concurrent workers can be
+    merged.
+    """
+
+    def __init__(self):
+        self.counts = {}  # type: Dict[int, int]
+        self.count = 0
+        self.max = 0.0
+
+    def add(self, seconds: float) -> None:
+        index = 0
+        if seconds > S3_LATENCY_MIN_SECONDS:
+            index = int(math.log(seconds / S3_LATENCY_MIN_SECONDS, S3_LATENCY_BUCKET_GROWTH)) + 1
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.count += 1
+        self.max = max(self.max, seconds)
+
+    def merge(self, other: '_LatencyHistogram') -> None:
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+        self.count += other.count
+        self.max = max(self.max, other.max)
+
+    def percentile(self, percentile: float) -> Optional[float]:
+        # Upper boundary of the bucket holding the requested rank
+        if not self.count:
+            return None
+        rank = math.ceil(self.count * percentile / 100)
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                return min(S3_LATENCY_MIN_SECONDS * S3_LATENCY_BUCKET_GROWTH**index, self.max)
+        return self.max
+
+
+@dataclass
+class S3TransferResult:
+    """Aggregated outcome of a bulk S3 transfer."""
+
+    objects_transferred: int = 0
+    bytes_transferred: int = 0
+    failures: List[Tuple[str, str]] = field(default_factory=list)  # (object key or file, error message)
+    objects_skipped: int = 0  # unchanged objects skipped in sync mode
+    objects_deleted: int = 0  # extraneous objects removed in sync mode with delete
+    retries: int = 0  # failed attempts that were retried
+    slow_downs: int = 0  # requests rejected by S3 with SlowDown (503)
+    elapsed_seconds: float = 0.0  # wall-clock duration of the transfer
+    unreadable_directories: List[str] = field(default_factory=list)  # local directories that could not be read
+    _latencies: _LatencyHistogram = field(default_factory=_LatencyHistogram, repr=False, compare=False)
+
+    @property
+    def objects_failed(self) -> int:
+        """Number of objects that could not be transferred."""
+        return len(self.failures)
+
+    @property
+    def bytes_per_second(self) -> float:
+        """Aggregate throughput of the transfer."""
+        return self.bytes_transferred / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+    def latency_percentile(self, percentile: float) -> Optional[float]:
+        """Time in seconds taken to transfer one object, at the given percentile (e.g. 50 or 99).
+
+        Returns None if no object was transferred.
+        """
+        return self._latencies.percentile(percentile)
+
+    def merge(self, other: 'S3TransferResult') -> None:
+        """Add the counts of another result to this one."""
+        self.objects_transferred += other.objects_transferred
+        self.bytes_transferred += other.bytes_transferred
+        self.failures.extend(other.failures)
+        self.objects_skipped += other.objects_skipped
+        self.objects_deleted += other.objects_deleted
+        self.retries += other.retries
+        self.slow_downs += other.slow_downs
+        self.elapsed_seconds = max(self.elapsed_seconds, other.elapsed_seconds)
+        self.unreadable_directories.extend(other.unreadable_directories)
+        self._latencies.merge(other._latencies)
+
+
+@dataclass
+class S3TransferProgress:
+    """Progress of a bulk S3 transfer, as passed to progress callbacks."""
+
+    objects_transferred: int
+    bytes_transferred: int
+    objects_failed: int
+    objects_found: int  # objects found so far that need to be transferred, including those already done
+    bytes_found: int
+    listing_complete: bool  # True once all objects that need to be transferred have been found
+    elapsed_seconds: float
+    bytes_per_second: float
+    eta_seconds: Optional[float]  # estimated time remaining, or None until the listing is complete
+
+
+class _S3ProgressTracker:
+    """Thread-safe progress counters of a bulk transfer.
+
+    Progress is passed to the callback at most once per
+    S3_PROGRESS_CALLBACK_INTERVAL and logged at most once per
+    S3_PROGRESS_LOG_INTERVAL if print_output is set, plus once at the end. The
+    callback is called from the transfer threads, one call at a time. If it
+    raises an exception, it is not called again.
+    """
+
+    def __init__(self, callback: Optional[Callable[[S3TransferProgress], None]] = None, print_output: bool = False):
+        self._callback = callback
+        self._print_output = print_output
+        self._lock = threading.Lock()
+        self._reportLock = threading.Lock()
+        self._start = time.monotonic()
+        self._lastCallback = self._lastLog = self._start
+        self._objectsFound = self._bytesFound = 0
+        self._objectsTransferred = self._bytesTransferred = 0
+        self._objectsFailed = self._bytesFailed = 0
+        self._listingComplete = False
+
+    @property
+    def active(self) -> bool:
+        return self._callback is not None or self._print_output
+
+    def start(self) -> None:
+        self._start = self._lastCallback = self._lastLog = time.monotonic()
+
+    def object_found(self, size: int) -> None:
+        with self._lock:
+            self._objectsFound += 1
+            self._bytesFound += size
+
+    def listing_completed(self) -> None:
+        with self._lock:
+            self._listingComplete = True
+
+    def object_finished(self, size: int, succeeded: bool) -> None:
+        with self._lock:
+            if succeeded:
+                self._objectsTransferred += 1
+                self._bytesTransferred += size
+            else:
+                self._objectsFailed += 1
+                self._bytesFailed += size
+        self._report()
+
+    def finish(self) -> None:
+        self._report(final=True)
+
+    def snapshot(self) -> S3TransferProgress:
+        with self._lock:
+            elapsed = time.monotonic() - self._start
+            rate = self._bytesTransferred / elapsed if elapsed > 0 else 0.0
+            eta = None
+            if self._listingComplete:
+                remaining = self._bytesFound - self._bytesTransferred - self._bytesFailed
+                eta = 0.0 if remaining <= 0 else (remaining / rate if rate else None)
+            return S3TransferProgress(objects_transferred=self._objectsTransferred,
+                                      bytes_transferred=self._bytesTransferred, objects_failed=self._objectsFailed,
+                                      objects_found=self._objectsFound, bytes_found=self._bytesFound,
+                                      listing_complete=self._listingComplete, elapsed_seconds=elapsed,
+                                      bytes_per_second=rate, eta_seconds=eta)
+
+    def _report(self, final: bool = False) -> None:
+        if not self.active:
+            return
+        now = time.monotonic()
+        callbackDue = self._callback is not None and (final or now - self._lastCallback >= S3_PROGRESS_CALLBACK_INTERVAL)
+        logDue = self._print_output and not final and now - self._lastLog >= S3_PROGRESS_LOG_INTERVAL
+        if not (callbackDue or logDue):
+            return
+        # Skip the report rather than hold up a transfer thread while another thread is reporting
+        if not self._reportLock.acquire(blocking=final):
+            return
+        try:
+            progress = self.snapshot()
+            if callbackDue and self._callback is not None:
+                self._lastCallback = now
+                try:
+                    self._callback(progress)
+                except Exception as err:
+                    logger.error("Error: Progress callback failed, progress will no longer be reported to it: %s", err)
+                    self._callback = None
+            if logDue:
+                self._lastLog = now
+                _log_transfer_progress(progress)
+        finally:
+            self._reportLock.release()
+
+
+def _log_transfer_progress(progress: S3TransferProgress) -> None:
+    if progress.listing_complete:
+        objects = "%d of %d object(s)" % (progress.objects_transferred, progress.objects_found)
+        eta = str(datetime.timedelta(seconds=round(progress.eta_seconds))) if progress.eta_seconds is not None else "unknown"
+    else:
+        objects = "%d object(s)" % progress.objects_transferred
+        eta = "unknown (still listing)"
+    logger.info("Progress: %s (%s) transferred, %s/s, ETA %s.", objects,
+                _convert_bytes_to_pretty_size(progress.bytes_transferred),
+                _convert_bytes_to_pretty_size(progress.bytes_per_second), eta)
+
+
+@dataclass
+class _S3TransferTuning:
+    """Multipart settings applied to each object of a transfer.
+
+    Settings that are not given explicitly are derived from the size of each
+    object: large objects get larger parts, so that the part count stays low
+    and within the S3 limit, and may use all available connections, while
+    small objects keep the boto3 defaults.
+    """
+
+    multipart_threshold: Optional[int] = None
+    multipart_chunksize: Optional[int] = None
+    max_concurrency: Optional[int] = None
+    max_connections: int = S3_SINGLE_TRANSFER_MAX_CONNECTIONS  # connections available to one object transfer
+
+    def config_for(self, objectSize: Optional[int] = None) -> TransferConfig:
+        chunksize = self.multipart_chunksize
+        if not chunksize:
+            chunksize = S3_DEFAULT_PART_SIZE
+            if objectSize:
+                if objectSize >= S3_LARGE_OBJECT_SIZE:
+                    chunksize = S3_LARGE_OBJECT_PART_SIZE
+                # Stay within the part limit, rounding up to a whole MiB
+                minimumChunksize = -(-objectSize // S3_MAX_PARTS)
+                chunksize = max(chunksize, -(-minimumChunksize // 1024**2) * 1024**2)
+
+        concurrency = self.max_concurrency
+        if not concurrency:
+            if objectSize and objectSize >= S3_LARGE_OBJECT_SIZE:
+                concurrency = self.max_connections
+            else:
+                concurrency = S3_DEFAULT_MAX_CONCURRENCY
+        concurrency = min(concurrency, self.max_connections)
+        if objectSize:
+            # No point in more threads than parts
+            concurrency = min(concurrency, -(-objectSize // chunksize))
+
+        return TransferConfig(multipart_threshold=self.multipart_threshold or S3_DEFAULT_PART_SIZE,
+                              multipart_chunksize=chunksize, max_concurrency=max(1, concurrency))
+
+
+def _bulk_transfer_tuning(max_workers: int, multipart_threshold: int = None, multipart_chunksize: int = None,
+                          max_concurrency: int = None, max_connections: int = None) -> _S3TransferTuning:
+    # Split the total connection budget evenly across the worker threads
+    if not max_connections:
+        max_connections = max_workers * (max_concurrency or S3_DEFAULT_MAX_CONCURRENCY)
+    return _S3TransferTuning(multipart_threshold=multipart_threshold, multipart_chunksize=multipart_chunksize,
+                             max_concurrency=max_concurrency, max_connections=max(1, max_connections // max_workers))
+
+
+class _TokenBucket:
+    """Token bucket shared by the threads of a transfer.
+
+    Tokens accrue at rate per second, up to one second's worth. Consumers may
+    take more tokens than are available and then sleep off the debt, so that
+    amounts larger than the bucket still pass at the configured rate.
+    """
+
+    def __init__(self, rate: float):
+        self.rate = rate
+        self._tokens = rate
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def consume(self, amount: float) -> None:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.rate, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= amount
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0
+        if wait:
+            time.sleep(wait)
+
+
+class _ThrottledStream:
+    """File-like wrapper that draws a token from a bucket for every byte read."""
+
+    def __init__(self, stream: Any, bucket: _TokenBucket):
+        self._stream = stream
+        self._bucket = bucket
+
+    def read(self, *args, **kwargs):
+        data = self._stream.read(*args, **kwargs)
+        if data:
+            self._bucket.consume(len(data))
+        return data
+
+    def iter_chunks(self, chunk_size: int = 1024) -> Iterator[bytes]:
+        while True:
+            chunk = self.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+    def __iter__(self) -> Iterator[bytes]:
+        return self.iter_chunks()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._stream, name)
+
+
+class _S3RateLimiter:
+    """Bandwidth and request rate limits shared by all S3 clients of a transfer.
+
+    The limiter hooks into the botocore events of each client it is attached
+    to, so it applies to every request, including the part requests that
+    boto3 makes on its own threads. Each request takes a token from the
+    request bucket before it is sent. Request bodies and GetObject response
+    bodies are throttled as they stream, by the bandwidth bucket that uploads
+    and downloads share.
+
+    When S3 responds with SlowDown, all requests pause for a time that doubles
+    with every further SlowDown response, and the request rate, if limited,
+    is halved and then recovers to its maximum over S3_RATE_RECOVERY_SECONDS.
+    The rejected request itself is retried by botocore.
+    """
+
+    def __init__(self, maxBandwidth: Optional[int] = None, maxRequestsPerSecond: Optional[float] = None):
+        self.max_bandwidth = maxBandwidth
+        self.max_requests_per_second = maxRequestsPerSecond
+        self._bandwidth = _TokenBucket(maxBandwidth) if maxBandwidth else None
+        self._requests = _TokenBucket(maxRequestsPerSecond) if maxRequestsPerSecond else None
+        self._lock = threading.Lock()
+        self._pauseUntil = 0.0
+        self._delay = 0.0
+        self._lastSlowDown = self._lastRecovery = time.monotonic()
+        self.slow_downs = 0
+
+    def attach(self, s3: Any) -> Any:
+        """Apply the limits to the client of an S3 resource, and return the resource."""
+        events = s3.meta.client.meta.events
+        events.register("before-send.s3", self._before_send)
+        events.register("needs-retry.s3", self._check_response)
+        if self._bandwidth:
+            events.register("after-call.s3.GetObject", self._throttle_response_body)
+        return s3
+
+    def _before_send(self, request: Any, **kwargs) -> None:
+        with self._lock:
+            pause = self._pauseUntil - time.monotonic()
+        if pause > 0:
+            time.sleep(pause)
+        if self._requests:
+            self._recover_request_rate()
+            self._requests.consume(1)
+        if self._bandwidth and request.body is not None and not isinstance(request.body, _ThrottledStream):
+            if hasattr(request.body, "read"):
+                request.body = _ThrottledStream(request.body, self._bandwidth)
+            else:
+                self._bandwidth.consume(len(request.body))
+
+    def _throttle_response_body(self, parsed: Dict[str, Any], **kwargs) -> None:
+        if "Body" in parsed:
+            parsed["Body"] = _ThrottledStream(parsed["Body"], self._bandwidth)
+
+    def _check_response(self, response: Optional[Tuple[Any, Dict[str, Any]]] = None, **kwargs) -> None:
+        # Returns None, leaving the decision to retry to botocore
+        if response is None:
+            return
+        httpResponse, parsed = response
+        if parsed.get("Error", {}).get("Code") == "SlowDown" or getattr(httpResponse, "status_code", None) == 503:
+            self._slow_down()
+
+    def _slow_down(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            self.slow_downs += 1
+            # Responses to requests that were already in flight do not extend the backoff any further
+            if now < self._pauseUntil:
+                return
+            if self._delay and now - self._lastSlowDown < S3_SLOWDOWN_MAX_DELAY:
+                self._delay = min(S3_SLOWDOWN_MAX_DELAY, self._delay * 2)
+            else:
+                self._delay = S3_SLOWDOWN_BASE_DELAY
+            self._pauseUntil = now + random.uniform(0.5, 1.0) * self._delay
+            self._lastSlowDown = self._lastRecovery = now
+            if self._requests:
+                self._requests.rate = max(1.0, self._requests.rate / 2)
+
+    def _recover_request_rate(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            if self._requests.rate < self.max_requests_per_second and now - self._lastSlowDown >= 1:
+                increase = self.max_requests_per_second * (now - self._lastRecovery) / S3_RATE_RECOVERY_SECONDS
+                self._requests.rate = min(self.max_requests_per_second, self._requests.rate + increase)
+            self._lastRecovery = now
+
+
+@dataclass
+class _S3ListedObject:
+    """Object returned by a parallel listing, with the same attributes as a boto3 ObjectSummary."""
+
+    key: str
+    size: int
+    e_tag: str
+    last_modified: Any
+
+
+def _list_objects_in_parallel(s3Client: Any, s3Bucket: str, s3ObjectKeyPrefix: str, maxListers: int = S3_LIST_WORKERS,
+                              partitionDepth: int = S3_LIST_PARTITION_DEPTH) -> Iterator[_S3ListedObject]:
+    """List all objects under a prefix, listing partitions of the keyspace concurrently.
+
+    Prefixes are listed with Delimiter='/' down to partitionDepth levels below
+    the given prefix. Every common prefix found is queued as a partition of its
+    own, to be listed by the next free lister thread; partitions at the
+    deepest level are listed in full. Objects are yielded page by page as
+    listers produce them, in no particular order, so consumers can start
+    working before the listing is complete. Key spaces without '/' separators
+    form a single partition and are listed sequentially.
+    """
+    def _list_partition(partition: Tuple[str, int], addPartition: Callable[[Any], None]) -> Iterator[List[_S3ListedObject]]:
+        prefix, depth = partition
+        listArgs = {"Bucket": s3Bucket, "Prefix": prefix}
+        if depth < partitionDepth:
+            listArgs["Delimiter"] = "/"
+        for page in s3Client.get_paginator("list_objects_v2").paginate(**listArgs):
+            for commonPrefix in page.get("CommonPrefixes", []):
+                addPartition((commonPrefix["Prefix"], depth + 1))
+            yield [_S3ListedObject(key=obj["Key"], size=obj["Size"], e_tag=obj.get("ETag"),
+                                   last_modified=obj.get("LastModified"))
+                   for obj in page.get("Contents", [])]
+
+    return _crawl_in_parallel((s3ObjectKeyPrefix, 0), _list_partition, maxWorkers=maxListers)
+
+
+def _scan_directory_in_parallel(localDirectory: str, maxScanners: int = S3_SCAN_WORKERS,
+                                unreadableDirectories: Optional[List[str]] = None
+                                ) -> Iterator[Tuple[str, str, Optional[os.stat_result]]]:
+    """Find all non-hidden files in a directory tree, as (local file, relative filepath, stat result).
+
+    See _scan_directory_tree(). A file that could not be stat'ed is yielded
+    with a stat result of None, and is reported as a failure by whatever
+    reads it.
+    """
+    return _scan_directory_tree(localDirectory, maxWorkers=maxScanners, skipHidden=True,
+                                unreadableDirectories=unreadableDirectories, batchSize=S3_SCAN_BATCH_SIZE)
+
+
+class _S3TransferJournal:
+    """Append-only record of the progress of a bulk transfer, used to resume it after an interruption.
+
+    The journal holds one JSON record per line: a header identifying the
+    transfer, a "done" record for every completed object and an "upload"
+    record for every multipart upload started. Records are flushed as they are
+    written, so an interrupted transfer loses at most the record being written.
+    A journal written for a different transfer is discarded.
+    """
+
+    def __init__(self, path: str, direction: str, s3Bucket: str, s3ObjectKeyPrefix: str):
+        self.path = path
+        self._header = {"op": "start", "direction": direction, "bucket": s3Bucket, "prefix": s3ObjectKeyPrefix}
+        self._done = {}  # type: Dict[str, Dict[str, Any]]
+        self._uploads = {}  # type: Dict[str, Dict[str, Any]]
+        self._lock = threading.Lock()
+        self._file = None
+
+    def open(self) -> None:
+        records = []
+        try:
+            with open(self.path) as journalFile:
+                for line in journalFile:
+                    try:
+                        records.append(json.loads(line))
+                    except ValueError:
+                        # Record cut short by an interruption
+                        break
+        except OSError:
+            pass
+        if records and records[0] == self._header:
+            for record in records[1:]:
+                if record.get("op") == "done":
+                    self._done[record["key"]] = record
+                    self._uploads.pop(record["key"], None)
+                elif record.get("op") == "upload":
+                    self._uploads[record["key"]] = record
+
+        # Rewrite the journal compacted, which also drops any incomplete last record
+        journalDir = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(journalDir, exist_ok=True)
+        fd, tempPath = tempfile.mkstemp(dir=journalDir, prefix=".netapp_dataops_journal_")
+        with os.fdopen(fd, "w") as tempFile:
+            for record in [self._header] + list(self._done.values()) + list(self._uploads.values()):
+                tempFile.write(json.dumps(record) + "\n")
+        os.replace(tempPath, self.path)
+        self._file = open(self.path, "a")
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file:
+                self._file.close()
+                self._file = None
+
+    def _append(self, record: Dict[str, Any]) -> None:
+        with self._lock:
+            self._file.write(json.dumps(record) + "\n")
+            self._file.flush()
+
+    def is_done(self, key: str, **attributes: Any) -> bool:
+        """Return True if the object was completed with the same attributes (e.g. ETag or size)."""
+        entry = self._done.get(key)
+        return entry is not None and all(entry.get(name) == value for name, value in attributes.items())
+
+    def record_done(self, key: str, **attributes: Any) -> None:
+        record = dict(attributes, op="done", key=key)
+        self._append(record)
+        with self._lock:
+            self._done[key] = record
+            self._uploads.pop(key, None)
+
+    def get_upload(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return self._uploads.get(key)
+
+    def record_upload(self, key: str, **attributes: Any) -> None:
+        record = dict(attributes, op="upload", key=key)
+        self._append(record)
+        with self._lock:
+            self._uploads[key] = record
+
+
+def _journaled_transfer(transferFunction: Callable[..., None], journal: _S3TransferJournal) -> Callable[..., None]:
+    # Record each object in the journal once it has been transferred
+    def _transfer(journalKey: str, journalAttributes: Dict[str, Any], **kwargs):
+        transferFunction(**kwargs)
+        journal.record_done(journalKey, **journalAttributes)
+    return _transfer
+
+
+class _S3SyncManifest:
+    """Local record of the objects transferred by previous sync-mode bulk transfers.
+
+    Maps each object key to the size and mtime of the local file and the ETag
+    of the S3 object as of the last transfer, so that unchanged objects can be
+    recognized from a single listing without a HEAD request per object. The
+    manifest is only used for the bucket and prefix it was written for.
+    """
+
+    def __init__(self, path: str, s3Bucket: str, s3ObjectKeyPrefix: str):
+        self.path = path
+        self._bucket = s3Bucket
+        self._prefix = s3ObjectKeyPrefix
+        self._entries = {}  # type: Dict[str, Dict[str, Any]]
+        self._lock = threading.Lock()
+
+    def load(self) -> None:
+        try:
+            with open(self.path) as manifestFile:
+                manifest = json.load(manifestFile)
+        except (OSError, ValueError):
+            # Missing or unreadable manifest; everything is compared against S3 directly
+            return
+        if manifest.get("bucket") == self._bucket and manifest.get("prefix") == self._prefix:
+            self._entries = manifest.get("entries", {})
+
+    def get(self, s3ObjectKey: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return self._entries.get(s3ObjectKey)
+
+    def record(self, s3ObjectKey: str, localFile: str, etag: Optional[str] = None,
+               localStat: Optional[os.stat_result] = None) -> None:
+        stat = localStat or os.stat(localFile)
+        with self._lock:
+            self._entries[s3ObjectKey] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "etag": etag}
+
+    def remove(self, s3ObjectKey: str) -> None:
+        with self._lock:
+            self._entries.pop(s3ObjectKey, None)
+
+    def matches_local_file(self, s3ObjectKey: str, localStat: Optional[os.stat_result]) -> bool:
+        """Return True if the local file is unchanged since it was last recorded."""
+        entry = self.get(s3ObjectKey)
+        return bool(entry and localStat and entry["size"] == localStat.st_size
+                    and entry["mtime_ns"] == localStat.st_mtime_ns)
+
+    def save(self) -> None:
+        # Write to a temporary file first so that an interrupted save never corrupts the manifest
+        manifestDir = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(manifestDir, exist_ok=True)
+        with self._lock:
+            manifest = {"bucket": self._bucket, "prefix": self._prefix, "entries": self._entries}
+            fd, tempPath = tempfile.mkstemp(dir=manifestDir, prefix=".netapp_dataops_manifest_")
+            try:
+                with os.fdopen(fd, "w") as tempFile:
+                    json.dump(manifest, tempFile)
+                os.replace(tempPath, self.path)
+            except Exception:
+                os.unlink(tempPath)
+                raise
+
+
+def _stat_or_none(path: str) -> Optional[os.stat_result]:
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
+
+def _is_retryable(err: Exception) -> bool:
+    # Client errors, such as missing objects or denied access, fail the same way every time, as do local
+    # files that are missing, are directories or cannot be opened
+    cause = err.args[0] if isinstance(err, APIConnectionError) and err.args and isinstance(err.args[0], Exception) else err
+    if isinstance(cause, (FileNotFoundError, IsADirectoryError, NotADirectoryError, PermissionError)):
+        return False
+    if isinstance(cause, ClientError):
+        status = cause.response.get("ResponseMetadata", {}).get("HTTPStatusCode", 0)
+        return not 400 <= status < 500 or status in (408, 429)
+    return True
+
+
+def _transfer_worker(taskQueue: queue.Queue, transferFunction: Callable[..., None], retries: int = 0,
+                     progress: Optional[_S3ProgressTracker] = None) -> S3TransferResult:
+    # Consume tasks until the end-of-input marker is received
+    result = S3TransferResult()
+    while True:
+        task = taskQueue.get()
+        if task is None:
+            return result
+        name, size, kwargs = task
+        attempt = 0
+        while True:
+            try:
+                started = time.monotonic()
+                transferFunction(**kwargs)
+                result._latencies.add(time.monotonic() - started)
+                result.objects_transferred += 1
+                result.bytes_transferred += size
+                succeeded = True
+                break
+            except Exception as err:
+                if attempt >= retries or not _is_retryable(err):
+                    result.failures.append((name, "%s (after %d attempts)" % (err, attempt + 1) if attempt else str(err)))
+                    succeeded = False
+                    break
+                # Exponential backoff with jitter, so that retries from all workers do not arrive together
+                time.sleep(random.uniform(0.5, 1.0) * min(S3_RETRY_MAX_DELAY, S3_RETRY_BASE_DELAY * 2**attempt))
+                attempt += 1
+                result.retries += 1
+        if progress:
+            progress.object_finished(size, succeeded)
+
+
+def _run_transfer_pipeline(tasks: Iterable[Tuple[str, int, Dict[str, Any]]], transferFunction: Callable[..., None],
+                           max_workers: int, max_queue_size: int, retries: int = 0,
+                           progress: Optional[_S3ProgressTracker] = None) -> S3TransferResult:
+    """Stream tasks through a bounded queue to a fixed set of worker threads.
+
+    Each task is a (name, size in bytes, transferFunction kwargs) tuple. The
+    producer blocks while the queue is full, so at most max_queue_size tasks
+    are held in memory at any time. Failed tasks are retried up to retries
+    times with exponential backoff; tasks that still fail are collected in the
+    returned result. Errors raised while producing tasks are re-raised after
+    the workers have stopped. The result records the elapsed time and the time
+    taken by each object; progress, if given, is updated as tasks are
+    produced and completed.
+    """
+    taskQueue = queue.Queue(maxsize=max_queue_size)
+    result = S3TransferResult()
+    started = time.monotonic()
+    if progress:
+        progress.start()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        workers = [executor.submit(_transfer_worker, taskQueue, transferFunction, retries, progress)
+                   for _ in range(max_workers)]
+        try:
+            for task in tasks:
+                if progress:
+                    progress.object_found(task[1])
+                taskQueue.put(task)
+            if progress:
+                progress.listing_completed()
+        finally:
+            # Tell each worker to stop once the queue has been drained
+            for _ in workers:
+                taskQueue.put(None)
+        for worker in workers:
+            result.merge(worker.result())
+    result.elapsed_seconds = time.monotonic() - started
+    if progress:
+        progress.finish()
+    return result
+
+
+def _download_range(s3Client: Any, s3Bucket: str, s3ObjectKey: str, etag: str, fd: int, start: int, end: int,
+                    cancelled: threading.Event) -> None:
+    # Write bytes start..end (inclusive) of the object to fd at the same offsets. After a
+    # failed attempt the request is resumed from the first byte that was not written yet.
+    offset = start
+    attempt = 0
+    while True:
+        try:
+            # If-Match makes the request fail, rather than mix data, if the object is replaced mid-download
+            response = s3Client.get_object(Bucket=s3Bucket, Key=s3ObjectKey, Range="bytes=%d-%d" % (offset, end), IfMatch=etag)
+            body = response["Body"]
+            try:
+                for chunk in body.iter_chunks(S3_RANGE_READ_SIZE):
+                    if cancelled.is_set():
+                        return
+                    view = memoryview(chunk)
+                    while view:
+                        written = os.pwrite(fd, view, offset)
+                        view = view[written:]
+                        offset += written
+            finally:
+                body.close()
+            if offset <= end:
+                raise IOError("Connection closed after %d of %d bytes of range %d-%d." % (offset - start, end - start + 1, start, end))
+            return
+        except ClientError as err:
+            if err.response.get("Error", {}).get("Code") in ("PreconditionFailed", "412"):
+                raise IOError("Object '%s' was modified during the download." % s3ObjectKey)
+            error = err
+        except (BotoCoreError, IOError) as err:
+            # Timeouts and dropped connections
+            error = err
+        attempt += 1
+        if attempt >= S3_RANGE_ATTEMPTS or cancelled.is_set():
+            raise error
+        time.sleep(0.5 * 2**(attempt - 1))
+
+
+def _download_object_in_ranges(s3: Any, s3Bucket: str, s3ObjectKey: str, localFile: str, objectSize: int, etag: str,
+                               transferConfig: TransferConfig) -> None:
+    """Download an object by fetching byte ranges concurrently into a preallocated file.
+
+    Each range is written in place with os.pwrite as it streams in, so no part
+    of the object is buffered or reassembled in memory. Data is written to a
+    hidden temporary file next to the target, which replaces the target once
+    every range has completed.
+    """
+    partSize = transferConfig.multipart_chunksize
+    tempFile = os.path.join(os.path.dirname(localFile), ".%s.netapp_dataops_part" % os.path.basename(localFile))
+    cancelled = threading.Event()
+    fd = os.open(tempFile, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        # Size the file up front. posix_fallocate is not used because it falls back to
+        # writing every block on file systems without native support, such as NFSv3.
+        os.ftruncate(fd, objectSize)
+        # Clients, unlike resources, can be shared between threads
+        s3Client = s3.meta.client
+        with ThreadPoolExecutor(max_workers=transferConfig.max_concurrency) as executor:
+            futures = [executor.submit(_download_range, s3Client, s3Bucket, s3ObjectKey, etag, fd, start,
+                                       min(start + partSize, objectSize) - 1, cancelled)
+                       for start in range(0, objectSize, partSize)]
+            try:
+                for future in futures:
+                    future.result()
+            except BaseException:
+                # Stop the remaining ranges instead of downloading the rest of the object
+                cancelled.set()
+                for future in futures:
+                    future.cancel()
+                raise
+    except BaseException:
+        os.close(fd)
+        os.unlink(tempFile)
+        raise
+    os.close(fd)
+    os.replace(tempFile, localFile)
+
 
 def _download_from_s3(s3Endpoint: str, s3AccessKeyId: str, s3SecretAccessKey: str, s3VerifySSLCert: bool,
-                   s3CACertBundle: str, s3Bucket: str, s3ObjectKey: str, localFile: str, print_output: bool = False):
-    # Instantiate S3 session
+                   s3CACertBundle: str, s3Bucket: str, s3ObjectKey: str, localFile: str, print_output: bool = False,
+                   s3Pool: Optional[_S3SessionPool] = None, objectSize: Optional[int] = None,
+                   transferTuning: Optional[_S3TransferTuning] = None, rangedDownload: bool = False):
+    if not transferTuning:
+        transferTuning = _S3TransferTuning()
+
+    # Instantiate S3 session, reusing the calling worker thread's session if part of a bulk transfer
     try:
-        s3 = _instantiate_s3_session(s3Endpoint=s3Endpoint, s3AccessKeyId=s3AccessKeyId,
-                                  s3SecretAccessKey=s3SecretAccessKey, s3VerifySSLCert=s3VerifySSLCert,
-                                  s3CACertBundle=s3CACertBundle, print_output=print_output)
+        if s3Pool:
+            s3 = s3Pool.get()
+        else:
+            s3 = _instantiate_s3_session(s3Endpoint=s3Endpoint, s3AccessKeyId=s3AccessKeyId,
+                                      s3SecretAccessKey=s3SecretAccessKey, s3VerifySSLCert=s3VerifySSLCert,
+                                      s3CACertBundle=s3CACertBundle, print_output=print_output,
+                                      max_pool_connections=transferTuning.max_connections)
     except Exception as err:
         if print_output:
             logger.error("Error: S3 API error: %s", err)
@@ -44,24 +901,100 @@ def _download_from_s3(s3Endpoint: str, s3AccessKeyId: str, s3SecretAccessKey: st
     if localFile.find(os.sep) != -1:
         dirs = localFile.split(os.sep)
         dirpath = os.sep.join(dirs[:len(dirs) - 1])
-        if not os.path.exists(dirpath):
-            os.makedirs(dirpath)
+        # Other worker threads may create the same directory concurrently
+        os.makedirs(dirpath, exist_ok=True)
 
     try:
-        s3.Object(s3Bucket, s3ObjectKey).download_file(localFile)
+        s3Object = s3.Object(s3Bucket, s3ObjectKey)
+        if objectSize is None:
+            # Size is needed to tune the transfer; bulk transfers already know it from the listing
+            objectSize = s3Object.content_length
+        transferConfig = transferTuning.config_for(objectSize)
+        # Only single-object pulls use the ranged engine; bulk pulls already run one download per worker
+        if rangedDownload and objectSize >= transferConfig.multipart_threshold and hasattr(os, "pwrite"):
+            # Loads the ETag with a HEAD request, unless already loaded along with the size
+            _download_object_in_ranges(s3, s3Bucket=s3Bucket, s3ObjectKey=s3ObjectKey, localFile=localFile,
+                                       objectSize=objectSize, etag=s3Object.e_tag, transferConfig=transferConfig)
+        else:
+            s3Object.download_file(localFile, Config=transferConfig)
     except Exception as err:
         if print_output:
             logger.error("Error: S3 API error: %s", err)
         raise APIConnectionError(err)
 
 
+def _upload_in_parts(s3Client: Any, s3Bucket: str, s3ObjectKey: str, localFile: str, extraArgs: Dict[str, Any],
+                     transferConfig: TransferConfig, journal: _S3TransferJournal) -> None:
+    """Multipart upload that resumes from the parts already stored in S3 after an interruption.
+
+    The upload ID is recorded in the journal before any part is sent. If the
+    journal holds an upload for the same key and the file has not changed
+    since, the parts already uploaded are listed from S3 and skipped. Each
+    part is streamed from its slice of the file rather than read into memory.
+    """
+    stat = os.stat(localFile)
+    partSize = transferConfig.multipart_chunksize
+    uploadId = None
+    uploadedParts = {}  # type: Dict[int, Tuple[str, int]]
+    previousUpload = journal.get_upload(s3ObjectKey)
+    if previousUpload:
+        if previousUpload["size"] == stat.st_size and previousUpload["mtime_ns"] == stat.st_mtime_ns:
+            try:
+                for page in s3Client.get_paginator("list_parts").paginate(Bucket=s3Bucket, Key=s3ObjectKey,
+                                                                          UploadId=previousUpload["upload_id"]):
+                    for part in page.get("Parts", []):
+                        uploadedParts[part["PartNumber"]] = (part["ETag"], part["Size"])
+                uploadId = previousUpload["upload_id"]
+                partSize = previousUpload["part_size"]
+            except ClientError:
+                # The upload has since been completed or aborted
+                uploadedParts = {}
+        else:
+            # The file has changed, so the parts uploaded so far are of no use
+            try:
+                s3Client.abort_multipart_upload(Bucket=s3Bucket, Key=s3ObjectKey, UploadId=previousUpload["upload_id"])
+            except ClientError:
+                pass
+
+    if uploadId is None:
+        uploadId = s3Client.create_multipart_upload(Bucket=s3Bucket, Key=s3ObjectKey, **extraArgs)["UploadId"]
+        journal.record_upload(s3ObjectKey, upload_id=uploadId, part_size=partSize, size=stat.st_size,
+                              mtime_ns=stat.st_mtime_ns)
+
+    def _upload_part(partNumber: int) -> str:
+        offset = (partNumber - 1) * partSize
+        length = min(partSize, stat.st_size - offset)
+        if partNumber in uploadedParts and uploadedParts[partNumber][1] == length:
+            return uploadedParts[partNumber][0]
+        # A seekable view of the part's bytes, so that retries can rewind it
+        with ReadFileChunk.from_filename(localFile, start_byte=offset, chunk_size=length, enable_callbacks=False) as body:
+            return s3Client.upload_part(Bucket=s3Bucket, Key=s3ObjectKey, UploadId=uploadId, PartNumber=partNumber,
+                                        Body=body)["ETag"]
+
+    partCount = max(1, -(-stat.st_size // partSize))
+    with ThreadPoolExecutor(max_workers=transferConfig.max_concurrency) as executor:
+        etags = list(executor.map(_upload_part, range(1, partCount + 1)))
+    s3Client.complete_multipart_upload(Bucket=s3Bucket, Key=s3ObjectKey, UploadId=uploadId,
+                                       MultipartUpload={"Parts": [{"PartNumber": partNumber, "ETag": etag}
+                                                                  for partNumber, etag in enumerate(etags, 1)]})
+
+
 def _upload_to_s3(s3Endpoint: str, s3AccessKeyId: str, s3SecretAccessKey: str, s3VerifySSLCert: bool, s3CACertBundle: str,
-               s3Bucket: str, localFile: str, s3ObjectKey: str, s3ExtraArgs: str = None, print_output: bool = False):
-    # Instantiate S3 session
+               s3Bucket: str, localFile: str, s3ObjectKey: str, s3ExtraArgs: str = None, print_output: bool = False,
+               s3Pool: Optional[_S3SessionPool] = None, transferTuning: Optional[_S3TransferTuning] = None,
+               journal: Optional[_S3TransferJournal] = None):
+    if not transferTuning:
+        transferTuning = _S3TransferTuning()
+
+    # Instantiate S3 session, reusing the calling worker thread's session if part of a bulk transfer
     try:
-        s3 = _instantiate_s3_session(s3Endpoint=s3Endpoint, s3AccessKeyId=s3AccessKeyId,
-                                  s3SecretAccessKey=s3SecretAccessKey, s3VerifySSLCert=s3VerifySSLCert,
-                                  s3CACertBundle=s3CACertBundle, print_output=print_output)
+        if s3Pool:
+            s3 = s3Pool.get()
+        else:
+            s3 = _instantiate_s3_session(s3Endpoint=s3Endpoint, s3AccessKeyId=s3AccessKeyId,
+                                      s3SecretAccessKey=s3SecretAccessKey, s3VerifySSLCert=s3VerifySSLCert,
+                                      s3CACertBundle=s3CACertBundle, print_output=print_output,
+                                      max_pool_connections=transferTuning.max_connections)
     except Exception as err:
         if print_output:
             logger.error("Error: S3 API error: %s", err)
@@ -71,17 +1004,250 @@ def _upload_to_s3(s3Endpoint: str, s3AccessKeyId: str, s3SecretAccessKey: str, s
         logger.info("Uploading file '%s' to bucket '%s' and applying key '%s'.", localFile, s3Bucket, s3ObjectKey)
 
     try:
-        if s3ExtraArgs:
-            s3.Object(s3Bucket, s3ObjectKey).upload_file(localFile, ExtraArgs=json.loads(s3ExtraArgs))
+        fileSize = os.path.getsize(localFile)
+        transferConfig = transferTuning.config_for(fileSize)
+        if journal and fileSize >= transferConfig.multipart_threshold:
+            # Large files of a journaled transfer can be resumed part by part
+            _upload_in_parts(s3.meta.client, s3Bucket=s3Bucket, s3ObjectKey=s3ObjectKey, localFile=localFile,
+                             extraArgs=json.loads(s3ExtraArgs) if s3ExtraArgs else {}, transferConfig=transferConfig,
+                             journal=journal)
+        elif s3ExtraArgs:
+            s3.Object(s3Bucket, s3ObjectKey).upload_file(localFile, ExtraArgs=json.loads(s3ExtraArgs), Config=transferConfig)
         else:
-            s3.Object(s3Bucket, s3ObjectKey).upload_file(localFile)
+            s3.Object(s3Bucket, s3ObjectKey).upload_file(localFile, Config=transferConfig)
     except Exception as err:
         if print_output:
             logger.error("Error: S3 API error: %s", err)
         raise APIConnectionError(err)
 
 
-def pull_bucket_from_s3(s3_bucket: str, local_directory: str, s3_object_key_prefix: str = "", print_output: bool = False):
+def _pack_shards(localDirectory: str, shardSize: int, stagingDirectory: str, indexFile: Any,
+                 failures: List[Tuple[str, str]], maxScanners: int = S3_SCAN_WORKERS) -> Iterator[Tuple[str, str, int]]:
+    """Pack the files of a directory into tar shards of about shardSize bytes each.
+
+    Shards are written to the staging directory one at a time while walking the
+    directory, and each completed shard is yielded as (shard name, path, number
+    of files) so that it can be uploaded while the next one is packed. For
+    every file, a JSON line with its path, shard, and the offset and size of
+    its data within the shard is written to indexFile. Files that cannot be
+    read are added to failures and left out.
+    """
+    shardNumber = 0
+    shardFiles = 0
+    tar = None
+    shardName = shardPath = None
+    for localFile, filepath, _ in _scan_directory_in_parallel(localDirectory, maxScanners=maxScanners):
+        try:
+            fileobj = open(localFile, "rb")
+        except OSError as err:
+            failures.append((localFile, str(err)))
+            continue
+
+        with fileobj:
+            size = os.fstat(fileobj.fileno()).st_size
+            # Start a new shard once the current one is full; larger files get a shard to themselves
+            if tar is not None and tar.offset + size > shardSize:
+                tar.close()
+                yield shardName, shardPath, shardFiles
+                tar = None
+            if tar is None:
+                shardName = S3_SHARD_KEY_FORMAT % shardNumber
+                shardPath = os.path.join(stagingDirectory, shardName)
+                shardNumber += 1
+                shardFiles = 0
+                tar = tarfile.open(shardPath, mode="w", format=tarfile.PAX_FORMAT)
+
+            arcname = filepath.replace(os.sep, "/")
+            tarinfo = tar.gettarinfo(arcname=arcname, fileobj=fileobj)
+            tar.addfile(tarinfo, fileobj)
+
+        # File data ends at the current offset, padded to whole tar blocks
+        paddedSize = -(-tarinfo.size // tarfile.BLOCKSIZE) * tarfile.BLOCKSIZE
+        indexFile.write(json.dumps({"path": arcname, "shard": shardName, "offset": tar.offset - paddedSize,
+                                    "size": tarinfo.size}) + "\n")
+        shardFiles += 1
+
+    if tar is not None:
+        tar.close()
+        yield shardName, shardPath, shardFiles
+
+
+def _push_directory_as_shards(s3Bucket: str, localDirectory: str, s3ObjectKeyPrefix: str, shardSize: int,
+                              stagingDirectory: Optional[str], upload: Callable[..., None], maxWorkers: int,
+                              retries: int = 0, maxScanners: int = S3_SCAN_WORKERS,
+                              progress: Optional[_S3ProgressTracker] = None,
+                              print_output: bool = False) -> S3TransferResult:
+    stagingDirectory = tempfile.mkdtemp(prefix="netapp_dataops_shards_", dir=stagingDirectory)
+    indexPath = os.path.join(stagingDirectory, S3_SHARD_INDEX_KEY)
+    packFailures = []  # type: List[Tuple[str, str]]
+    packedFiles = 0
+
+    def _upload_shard(localFile: str, s3ObjectKey: str):
+        upload(localFile=localFile, s3ObjectKey=s3ObjectKey)
+        # Free the staging space as soon as the shard is uploaded; failed shards are kept for retries
+        os.remove(localFile)
+
+    def _list_shards(indexFile: Any):
+        nonlocal packedFiles
+        for shardName, shardPath, shardFiles in _pack_shards(localDirectory, shardSize, stagingDirectory, indexFile,
+                                                             packFailures, maxScanners=maxScanners):
+            packedFiles += shardFiles
+            yield shardName, os.path.getsize(shardPath), {"localFile": shardPath, "s3ObjectKey": s3ObjectKeyPrefix + shardName}
+
+    try:
+        with gzip.open(indexPath, "wt") as indexFile:
+            # Shards waiting for upload are staged on local disk, so keep the queue short
+            result = _run_transfer_pipeline(_list_shards(indexFile), _upload_shard, max_workers=maxWorkers,
+                                            max_queue_size=maxWorkers, retries=retries, progress=progress)
+        upload(localFile=indexPath, s3ObjectKey=s3ObjectKeyPrefix + S3_SHARD_INDEX_KEY)
+    finally:
+        shutil.rmtree(stagingDirectory, ignore_errors=True)
+
+    result.failures.extend(packFailures)
+    if print_output:
+        logger.info("Packed %d file(s) into %d shard(s).", packedFiles, result.objects_transferred + result.objects_failed - len(packFailures))
+    return result
+
+
+def _read_shard_index(s3Session: Any, s3Bucket: str, s3ObjectKeyPrefix: str) -> Iterator[Dict[str, Any]]:
+    body = s3Session.meta.client.get_object(Bucket=s3Bucket, Key=s3ObjectKeyPrefix + S3_SHARD_INDEX_KEY)["Body"]
+    with io.TextIOWrapper(gzip.GzipFile(fileobj=body)) as indexFile:
+        for line in indexFile:
+            yield json.loads(line)
+
+
+def _extract_shard(s3Pool: _S3SessionPool, s3Bucket: str, s3ObjectKey: str, localDirectory: str,
+                   print_output: bool = False) -> None:
+    if print_output:
+        logger.info("Extracting shard '%s' from bucket '%s' to '%s'.", s3ObjectKey, s3Bucket, localDirectory)
+    body = s3Pool.get().meta.client.get_object(Bucket=s3Bucket, Key=s3ObjectKey)["Body"]
+    # Stream mode extracts members as they arrive, without staging the shard locally
+    with tarfile.open(fileobj=body, mode="r|") as tar:
+        for member in tar:
+            if os.path.isabs(member.name) or ".." in member.name.split("/"):
+                raise tarfile.TarError("Refusing to extract '%s' outside of '%s'." % (member.name, localDirectory))
+            if hasattr(tarfile, "data_filter"):
+                tar.extract(member, localDirectory, filter="data")
+            else:
+                tar.extract(member, localDirectory)
+
+
+def _download_shard_member(s3Pool: _S3SessionPool, s3Bucket: str, s3ObjectKey: str, offset: int, size: int,
+                           localFile: str, print_output: bool = False) -> None:
+    if print_output:
+        logger.info("Downloading '%s' from shard '%s' in bucket '%s'.", localFile, s3ObjectKey, s3Bucket)
+    os.makedirs(os.path.dirname(localFile) or ".", exist_ok=True)
+    with open(localFile, "wb") as fileobj:
+        if not size:
+            return
+        body = s3Pool.get().meta.client.get_object(Bucket=s3Bucket, Key=s3ObjectKey,
+                                                   Range="bytes=%d-%d" % (offset, offset + size - 1))["Body"]
+        for chunk in body.iter_chunks(S3_RANGE_READ_SIZE):
+            fileobj.write(chunk)
+
+
+def _pull_shards(s3Session: Any, s3Pool: _S3SessionPool, s3Bucket: str, localDirectory: str, s3ObjectKeyPrefix: str,
+                 shardFiles: Optional[List[str]], maxWorkers: int, maxQueueSize: int, retries: int = 0,
+                 progress: Optional[_S3ProgressTracker] = None, print_output: bool = False) -> S3TransferResult:
+    if shardFiles is None:
+        # Extract every shard
+        def _list_shards():
+            bucket = s3Session.Bucket(s3Bucket)
+            for obj in bucket.objects.filter(Prefix=s3ObjectKeyPrefix + S3_SHARD_KEY_PREFIX):
+                if obj.key.endswith(".tar"):
+                    yield obj.key, obj.size, {"s3ObjectKey": obj.key}
+
+        extract = partial(_extract_shard, s3Pool, s3Bucket, localDirectory=localDirectory, print_output=print_output)
+        return _run_transfer_pipeline(_list_shards(), extract, max_workers=maxWorkers, max_queue_size=maxQueueSize,
+                                      retries=retries, progress=progress)
+
+    # Fetch only the requested files, each with a single byte-range request
+    wanted = {filepath.replace(os.sep, "/").lstrip("/") for filepath in shardFiles}
+    found = set()
+
+    def _list_members():
+        for entry in _read_shard_index(s3Session, s3Bucket, s3ObjectKeyPrefix):
+            if entry["path"] in wanted:
+                found.add(entry["path"])
+                yield entry["path"], entry["size"], {"s3ObjectKey": s3ObjectKeyPrefix + entry["shard"],
+                                                     "offset": entry["offset"], "size": entry["size"],
+                                                     "localFile": os.path.join(localDirectory, *entry["path"].split("/"))}
+
+    download = partial(_download_shard_member, s3Pool, s3Bucket, print_output=print_output)
+    result = _run_transfer_pipeline(_list_members(), download, max_workers=maxWorkers, max_queue_size=maxQueueSize,
+                                    retries=retries, progress=progress)
+    for filepath in sorted(wanted - found):
+        result.failures.append((filepath, "File not found in shard index."))
+    return result
+
+
+def _log_transfer_result(result: S3TransferResult, verb: str, print_output: bool = False):
+    if not print_output:
+        return
+    logger.info("%s %d object(s) (%s) in %.1f seconds (%s/s).", verb, result.objects_transferred,
+                _convert_bytes_to_pretty_size(result.bytes_transferred), result.elapsed_seconds,
+                _convert_bytes_to_pretty_size(result.bytes_per_second))
+    if result.objects_transferred:
+        logger.info("Time per object: p50 %.3f seconds, p99 %.3f seconds, max %.3f seconds.",
+                    result.latency_percentile(50), result.latency_percentile(99), result._latencies.max)
+    if result.objects_skipped:
+        logger.info("Skipped %d unchanged or already transferred object(s).", result.objects_skipped)
+    if result.retries:
+        logger.info("Retried %d failed attempt(s).", result.retries)
+    if result.slow_downs:
+        logger.info("S3 responded with SlowDown %d time(s); requests were paused accordingly.", result.slow_downs)
+    if result.objects_deleted:
+        logger.info("Deleted %d extraneous object(s).", result.objects_deleted)
+    if result.failures:
+        logger.error("Error: %d object(s) could not be transferred.", result.objects_failed)
+        for name, error in result.failures:
+            logger.error("  %s: %s", name, error)
+
+
+def _write_transfer_metrics(metricsFile: str, result: S3TransferResult, details: Dict[str, Any]) -> None:
+    # Write the outcome and timings of a bulk transfer, along with its settings, as a JSON document
+    metrics = dict(details)
+    metrics.update({
+        "finished_at": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "elapsed_seconds": result.elapsed_seconds,
+        "objects_transferred": result.objects_transferred,
+        "bytes_transferred": result.bytes_transferred,
+        "objects_failed": result.objects_failed,
+        "objects_skipped": result.objects_skipped,
+        "objects_deleted": result.objects_deleted,
+        "retries": result.retries,
+        "slow_downs": result.slow_downs,
+        "bytes_per_second": result.bytes_per_second,
+        "objects_per_second": result.objects_transferred / result.elapsed_seconds if result.elapsed_seconds else 0.0,
+        "object_seconds": {
+            "p50": result.latency_percentile(50),
+            "p90": result.latency_percentile(90),
+            "p99": result.latency_percentile(99),
+            "max": result._latencies.max if result.objects_transferred else None,
+        },
+        "failures": [{"name": name, "error": error} for name, error in result.failures],
+        "unreadable_directories": result.unreadable_directories,
+    })
+    with open(metricsFile, "w") as fileobj:
+        json.dump(metrics, fileobj, indent=2)
+
+
+def pull_bucket_from_s3(s3_bucket: str, local_directory: str, s3_object_key_prefix: str = "", print_output: bool = False,
+                        max_workers: int = None, max_queue_size: int = None, sync: bool = False, delete: bool = False,
+                        manifest_file: str = None, multipart_threshold: int = None, multipart_chunksize: int = None,
+                        max_concurrency: int = None, max_connections: int = None, sharded: bool = False,
+                        shard_files: List[str] = None, max_listers: int = None, journal_file: str = None,
+                        max_retries: int = None, max_scanners: int = None,
+                        progress_callback: Callable[[S3TransferProgress], None] = None,
+                        metrics_file: str = None, max_bandwidth: int = None,
+                        max_requests_per_second: float = None) -> S3TransferResult:
+    if shard_files is not None:
+        sharded = True
+    if sharded and sync:
+        raise ValueError("sync cannot be combined with sharded.")
+    if sharded and journal_file:
+        raise ValueError("journal_file cannot be combined with sharded.")
+
     # Retrieve S3 access details from existing config file
     try:
         s3Endpoint, s3AccessKeyId, s3SecretAccessKey, s3VerifySSLCert, s3CACertBundle = _retrieve_s3_access_details(print_output=print_output)
@@ -92,29 +1258,187 @@ def pull_bucket_from_s3(s3_bucket: str, local_directory: str, s3_object_key_pref
     if not local_directory.endswith(os.sep):
         local_directory += os.sep
 
-    # Multithread the download operation
-    with ThreadPoolExecutor() as executor:
-        try:
-            # Instantiate S3 session
-            s3 = _instantiate_s3_session(s3Endpoint=s3Endpoint, s3AccessKeyId=s3AccessKeyId, s3SecretAccessKey=s3SecretAccessKey, s3VerifySSLCert=s3VerifySSLCert, s3CACertBundle=s3CACertBundle, print_output=print_output)
+    if not max_workers:
+        max_workers = S3_TRANSFER_WORKERS
+    if not max_queue_size:
+        max_queue_size = max_workers * S3_TRANSFER_QUEUE_DEPTH_PER_WORKER
+    if not max_listers:
+        max_listers = S3_LIST_WORKERS
+    if max_retries is None:
+        max_retries = S3_TRANSFER_RETRIES
+    if not max_scanners:
+        max_scanners = S3_SCAN_WORKERS
 
-            # Loop through all objects with prefix in bucket and download
-            bucket = s3.Bucket(s3_bucket)
-            for obj in bucket.objects.filter(Prefix=s3_object_key_prefix):
-                executor.submit(_download_from_s3, s3Endpoint=s3Endpoint, s3AccessKeyId=s3AccessKeyId, s3SecretAccessKey=s3SecretAccessKey, s3VerifySSLCert=s3VerifySSLCert, s3CACertBundle=s3CACertBundle, s3Bucket=s3_bucket, s3ObjectKey=obj.key, localFile=local_directory+obj.key, print_output=print_output)
+    transferTuning = _bulk_transfer_tuning(max_workers, multipart_threshold=multipart_threshold,
+                                           multipart_chunksize=multipart_chunksize, max_concurrency=max_concurrency,
+                                           max_connections=max_connections)
 
-        except APIConnectionError:
-            raise
+    started = time.monotonic()
+    progress = _S3ProgressTracker(progress_callback, print_output=print_output)
+    metrics = {"operation": "pull_bucket_from_s3", "bucket": s3_bucket, "prefix": s3_object_key_prefix,
+               "local_directory": local_directory, "mode": "sharded" if sharded else "sync" if sync else "full",
+               "max_workers": max_workers, "max_queue_size": max_queue_size, "max_listers": max_listers,
+               "max_connections": transferTuning.max_connections * max_workers, "max_bandwidth": max_bandwidth,
+               "max_requests_per_second": max_requests_per_second}
+
+    # Limits and SlowDown backoff shared by every S3 client of the transfer
+    rateLimiter = _S3RateLimiter(maxBandwidth=max_bandwidth, maxRequestsPerSecond=max_requests_per_second)
+
+    # One S3 session per worker thread, shared by all objects that thread downloads
+    s3Pool = _S3SessionPool(s3Endpoint=s3Endpoint, s3AccessKeyId=s3AccessKeyId, s3SecretAccessKey=s3SecretAccessKey,
+                            s3VerifySSLCert=s3VerifySSLCert, s3CACertBundle=s3CACertBundle,
+                            max_pool_connections=transferTuning.max_connections, print_output=print_output,
+                            on_create=rateLimiter.attach)
+    download = partial(_download_from_s3, s3Endpoint=s3Endpoint, s3AccessKeyId=s3AccessKeyId, s3SecretAccessKey=s3SecretAccessKey,
+                       s3VerifySSLCert=s3VerifySSLCert, s3CACertBundle=s3CACertBundle, s3Bucket=s3_bucket,
+                       print_output=print_output, s3Pool=s3Pool, transferTuning=transferTuning)
 
+    if sharded:
+        try:
+            s3 = rateLimiter.attach(_instantiate_s3_session(s3Endpoint=s3Endpoint, s3AccessKeyId=s3AccessKeyId, s3SecretAccessKey=s3SecretAccessKey, s3VerifySSLCert=s3VerifySSLCert, s3CACertBundle=s3CACertBundle, print_output=print_output))
+            result = _pull_shards(s3, s3Pool, s3Bucket=s3_bucket, localDirectory=local_directory,
+                                  s3ObjectKeyPrefix=s3_object_key_prefix, shardFiles=shard_files,
+                                  maxWorkers=max_workers, maxQueueSize=max_queue_size, retries=max_retries,
+                                  progress=progress, print_output=print_output)
         except Exception as err:
             if print_output:
                 logger.error("Error: S3 API error: %s", err)
             raise APIConnectionError(err)
+        result.elapsed_seconds = time.monotonic() - started
+        result.slow_downs = rateLimiter.slow_downs
+        _log_transfer_result(result, "Downloaded" if shard_files is not None else "Extracted", print_output=print_output)
+        if metrics_file:
+            _write_transfer_metrics(metrics_file, result, metrics)
+        logger.info("Download complete.")
+        return result
+
+    journal = None
+    if journal_file:
+        journal = _S3TransferJournal(journal_file, direction="pull", s3Bucket=s3_bucket, s3ObjectKeyPrefix=s3_object_key_prefix)
+        journal.open()
+
+    manifest = None
+    skipped = 0
+    remoteKeys = set()
+    if sync:
+        manifest = _S3SyncManifest(manifest_file or os.path.join(local_directory, S3_SYNC_MANIFEST_FILENAME),
+                                   s3Bucket=s3_bucket, s3ObjectKeyPrefix=s3_object_key_prefix)
+        manifest.load()
+
+        def _download_and_record(s3ObjectKey: str, localFile: str, objectSize: int, etag: str):
+            download(s3ObjectKey=s3ObjectKey, localFile=localFile, objectSize=objectSize)
+            manifest.record(s3ObjectKey, localFile, etag=etag)
 
+    def _is_unchanged(obj, localFile: str) -> bool:
+        localStat = _stat_or_none(localFile)
+        if localStat is None or localStat.st_size != obj.size:
+            return False
+        entry = manifest.get(obj.key)
+        if entry is not None and entry.get("etag"):
+            # Same remote object as last time and the local copy has not been modified since
+            return entry["etag"] == obj.e_tag and manifest.matches_local_file(obj.key, localStat)
+        # Not in the manifest; fall back to comparing against the object's modification time
+        if localStat.st_mtime >= obj.last_modified.timestamp():
+            manifest.record(obj.key, localFile, etag=obj.e_tag)
+            return True
+        return False
+
+    def _list_objects():
+        nonlocal skipped
+        # Partitions of the bucket are listed concurrently, and downloads start with the first page listed
+        s3 = rateLimiter.attach(_instantiate_s3_session(s3Endpoint=s3Endpoint, s3AccessKeyId=s3AccessKeyId, s3SecretAccessKey=s3SecretAccessKey, s3VerifySSLCert=s3VerifySSLCert, s3CACertBundle=s3CACertBundle, print_output=print_output,
+                                                        max_pool_connections=max_listers))
+        for obj in _list_objects_in_parallel(s3.meta.client, s3_bucket, s3_object_key_prefix, maxListers=max_listers):
+            localFile = local_directory+obj.key
+            transferArgs = {"s3ObjectKey": obj.key, "localFile": localFile, "objectSize": obj.size}
+            if sync:
+                if delete:
+                    remoteKeys.add(obj.key)
+                if _is_unchanged(obj, localFile):
+                    skipped += 1
+                    continue
+                transferArgs["etag"] = obj.e_tag
+            if journal:
+                # Completed by an earlier run of the same transfer
+                localStat = _stat_or_none(localFile)
+                if localStat and localStat.st_size == obj.size and journal.is_done(obj.key, etag=obj.e_tag):
+                    skipped += 1
+                    continue
+                transferArgs.update(journalKey=obj.key, journalAttributes={"etag": obj.e_tag})
+            yield obj.key, obj.size, transferArgs
+
+    transfer = _download_and_record if sync else download
+    if journal:
+        transfer = _journaled_transfer(transfer, journal)
+
+    # Multithread the download operation
+    try:
+        result = _run_transfer_pipeline(_list_objects(), transfer, max_workers=max_workers,
+                                        max_queue_size=max_queue_size, retries=max_retries, progress=progress)
+    except Exception as err:
+        if print_output:
+            logger.error("Error: S3 API error: %s", err)
+        raise APIConnectionError(err)
+    finally:
+        if manifest:
+            manifest.save()
+        if journal:
+            journal.close()
+
+    result.objects_skipped = skipped
+    if sync:
+        if delete:
+            result.objects_deleted = _delete_extraneous_local_files(local_directory, s3_object_key_prefix, remoteKeys,
+                                                                    manifest, maxScanners=max_scanners,
+                                                                    keepFiles=[manifest.path, journal_file],
+                                                                    unreadableDirectories=result.unreadable_directories,
+                                                                    print_output=print_output)
+            manifest.save()
+
+    result.elapsed_seconds = time.monotonic() - started
+    result.slow_downs = rateLimiter.slow_downs
+    _log_transfer_result(result, "Downloaded", print_output=print_output)
+    if metrics_file:
+        _write_transfer_metrics(metrics_file, result, metrics)
     logger.info("Download complete.")
+    return result
+
+
+def _delete_extraneous_local_files(localDirectory: str, s3ObjectKeyPrefix: str, remoteKeys: set,
+                                   manifest: _S3SyncManifest, maxScanners: int = S3_SCAN_WORKERS,
+                                   keepFiles: Iterable[Optional[str]] = (),
+                                   unreadableDirectories: Optional[List[str]] = None, print_output: bool = False) -> int:
+    # Remove local files under the prefix that no longer exist in the bucket. Hidden files and
+    # directories are never synced, so the scan skips them and they are never deleted either.
+    # keepFiles (the manifest and journal of the transfer) are never deleted, even when they are
+    # not hidden and sit inside the local directory; they are matched by inode, not by path.
+    # Files are removed once the scan is complete, so that no directory is modified while being read.
+    keptInodes = set()
+    for keepFile in keepFiles:
+        keepStat = _stat_or_none(keepFile) if keepFile else None
+        if keepStat is not None:
+            keptInodes.add((keepStat.st_dev, keepStat.st_ino))
+
+    extraneousFiles = []
+    for localFile, filepath, localStat in _scan_directory_in_parallel(localDirectory, maxScanners=maxScanners,
+                                                                      unreadableDirectories=unreadableDirectories):
+        s3ObjectKey = filepath.replace(os.sep, "/")
+        if localStat is not None and (localStat.st_dev, localStat.st_ino) in keptInodes:
+            continue
+        if s3ObjectKey.startswith(s3ObjectKeyPrefix) and s3ObjectKey not in remoteKeys:
+            extraneousFiles.append((localFile, s3ObjectKey))
+
+    for localFile, s3ObjectKey in extraneousFiles:
+        if print_output:
+            logger.info("Deleting local file '%s', which does not exist in S3.", localFile)
+        os.remove(localFile)
+        manifest.remove(s3ObjectKey)
+    return len(extraneousFiles)
 
 
-def pull_object_from_s3(s3_bucket: str, s3_object_key: str, local_file: str = None, print_output: bool = False):
+def pull_object_from_s3(s3_bucket: str, s3_object_key: str, local_file: str = None, print_output: bool = False,
+                        multipart_threshold: int = None, multipart_chunksize: int = None, max_concurrency: int = None,
+                        max_connections: int = None):
     # Retrieve S3 access details from existing config file
     try:
         s3Endpoint, s3AccessKeyId, s3SecretAccessKey, s3VerifySSLCert, s3CACertBundle = _retrieve_s3_access_details(print_output=print_output)
@@ -125,9 +1449,14 @@ def pull_object_from_s3(s3_bucket: str, s3_object_key: str, local_file: str = No
     if not local_file:
         local_file = s3_object_key
 
+    transferTuning = _S3TransferTuning(multipart_threshold=multipart_threshold, multipart_chunksize=multipart_chunksize,
+                                       max_concurrency=max_concurrency,
+                                       max_connections=max_connections or S3_SINGLE_TRANSFER_MAX_CONNECTIONS)
+
     # Upload file
     try:
-        _download_from_s3(s3Endpoint=s3Endpoint, s3AccessKeyId=s3AccessKeyId, s3SecretAccessKey=s3SecretAccessKey, s3VerifySSLCert=s3VerifySSLCert, s3CACertBundle=s3CACertBundle, s3Bucket=s3_bucket, s3ObjectKey=s3_object_key, localFile=local_file, print_output=print_output)
+        _download_from_s3(s3Endpoint=s3Endpoint, s3AccessKeyId=s3AccessKeyId, s3SecretAccessKey=s3SecretAccessKey, s3VerifySSLCert=s3VerifySSLCert, s3CACertBundle=s3CACertBundle, s3Bucket=s3_bucket, s3ObjectKey=s3_object_key, localFile=local_file, print_output=print_output, transferTuning=transferTuning,
+                          rangedDownload=True)
     except APIConnectionError:
         raise
 
@@ -135,49 +1464,253 @@ def pull_object_from_s3(s3_bucket: str, s3_object_key: str, local_file: str = No
 
 
 def push_directory_to_s3(s3_bucket: str, local_directory: str, s3_object_key_prefix: str = "",
-                         s3_extra_args: str = None, print_output: bool = False):
+                         s3_extra_args: str = None, print_output: bool = False,
+                         max_workers: int = None, max_queue_size: int = None, sync: bool = False, delete: bool = False,
+                         manifest_file: str = None, multipart_threshold: int = None, multipart_chunksize: int = None,
+                         max_concurrency: int = None, max_connections: int = None, shard_size: int = None,
+                         shard_staging_directory: str = None, max_listers: int = None, journal_file: str = None,
+                         max_retries: int = None, max_scanners: int = None,
+                         progress_callback: Callable[[S3TransferProgress], None] = None,
+                         metrics_file: str = None, max_bandwidth: int = None,
+                         max_requests_per_second: float = None) -> S3TransferResult:
+    if shard_size and sync:
+        raise ValueError("sync cannot be combined with shard_size.")
+    if shard_size and journal_file:
+        raise ValueError("journal_file cannot be combined with shard_size.")
+    # Listing "run1" also returns "run10/..." and "run1-old/...", which must never be deleted
+    if sync and delete and s3_object_key_prefix and not s3_object_key_prefix.endswith("/"):
+        raise ValueError("delete requires an s3_object_key_prefix that ends with '/'.")
+
     # Retrieve S3 access details from existing config file
     try:
         s3Endpoint, s3AccessKeyId, s3SecretAccessKey, s3VerifySSLCert, s3CACertBundle = _retrieve_s3_access_details(print_output=print_output)
     except InvalidConfigError:
         raise
 
+    if not max_workers:
+        max_workers = S3_TRANSFER_WORKERS
+    if not max_queue_size:
+        max_queue_size = max_workers * S3_TRANSFER_QUEUE_DEPTH_PER_WORKER
+    if not max_listers:
+        max_listers = S3_LIST_WORKERS
+    if max_retries is None:
+        max_retries = S3_TRANSFER_RETRIES
+    if not max_scanners:
+        max_scanners = S3_SCAN_WORKERS
+
+    transferTuning = _bulk_transfer_tuning(max_workers, multipart_threshold=multipart_threshold,
+                                           multipart_chunksize=multipart_chunksize, max_concurrency=max_concurrency,
+                                           max_connections=max_connections)
+
+    started = time.monotonic()
+    progress = _S3ProgressTracker(progress_callback, print_output=print_output)
+    metrics = {"operation": "push_directory_to_s3", "bucket": s3_bucket, "prefix": s3_object_key_prefix,
+               "local_directory": local_directory, "mode": "sharded" if shard_size else "sync" if sync else "full",
+               "max_workers": max_workers, "max_queue_size": max_queue_size, "max_scanners": max_scanners,
+               "max_connections": transferTuning.max_connections * max_workers, "max_bandwidth": max_bandwidth,
+               "max_requests_per_second": max_requests_per_second}
+
+    # Limits and SlowDown backoff shared by every S3 client of the transfer
+    rateLimiter = _S3RateLimiter(maxBandwidth=max_bandwidth, maxRequestsPerSecond=max_requests_per_second)
+
+    journal = None
+    if journal_file:
+        journal = _S3TransferJournal(journal_file, direction="push", s3Bucket=s3_bucket, s3ObjectKeyPrefix=s3_object_key_prefix)
+        journal.open()
+
+    # One S3 session per worker thread, shared by all files that thread uploads
+    s3Pool = _S3SessionPool(s3Endpoint=s3Endpoint, s3AccessKeyId=s3AccessKeyId, s3SecretAccessKey=s3SecretAccessKey,
+                            s3VerifySSLCert=s3VerifySSLCert, s3CACertBundle=s3CACertBundle,
+                            max_pool_connections=transferTuning.max_connections, print_output=print_output,
+                            on_create=rateLimiter.attach)
+    upload = partial(_upload_to_s3, s3Endpoint=s3Endpoint, s3AccessKeyId=s3AccessKeyId, s3SecretAccessKey=s3SecretAccessKey,
+                     s3VerifySSLCert=s3VerifySSLCert, s3CACertBundle=s3CACertBundle, s3Bucket=s3_bucket,
+                     s3ExtraArgs=s3_extra_args, print_output=print_output, s3Pool=s3Pool, transferTuning=transferTuning,
+                     journal=journal)
+
+    if shard_size:
+        try:
+            result = _push_directory_as_shards(s3Bucket=s3_bucket, localDirectory=local_directory,
+                                               s3ObjectKeyPrefix=s3_object_key_prefix, shardSize=shard_size,
+                                               stagingDirectory=shard_staging_directory, upload=upload,
+                                               maxWorkers=max_workers, retries=max_retries, maxScanners=max_scanners,
+                                               progress=progress, print_output=print_output)
+        except APIConnectionError:
+            raise
+        except Exception as err:
+            if print_output:
+                logger.error("Error: %s", err)
+            raise APIConnectionError(err)
+        result.elapsed_seconds = time.monotonic() - started
+        result.slow_downs = rateLimiter.slow_downs
+        _log_transfer_result(result, "Uploaded", print_output=print_output)
+        if metrics_file:
+            _write_transfer_metrics(metrics_file, result, metrics)
+        logger.info("Upload complete.")
+        return result
+
+    manifest = None
+    skipped = 0
+    remoteObjects = {}  # type: Dict[str, Any]
+    localKeys = set()
+    unreadableDirectories = []  # type: List[str]
+    if sync:
+        manifest = _S3SyncManifest(manifest_file or os.path.join(local_directory, S3_SYNC_MANIFEST_FILENAME),
+                                   s3Bucket=s3_bucket, s3ObjectKeyPrefix=s3_object_key_prefix)
+        manifest.load()
+
+        # A single listing of the prefix replaces a HEAD request per file
+        try:
+            s3 = rateLimiter.attach(_instantiate_s3_session(s3Endpoint=s3Endpoint, s3AccessKeyId=s3AccessKeyId, s3SecretAccessKey=s3SecretAccessKey, s3VerifySSLCert=s3VerifySSLCert, s3CACertBundle=s3CACertBundle, print_output=print_output,
+                                                            max_pool_connections=max_listers))
+            for obj in _list_objects_in_parallel(s3.meta.client, s3_bucket, s3_object_key_prefix, maxListers=max_listers):
+                remoteObjects[obj.key] = (obj.size, obj.e_tag, obj.last_modified)
+        except Exception as err:
+            if print_output:
+                logger.error("Error: S3 API error: %s", err)
+            raise APIConnectionError(err)
+
+        def _upload_and_record(localFile: str, s3ObjectKey: str, localStat: Optional[os.stat_result] = None):
+            upload(localFile=localFile, s3ObjectKey=s3ObjectKey)
+            # The new ETag is picked up from the listing of the next sync. The stat from the directory
+            # scan is recorded, so that a file modified during its upload is pushed again next time.
+            manifest.record(s3ObjectKey, localFile, localStat=localStat)
+
+    def _is_unchanged(s3ObjectKey: str, localFile: str, localStat: Optional[os.stat_result]) -> bool:
+        if s3ObjectKey not in remoteObjects:
+            return False
+        remoteSize, remoteEtag, remoteLastModified = remoteObjects[s3ObjectKey]
+        if localStat is None or localStat.st_size != remoteSize:
+            return False
+        entry = manifest.get(s3ObjectKey)
+        if entry is not None:
+            # Unchanged locally since the last transfer, and not replaced in S3 since then
+            if not manifest.matches_local_file(s3ObjectKey, localStat) or entry.get("etag") not in (None, remoteEtag):
+                return False
+        elif localStat.st_mtime > remoteLastModified.timestamp():
+            # Not in the manifest; the local file was modified after the object was written
+            return False
+        manifest.record(s3ObjectKey, localFile, etag=remoteEtag, localStat=localStat)
+        return True
+
+    def _list_files():
+        nonlocal skipped
+        # Directories are read in parallel, and files are queued for upload as soon as they are found
+        for localFile, filepath, localStat in _scan_directory_in_parallel(local_directory, maxScanners=max_scanners,
+                                                                          unreadableDirectories=unreadableDirectories):
+            # Set S3 object details
+            s3ObjectKey = s3_object_key_prefix + filepath
+            # A file that could not be stat'ed is reported as a failure by the upload itself
+            size = localStat.st_size if localStat else 0
+
+            if sync:
+                if delete:
+                    localKeys.add(s3ObjectKey)
+                if _is_unchanged(s3ObjectKey, localFile, localStat):
+                    skipped += 1
+                    continue
+
+            transferArgs = {"localFile": localFile, "s3ObjectKey": s3ObjectKey}
+            if sync:
+                transferArgs["localStat"] = localStat
+            if journal and localStat:
+                # Completed by an earlier run of the same transfer, and not modified since
+                fileAttributes = {"size": localStat.st_size, "mtime_ns": localStat.st_mtime_ns}
+                if journal.is_done(s3ObjectKey, **fileAttributes):
+                    skipped += 1
+                    continue
+                transferArgs.update(journalKey=s3ObjectKey, journalAttributes=fileAttributes)
+
+            yield localFile, size, transferArgs
+
+    transfer = _upload_and_record if sync else upload
+
     # Multithread the upload operation
-    with ThreadPoolExecutor() as executor:
-        # Loop through all files in directory
-        for dirpath, dirnames, filenames in os.walk(local_directory):
-            # Exclude hidden files and directories
-            filenames = [filename for filename in filenames if not filename[0] == '.']
-            dirnames[:] = [dirname for dirname in dirnames if not dirname[0] == '.']
-
-            for filename in filenames:
-                # Build filepath
-                if local_directory.endswith(os.sep):
-                    dirpathBeginIndex = len(local_directory)
-                else:
-                    dirpathBeginIndex = len(local_directory) + 1
-
-                subdirpath = dirpath[dirpathBeginIndex:]
-
-                if subdirpath:
-                    filepath = subdirpath + os.sep + filename
-                else:
-                    filepath = filename
-
-                # Set S3 object details
-                s3ObjectKey = s3_object_key_prefix + filepath
-                localFile = dirpath + os.sep + filename
-
-                # Upload file
-                try:
-                    executor.submit(_upload_to_s3, s3Endpoint=s3Endpoint, s3AccessKeyId=s3AccessKeyId, s3SecretAccessKey=s3SecretAccessKey, s3VerifySSLCert=s3VerifySSLCert, s3CACertBundle=s3CACertBundle, s3Bucket=s3_bucket, localFile=localFile, s3ObjectKey=s3ObjectKey, s3ExtraArgs=s3_extra_args, print_output=print_output)
-                except APIConnectionError:
-                    raise
+    try:
+        result = _run_transfer_pipeline(_list_files(), _journaled_transfer(transfer, journal) if journal else transfer,
+                                        max_workers=max_workers, max_queue_size=max_queue_size, retries=max_retries,
+                                        progress=progress)
+    except Exception as err:
+        if print_output:
+            logger.error("Error: S3 API error: %s", err)
+        raise APIConnectionError(err)
+    finally:
+        if manifest:
+            manifest.save()
+        if journal:
+            journal.close()
+
+    result.objects_skipped = skipped
+    result.unreadable_directories = unreadableDirectories
+    if sync:
+        if delete and unreadableDirectories:
+            # Files in a directory that could not be read may still exist, so no object can be
+            # shown to be extraneous
+            if print_output:
+                logger.error("Error: Extraneous objects were not deleted, because these local directories could not be read: %s",
+                             ", ".join(sorted(unreadableDirectories)))
+        elif delete:
+            # Hidden files are never pushed, so objects with a hidden path component below the
+            # prefix are never treated as extraneous either
+            extraneousKeys = [key for key in remoteObjects
+                              if key not in localKeys and not _has_hidden_component(key[len(s3_object_key_prefix):])]
+            result.objects_deleted = _delete_extraneous_objects(s3Endpoint=s3Endpoint, s3AccessKeyId=s3AccessKeyId,
+                                                                s3SecretAccessKey=s3SecretAccessKey, s3VerifySSLCert=s3VerifySSLCert,
+                                                                s3CACertBundle=s3CACertBundle, s3Bucket=s3_bucket,
+                                                                s3ObjectKeys=extraneousKeys, manifest=manifest,
+                                                                rateLimiter=rateLimiter, print_output=print_output)
+            manifest.save()
 
+    result.elapsed_seconds = time.monotonic() - started
+    result.slow_downs = rateLimiter.slow_downs
+    _log_transfer_result(result, "Uploaded", print_output=print_output)
+    if metrics_file:
+        _write_transfer_metrics(metrics_file, result, metrics)
     logger.info("Upload complete.")
+    return result
+
+
+def _has_hidden_component(relativeKey: str) -> bool:
+    # True if any file or directory name in an object key (relative to the key prefix) is hidden
+    return any(name.startswith(".") for name in relativeKey.split("/"))
+
 
+def _delete_extraneous_objects(s3Endpoint: str, s3AccessKeyId: str, s3SecretAccessKey: str, s3VerifySSLCert: bool,
+                               s3CACertBundle: str, s3Bucket: str, s3ObjectKeys: List[str], manifest: _S3SyncManifest,
+                               rateLimiter: Optional[_S3RateLimiter] = None, print_output: bool = False) -> int:
+    # Remove objects under the prefix that no longer exist locally, in as few requests as possible
+    if not s3ObjectKeys:
+        return 0
+    try:
+        s3 = _instantiate_s3_session(s3Endpoint=s3Endpoint, s3AccessKeyId=s3AccessKeyId, s3SecretAccessKey=s3SecretAccessKey, s3VerifySSLCert=s3VerifySSLCert, s3CACertBundle=s3CACertBundle, print_output=print_output)
+        if rateLimiter:
+            rateLimiter.attach(s3)
+        bucket = s3.Bucket(s3Bucket)
+        deleted = 0
+        for start in range(0, len(s3ObjectKeys), S3_DELETE_BATCH_SIZE):
+            batch = s3ObjectKeys[start:start + S3_DELETE_BATCH_SIZE]
+            if print_output:
+                logger.info("Deleting %d object(s) from bucket '%s', which do not exist locally.", len(batch), s3Bucket)
+            response = bucket.delete_objects(Delete={"Objects": [{"Key": key} for key in batch], "Quiet": True})
+            errors = response.get("Errors", [])
+            for error in errors:
+                if print_output:
+                    logger.error("Error: Could not delete object '%s': %s", error.get("Key"), error.get("Message"))
+            failedKeys = {error.get("Key") for error in errors}
+            for key in batch:
+                if key not in failedKeys:
+                    manifest.remove(key)
+                    deleted += 1
+    except Exception as err:
+        if print_output:
+            logger.error("Error: S3 API error: %s", err)
+        raise APIConnectionError(err)
+    return deleted
 
-def push_file_to_s3(s3_bucket: str, local_file: str, s3_object_key: str = None, s3_extra_args: str = None, print_output: bool = False):
+
+def push_file_to_s3(s3_bucket: str, local_file: str, s3_object_key: str = None, s3_extra_args: str = None, print_output: bool = False,
+                    multipart_threshold: int = None, multipart_chunksize: int = None, max_concurrency: int = None,
+                    max_connections: int = None):
     # Retrieve S3 access details from existing config file
     try:
         s3Endpoint, s3AccessKeyId, s3SecretAccessKey, s3VerifySSLCert, s3CACertBundle = _retrieve_s3_access_details(print_output=print_output)
@@ -188,9 +1721,13 @@ def push_file_to_s3(s3_bucket: str, local_file: str, s3_object_key: str = None,
     if not s3_object_key:
         s3_object_key = local_file
 
+    transferTuning = _S3TransferTuning(multipart_threshold=multipart_threshold, multipart_chunksize=multipart_chunksize,
+                                       max_concurrency=max_concurrency,
+                                       max_connections=max_connections or S3_SINGLE_TRANSFER_MAX_CONNECTIONS)
+
     # Upload file
     try:
-        _upload_to_s3(s3Endpoint=s3Endpoint, s3AccessKeyId=s3AccessKeyId, s3SecretAccessKey=s3SecretAccessKey, s3VerifySSLCert=s3VerifySSLCert, s3CACertBundle=s3CACertBundle, s3Bucket=s3_bucket, localFile=local_file, s3ObjectKey=s3_object_key, s3ExtraArgs=s3_extra_args, print_output=print_output)
+        _upload_to_s3(s3Endpoint=s3Endpoint, s3AccessKeyId=s3AccessKeyId, s3SecretAccessKey=s3SecretAccessKey, s3VerifySSLCert=s3VerifySSLCert, s3CACertBundle=s3CACertBundle, s3Bucket=s3_bucket, localFile=local_file, s3ObjectKey=s3_object_key, s3ExtraArgs=s3_extra_args, print_output=print_output, transferTuning=transferTuning)
     except APIConnectionError:
         raise
 
@@ -5,5 +5,6 @@ This package provides high-level dataset abstraction functionality for managing
 data stored on ONTAP volumes through an intuitive dataset interface.
 """
 
-from .dataset import Dataset, get_datasets
+from .dataset import Dataset, DatasetFile, get_datasets
+from .file_index import DatasetFileIndex
 from .exceptions import DatasetError, DatasetNotFoundError, DatasetExistsError
@@ -7,7 +7,7 @@ into a simple dataset interface for Data Engineers and Data Scientists.
 
 import os
 import time
-from typing import List, Dict, Optional, Any
+from typing import Iterator, List, Dict, NamedTuple, Optional, Any
 
 from netapp_dataops.logging_utils import setup_logger
 from ..exceptions import (
@@ -15,13 +15,13 @@ from ..exceptions import (
 )
 from ..core import (
     _retrieve_config,
-    _instantiate_connection,
     _convert_bytes_to_pretty_size,
-    _sizes_are_equivalent
+    _sizes_are_equivalent,
+    _scan_directory_tree
 )
 from ..ontap.volume_operations import (
     create_volume,
-    clone_volume,
+    clone_volumes,
     delete_volume,
     get_volume,
     list_volumes
@@ -39,6 +39,36 @@ from .exceptions import (
 
 logger = setup_logger(__name__)
 
+# Number of directories read concurrently when listing the files in a dataset
+DATASET_SCAN_WORKERS = 16
+
+# Number of files handed over by a directory reader at a time
+DATASET_SCAN_BATCH_SIZE = 1000
+
+# Polling of the root mountpoint for the junction of a new dataset volume to appear:
+# first interval, maximum interval and overall timeout, in seconds
+DATASET_JUNCTION_POLL_INTERVAL = 0.05
+DATASET_JUNCTION_POLL_MAX_INTERVAL = 1.0
+DATASET_JUNCTION_POLL_TIMEOUT = 30.0
+
+
+class DatasetFile(NamedTuple):
+    """A file in a dataset, as returned by ``Dataset.iter_files()``."""
+
+    filepath: str
+    size: int
+    mtime: float
+
+    @property
+    def filename(self) -> str:
+        """Name of the file."""
+        return os.path.basename(self.filepath)
+
+    @property
+    def size_human(self) -> str:
+        """Human-readable file size."""
+        return _convert_bytes_to_pretty_size(self.size)
+
 
 class Dataset:
     """
@@ -225,7 +255,7 @@ class Dataset:
         """Bind to an existing dataset volume."""
         self.max_size = volume.get("Size")
         self.is_clone = self._is_volume_clone(volume)
-        self.source_dataset_name = volume.get("Clone Parent Volume") if self.is_clone else None
+        self.source_dataset_name = (volume.get("Clone Parent Volume") or volume.get("Source Volume")) if self.is_clone else None
         self.local_file_path = os.path.join(self._root_mountpoint, self.name)
         
         # Validate max_size if provided - use normalized comparison
@@ -241,12 +271,26 @@ class Dataset:
     def _refresh_nfs_namespace(self):
         """
         Refresh NFS client's view of the namespace to discover newly junctioned volumes.
+        
+        Lists the root mountpoint, backing off between attempts, until the
+        dataset's directory appears or DATASET_JUNCTION_POLL_TIMEOUT expires.
         """
-        try:
-            os.listdir(self._root_mountpoint)
-            time.sleep(1)
-        except OSError:
-            pass
+        deadline = time.monotonic() + DATASET_JUNCTION_POLL_TIMEOUT
+        interval = DATASET_JUNCTION_POLL_INTERVAL
+        while True:
+            try:
+                # Listing the root directory revalidates the client's cached view of it
+                if self.name in os.listdir(self._root_mountpoint) and os.path.isdir(self.local_file_path):
+                    return
+            except OSError:
+                pass
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                if self.print_output:
+                    logger.info(f"Warning: Dataset directory '{self.local_file_path}' is not visible yet")
+                return
+            time.sleep(min(interval, remaining))
+            interval = min(interval * 2, DATASET_JUNCTION_POLL_MAX_INTERVAL)
     
 
     
@@ -280,36 +324,148 @@ class Dataset:
         except Exception as e:
             raise DatasetVolumeError(f"Failed to create dataset '{self.name}': {str(e)}")
     
+    def iter_files(self, max_workers: int = DATASET_SCAN_WORKERS) -> Iterator[DatasetFile]:
+        """
+        Iterate over all files in the dataset.
+        
+        Subdirectories are read concurrently on up to max_workers threads, so
+        files are yielded in no particular order, as soon as their directory
+        has been read. Directories are told apart from files using the
+        directory listing alone on most platforms, but file sizes and
+        modification times take one stat call per file, except on Windows
+        where the listing includes them. As with os.walk, symbolic links to
+        directories are not followed and unreadable directories are skipped.
+        A file that cannot be stat'ed, such as a broken symbolic link or a
+        file removed while listing, raises DatasetError.
+        
+        Args:
+            max_workers: Maximum number of directories to read at once
+            
+        Yields:
+            DatasetFile records with filepath, size (in bytes) and mtime, plus
+            filename and size_human properties
+            
+        Raises:
+            DatasetError: If the dataset cannot be listed
+        """
+        if not os.path.exists(self.local_file_path):
+            return
+        
+        try:
+            for filepath, _, stat in _scan_directory_tree(self.local_file_path, maxWorkers=max(1, max_workers),
+                                                          batchSize=DATASET_SCAN_BATCH_SIZE):
+                if stat is None:
+                    # Raises the error that prevented the directory entry from being stat'ed
+                    stat = os.stat(filepath)
+                yield DatasetFile(filepath, stat.st_size, stat.st_mtime)
+        except Exception as e:
+            raise DatasetError(f"Failed to list files in dataset: {str(e)}")
+    
     def get_files(self) -> List[Dict[str, Any]]:
         """
         Get a list of all files in the dataset.
         
+        For large datasets, prefer iter_files(), which streams compact records
+        instead of building the whole list.
+        
         Returns:
             List of dictionaries containing file information:
             - filename: Name of the file
             - filepath: Full path to the file
             - size: File size in bytes
             - size_human: Human-readable file size
+            
+        Raises:
+            DatasetError: If the dataset cannot be listed, or a file in it
+                cannot be stat'ed
         """
-        files = []
-        try:
-            if not os.path.exists(self.local_file_path):
-                return files
-                
-            for root, dirs, filenames in os.walk(self.local_file_path):
-                for filename in filenames:
-                    filepath = os.path.join(root, filename)
-                    stat = os.stat(filepath)
-                    files.append({
-                        'filename': filename,
-                        'filepath': filepath,
-                        'size': stat.st_size,
-                        'size_human': _convert_bytes_to_pretty_size(stat.st_size)
-                    })
-        except Exception as e:
-            raise DatasetError(f"Failed to list files in dataset: {str(e)}")
+        return [{
+            'filename': file.filename,
+            'filepath': file.filepath,
+            'size': file.size,
+            'size_human': file.size_human
+        } for file in self.iter_files()]
+    
+    def get_file_index(self, refresh: bool = True, full: bool = False, checksums: bool = False,
+                       max_workers: int = DATASET_SCAN_WORKERS, index_path: Optional[str] = None) -> 'DatasetFileIndex':
+        """
+        Open the persistent file index of the dataset.
+        
+        The index is stored in ~/.netapp_dataops/dataset_index unless another
+        index_path is given, and is kept between calls and processes. Refreshing
+        it only reads directories that changed since the previous refresh.
         
-        return files
+        Args:
+            refresh: Bring the index up to date before returning it
+            full: Re-read all directories when refreshing, to pick up files
+                rewritten in place
+            checksums: Also compute SHA-256 checksums of new and changed files
+            max_workers: Maximum number of directories read at once
+            index_path: Optional path of the index database
+            
+        Returns:
+            DatasetFileIndex for the dataset (close it when done, or use it as
+            a context manager)
+            
+        Raises:
+            DatasetError: If the index cannot be opened or refreshed
+        """
+        from .file_index import DatasetFileIndex
+        
+        index = DatasetFileIndex(self.local_file_path, index_path or self._default_index_path())
+        if refresh:
+            try:
+                index.refresh(full=full, checksums=checksums, max_workers=max_workers)
+            except DatasetError:
+                index.close()
+                raise
+        return index
+    
+    def fingerprint(self, max_workers: int = DATASET_SCAN_WORKERS, index_path: Optional[str] = None) -> str:
+        """
+        Compute a hash of the dataset's contents, for checking that two datasets
+        (for example a dataset and its clone) hold identical data.
+        
+        Files are checksummed concurrently and combined into a Merkle-style
+        tree hash per directory (see DatasetFileIndex.directory_hashes()); the
+        hash of the dataset directory is returned. File checksums are cached in
+        the dataset's file index, keyed by inode, size and modification time,
+        so fingerprinting again after small changes only rehashes the files
+        that changed.
+        
+        Args:
+            max_workers: Maximum number of directories read, and files
+                checksummed, at once
+            index_path: Optional path of the file index database
+            
+        Returns:
+            Hex digest identifying the names and contents of all files in the dataset
+            
+        Raises:
+            DatasetError: If the dataset, or any directory or file in it,
+                cannot be read
+        """
+        # A full refresh stats every file, so that files rewritten in place are rehashed
+        with self.get_file_index(full=True, checksums=True, max_workers=max_workers, index_path=index_path) as index:
+            # The index keeps unreadable directories as previously indexed, which would hash stale contents
+            if index.unreadable_directories:
+                unreadable = ", ".join(f"'{os.path.join(self.local_file_path, path)}'"
+                                       for path in sorted(index.unreadable_directories))
+                raise DatasetError(f"Failed to fingerprint dataset '{self.name}': directories could not be read: "
+                                   f"{unreadable}")
+            hashes = index.directory_hashes()
+        if "" not in hashes:
+            raise DatasetError(f"Dataset directory '{self.local_file_path}' could not be read")
+        
+        if self.print_output:
+            logger.info(f"Fingerprint of dataset '{self.name}': {hashes['']}")
+        return hashes[""]
+    
+    def _default_index_path(self) -> str:
+        """Location of the dataset's file index in the user's configuration directory."""
+        from .file_index import DATASET_INDEX_DIR
+        
+        return os.path.join(os.path.expanduser(DATASET_INDEX_DIR), self._root_volume_name, f"{self.name}.sqlite")
     
     def clone(self, name: str) -> 'Dataset':
         """
@@ -325,37 +481,43 @@ class Dataset:
             DatasetExistsError: If a dataset with the given name already exists
             DatasetVolumeError: If the clone operation fails
         """
-        # Check if clone already exists
-        existing_clone = Dataset._check_dataset_exists(name)
-        if existing_clone:
-            raise DatasetExistsError(f"Dataset '{name}' already exists")
-        
         try:
-            # Calculate junction path for clone
-            junction_path = f"/{self._root_volume_name}/{name}"
-            
-            # Clone the volume
-            clone_volume(
-                new_volume_name=name,
-                source_volume_name=self.name,
-                junction=junction_path,
-                export_policy=self._root_export_policy,
+            # Create the clone volume; existence of the name, the source volume and
+            # the export policy (the root volume's, or the configured default) are
+            # validated with a few bulk queries
+            result = clone_volumes(
+                specs=[{
+                    "new_volume_name": name,
+                    "source_volume_name": self.name,
+                    "junction": f"/{self._root_volume_name}/{name}",
+                    "export_policy": self._root_export_policy
+                }],
                 print_output=self.print_output
-            )
-            
-            if self.print_output:
-                logger.info(f"Created clone '{name}' from dataset '{self.name}'")
-            
-            # Create the Dataset instance for the clone
-            cloned_dataset = Dataset(name=name, print_output=self.print_output)
-            
-            # Refresh NFS namespace
-            cloned_dataset._refresh_nfs_namespace()
-            
-            return cloned_dataset
-            
+            )[0]
         except Exception as e:
             raise DatasetVolumeError(f"Failed to clone dataset '{self.name}' to '{name}': {str(e)}")
+        
+        if result["Status"] != "created":
+            if result["Reason"] == "exists":
+                raise DatasetExistsError(f"Dataset '{name}' already exists")
+            raise DatasetVolumeError(f"Failed to clone dataset '{self.name}' to '{name}': {result['Error']}")
+        
+        if self.print_output:
+            logger.info(f"Created clone '{name}' from dataset '{self.name}'")
+        
+        # A FlexClone has the same size as its parent, so the clone can be bound
+        # without looking it up again
+        cloned_dataset = Dataset._from_volume(
+            name,
+            {"Size": self.max_size, "Clone Parent Volume": self.name},
+            self
+        )
+        cloned_dataset.print_output = self.print_output
+        
+        # Wait for the clone's junction to become visible
+        cloned_dataset._refresh_nfs_namespace()
+        
+        return cloned_dataset
     
     def snapshot(self, name: Optional[str] = None) -> str:
         """
@@ -431,12 +593,38 @@ class Dataset:
                 print_output=self.print_output
             )
             
+            # Remove the dataset's file index, if one was created
+            index_path = self._default_index_path()
+            for path in (index_path, index_path + "-wal", index_path + "-shm"):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            
             if self.print_output:
                 logger.info(f"Deleted dataset '{self.name}'")
                 
         except Exception as e:
             raise DatasetVolumeError(f"Failed to delete dataset '{self.name}': {str(e)}")
     
+    @classmethod
+    def _from_volume(cls, name: str, volume: Dict[str, Any], manager: 'Dataset', print_output: bool = False) -> 'Dataset':
+        """
+        Bind a Dataset to an already retrieved volume without querying ONTAP again.
+        
+        The configuration and root volume details are shared with ``manager``,
+        which must have been initialized with ``_initialize_config()``.
+        """
+        dataset = cls.__new__(cls)
+        dataset.name = name
+        dataset.print_output = print_output
+        dataset._config = manager._config
+        dataset._root_volume_name = manager._root_volume_name
+        dataset._root_mountpoint = manager._root_mountpoint
+        dataset._root_export_policy = manager._root_export_policy
+        dataset._bind_to_existing(volume, None)
+        return dataset
+    
     @classmethod
     def _check_dataset_exists(cls, name: str) -> bool:
         """Check if a dataset with the given name exists."""
@@ -461,6 +649,10 @@ def get_datasets(print_output: bool = False) -> List[Dataset]:
     """
     Get all existing datasets.
     
+    The configuration is loaded and the root volume validated once, and all
+    dataset volumes are retrieved with a single volume query filtered on the
+    root volume's junction path.
+    
     Args:
         print_output: Whether to print status messages
         
@@ -471,44 +663,28 @@ def get_datasets(print_output: bool = False) -> List[Dataset]:
         DatasetConfigError: If dataset manager is not configured
         DatasetVolumeError: If there's an issue accessing volumes
     """
-    # Initialize configuration
-    try:
-        config = _retrieve_config(print_output=print_output)
-    except InvalidConfigError:
-        raise DatasetConfigError("Invalid or missing configuration file")
-    
-    if not config.get("datasetManagerEnabled", False):
-        raise DatasetConfigError(
-            "Dataset manager is not enabled. Run 'netapp_dataops_cli.py config' to configure."
-        )
-    
-    root_volume_name = config.get("datasetManagerRootVolume")
-    if not root_volume_name:
-        raise DatasetConfigError(
-            "Dataset manager root volume must be configured. "
-            "Run 'netapp_dataops_cli.py config' to configure."
-        )
+    # Initialize configuration and validate the root volume once for all datasets
+    manager = Dataset.__new__(Dataset)
+    manager.print_output = print_output
+    manager._initialize_config()
+    root_volume_name = manager._root_volume_name
     
     try:
-        # Get all volumes using volume_operations abstraction layer
-        volumes = list_volumes(print_output=False)
-        datasets = []
-        
-        for volume in volumes:
-            junction_path = volume.get("Junction Path", "")
-            # Check if volume is nested under the root volume
-            if junction_path and junction_path.startswith(f"/{root_volume_name}/"):
-                # Extract dataset name from junction path
-                dataset_name = junction_path.split("/")[-1]
-                if dataset_name and dataset_name != root_volume_name:
-                    try:
-                        dataset = Dataset(name=dataset_name, print_output=False)
-                        datasets.append(dataset)
-                    except Exception as e:
-                        if print_output:
-                            logger.info(f"Warning: Failed to load dataset '{dataset_name}': {str(e)}")
-        
-        return datasets
-        
+        # Only retrieve volumes junctioned under the root volume
+        volumes = list_volumes(junction_path=f"/{root_volume_name}/*", print_output=False)
     except Exception as e:
         raise DatasetVolumeError(f"Failed to retrieve datasets: {str(e)}")
+    
+    datasets = []
+    for volume in volumes:
+        dataset_name = volume.get("Volume Name")
+        # Datasets are junctioned directly under the root volume, using the volume name
+        if not dataset_name or volume.get("Junction Path") != f"/{root_volume_name}/{dataset_name}":
+            continue
+        try:
+            datasets.append(Dataset._from_volume(dataset_name, volume, manager))
+        except Exception as e:
+            if print_output:
+                logger.info(f"Warning: Failed to load dataset '{dataset_name}': {str(e)}")
+    
+    return datasets
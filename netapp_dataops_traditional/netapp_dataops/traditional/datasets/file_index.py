@@ -0,0 +1,340 @@
+"""
+Persistent file index for NetApp DataOps datasets.
+
+This module provides the DatasetFileIndex class, which keeps a SQLite record of
+the files in a dataset so that file listings and summaries do not require a
+full directory walk every time.
+"""
+
+import hashlib
+import os
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from netapp_dataops.logging_utils import setup_logger
+from ..core import _crawl_in_parallel
+from .dataset import DatasetFile, DATASET_SCAN_WORKERS
+from .exceptions import DatasetError
+
+logger = setup_logger(__name__)
+
+# Directory holding the file indexes of all datasets
+DATASET_INDEX_DIR = "~/.netapp_dataops/dataset_index"
+
+# Directories modified less than this many seconds before a scan are re-read on
+# the next refresh, since they may change again within the same mtime tick
+DATASET_INDEX_MTIME_GRACE = 2.0
+
+# Size of the reads used to checksum files
+DATASET_CHECKSUM_BUFFER_SIZE = 4 * 1024 * 1024
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS directories (
+    path TEXT PRIMARY KEY,
+    mtime_ns INTEGER,
+    subdirectories TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    directory TEXT NOT NULL,
+    extension TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    inode INTEGER NOT NULL,
+    checksum TEXT
+);
+CREATE INDEX IF NOT EXISTS files_directory ON files (directory);
+CREATE INDEX IF NOT EXISTS files_extension ON files (extension);
+"""
+
+
+def _checksum_file(filepath: str) -> str:
+    """Return the SHA-256 checksum of a file's contents.
+
+    The file is read into one reused buffer; hashlib releases the GIL while
+    hashing, so files can be checksummed concurrently on threads. Files are
+    not memory-mapped, since a mapped file truncated by another process while
+    being hashed kills the process with SIGBUS instead of raising an error.
+    """
+    digest = hashlib.sha256()
+    buffer = bytearray(DATASET_CHECKSUM_BUFFER_SIZE)
+    view = memoryview(buffer)
+    with open(filepath, "rb", buffering=0) as file:
+        while True:
+            length = file.readinto(buffer)
+            if not length:
+                break
+            digest.update(view[:length])
+    return digest.hexdigest()
+
+
+class DatasetFileIndex:
+    """
+    Persistent index of the files in a dataset, stored in a SQLite database.
+
+    The index records the path, size, modification time and, optionally, the
+    checksum of every file. refresh() brings it up to date incrementally: only
+    directories whose modification time changed since the last refresh are
+    read again, while unchanged directories cost a single stat call each.
+    Since a directory's modification time only changes when entries are
+    added, removed or renamed, files rewritten in place are picked up by a
+    full refresh (refresh(full=True)) only.
+
+    Paths passed to and returned by the query methods are relative to the
+    dataset directory, except for DatasetFile.filepath, which is absolute.
+    """
+
+    def __init__(self, dataset_path: str, index_path: str):
+        """
+        Open (or create) the index of the files in a dataset directory.
+
+        Args:
+            dataset_path: Local path of the dataset directory
+            index_path: Path of the SQLite database holding the index
+
+        Raises:
+            DatasetError: If the index cannot be opened
+        """
+        self.dataset_path = dataset_path
+        self.index_path = index_path
+        # Directories (relative to the dataset directory) that could not be read by the last refresh
+        self.unreadable_directories = []  # type: List[str]
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(index_path)), exist_ok=True)
+            self._db = sqlite3.connect(index_path, timeout=60)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.executescript(_SCHEMA)
+        except (OSError, sqlite3.Error) as e:
+            raise DatasetError(f"Failed to open file index '{index_path}': {str(e)}")
+
+    def close(self):
+        """Close the index database."""
+        self._db.close()
+
+    def __enter__(self) -> 'DatasetFileIndex':
+        return self
+
+    def __exit__(self, *args: Any):
+        self.close()
+
+    def refresh(self, full: bool = False, checksums: bool = False, max_workers: int = DATASET_SCAN_WORKERS):
+        """
+        Bring the index up to date with the dataset directory.
+
+        Args:
+            full: Re-read every directory, including unchanged ones, to pick up
+                files that were rewritten in place
+            checksums: Also compute SHA-256 checksums of new and changed files
+            max_workers: Maximum number of directories read (or files
+                checksummed) at once
+
+        Subdirectories that cannot be read are kept as indexed, or left out
+        if they were never indexed, and listed in unreadable_directories until
+        the next refresh.
+
+        Raises:
+            DatasetError: If the dataset directory does not exist or cannot be
+                read, or the index cannot be updated
+        """
+        # Other directories that cannot be read are skipped or kept as indexed, but without the
+        # dataset directory itself the index would silently be emptied or left stale
+        try:
+            os.scandir(self.dataset_path).close()
+        except OSError as e:
+            raise DatasetError(f"Failed to scan dataset directory '{self.dataset_path}': {str(e)}")
+
+        try:
+            known = dict((path, (mtime_ns, subdirectories.split("\0") if subdirectories else []))
+                         for path, mtime_ns, subdirectories in
+                         self._db.execute("SELECT path, mtime_ns, subdirectories FROM directories"))
+        except sqlite3.Error as e:
+            raise DatasetError(f"Failed to read file index '{self.index_path}': {str(e)}")
+
+        recent = time.time() - DATASET_INDEX_MTIME_GRACE
+        unreadable_directories = []  # type: List[str]
+
+        def _keep_directory(path: str, add_directory: Callable[[Any], None]) -> Iterator[List[Tuple]]:
+            # Leave the indexed files and subdirectories of a directory as they are
+            previous = known.get(path)
+            if previous is None:
+                return
+            for subdirectory in previous[1]:
+                add_directory(subdirectory)
+            yield [(path, None, None, None)]
+
+        def _scan_directory(path: str, add_directory: Callable[[Any], None]) -> Iterator[List[Tuple]]:
+            directory = os.path.join(self.dataset_path, path)
+            try:
+                mtime = os.stat(directory).st_mtime_ns
+            except (FileNotFoundError, NotADirectoryError):
+                # Removed since the last refresh; its rows are dropped below
+                return
+            except OSError:
+                # Possibly a transient error: keep the directory as indexed, and read it again next time
+                unreadable_directories.append(path)
+                yield from _keep_directory(path, add_directory)
+                return
+            previous = known.get(path)
+            if not full and previous is not None and previous[0] == mtime:
+                # Unchanged directory: its files and subdirectories are as indexed
+                yield from _keep_directory(path, add_directory)
+                return
+
+            files = []
+            subdirectories = []
+            try:
+                entries = os.scandir(directory)
+            except (FileNotFoundError, NotADirectoryError):
+                return
+            except OSError:
+                unreadable_directories.append(path)
+                yield from _keep_directory(path, add_directory)
+                return
+            with entries:
+                for entry in entries:
+                    relative_path = os.path.join(path, entry.name) if path else entry.name
+                    try:
+                        if entry.is_dir():
+                            if not entry.is_symlink():
+                                subdirectories.append(relative_path)
+                                add_directory(relative_path)
+                            continue
+                        stat = entry.stat()
+                    except OSError:
+                        # The file was removed while scanning, or is a broken link
+                        continue
+                    files.append((relative_path, stat.st_size, stat.st_mtime_ns, stat.st_ino))
+            if mtime / 1e9 > recent:
+                mtime = None
+            yield [(path, mtime, subdirectories, files)]
+
+        visited = set()
+        self.unreadable_directories = unreadable_directories
+        try:
+            with self._db:
+                for path, mtime, subdirectories, files in _crawl_in_parallel("", _scan_directory,
+                                                                             maxWorkers=max(1, max_workers)):
+                    visited.add(path)
+                    if files is None:
+                        continue
+                    self._update_directory(path, mtime, subdirectories, files)
+
+                # Drop directories that no longer exist. Directories that could not be read for any
+                # other reason were kept as indexed, so a transient error never empties the index.
+                removed = [path for path in known if path not in visited]
+                self._db.executemany("DELETE FROM files WHERE directory = ?", [(path,) for path in removed])
+                self._db.executemany("DELETE FROM directories WHERE path = ?", [(path,) for path in removed])
+
+            if checksums:
+                missing = [path for (path,) in self._db.execute("SELECT path FROM files WHERE checksum IS NULL")]
+                self._update_checksums(missing, max_workers)
+        except sqlite3.Error as e:
+            raise DatasetError(f"Failed to update file index '{self.index_path}': {str(e)}")
+        except OSError as e:
+            raise DatasetError(f"Failed to scan dataset directory '{self.dataset_path}': {str(e)}")
+
+    def _update_directory(self, path: str, mtime: Optional[int], subdirectories: List[str],
+                          files: List[Tuple[str, int, int, int]]):
+        """Replace the indexed contents of a directory that was read again, keeping checksums of unchanged files."""
+        previous = dict((row[0], row[1:]) for row in self._db.execute(
+            "SELECT path, size, mtime_ns, inode, checksum FROM files WHERE directory = ?", (path,)))
+        rows = []
+        for relative_path, size, mtime_ns, inode in files:
+            checksum = None
+            old = previous.pop(relative_path, None)
+            if old is not None and old[:3] == (size, mtime_ns, inode):
+                checksum = old[3]
+            extension = os.path.splitext(relative_path)[1].lower()
+            rows.append((relative_path, path, extension, size, mtime_ns, inode, checksum))
+        self._db.executemany("DELETE FROM files WHERE path = ?", [(removed,) for removed in previous])
+        self._db.executemany("INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+        self._db.execute("INSERT OR REPLACE INTO directories VALUES (?, ?, ?)",
+                         (path, mtime, "\0".join(subdirectories)))
+
+    def _update_checksums(self, paths: List[str], max_workers: int):
+        """Checksum the given files concurrently and store the results."""
+        def _checksum(path: str) -> Tuple[Optional[str], str]:
+            try:
+                return _checksum_file(os.path.join(self.dataset_path, path)), path
+            except OSError:
+                # Removed since the scan; left for the next refresh
+                return None, path
+
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor, self._db:
+            self._db.executemany("UPDATE files SET checksum = ? WHERE path = ?",
+                                 (result for result in executor.map(_checksum, paths) if result[0] is not None))
+
+    def _query(self, select: str, pattern: Optional[str], suffix: str = "") -> sqlite3.Cursor:
+        if pattern is None:
+            return self._db.execute(f"SELECT {select} FROM files{suffix}")
+        return self._db.execute(f"SELECT {select} FROM files WHERE path GLOB ?{suffix}", (pattern,))
+
+    def iter_files(self, pattern: Optional[str] = None) -> Iterator[DatasetFile]:
+        """
+        Iterate over the indexed files, in path order.
+
+        Args:
+            pattern: Optional glob pattern matched against the path relative to
+                the dataset directory (e.g. "images/*.jpg"); '*' also matches '/'
+
+        Yields:
+            DatasetFile records
+        """
+        for path, size, mtime_ns in self._query("path, size, mtime_ns", pattern, " ORDER BY path"):
+            yield DatasetFile(os.path.join(self.dataset_path, path), size, mtime_ns / 1e9)
+
+    def get_checksum(self, path: str) -> Optional[str]:
+        """Return the indexed SHA-256 checksum of a file (relative path), or None if it has none."""
+        row = self._db.execute("SELECT checksum FROM files WHERE path = ?", (path,)).fetchone()
+        return row[0] if row else None
+
+    def count(self, pattern: Optional[str] = None) -> int:
+        """Return the number of indexed files, optionally only those matching a glob pattern."""
+        return self._query("COUNT(*)", pattern).fetchone()[0]
+
+    def total_size(self, pattern: Optional[str] = None) -> int:
+        """Return the total size in bytes of the indexed files, optionally only those matching a glob pattern."""
+        return self._query("COALESCE(SUM(size), 0)", pattern).fetchone()[0]
+
+    def count_by_extension(self) -> Dict[str, int]:
+        """Return the number of indexed files per lowercase file extension ('' for files without one)."""
+        return dict(self._db.execute("SELECT extension, COUNT(*) FROM files GROUP BY extension ORDER BY extension"))
+
+    def directory_hashes(self) -> Dict[str, str]:
+        """
+        Return a Merkle-style tree hash for every indexed directory.
+
+        A directory's hash is the SHA-256 of the sorted names and hashes of its
+        entries: the checksums of its files and the tree hashes of its
+        subdirectories. Two directory trees have the same hash exactly when
+        they hold the same names and file contents, wherever they are located.
+        The dataset directory itself is keyed by ''.
+
+        Returns:
+            Dictionary mapping directory paths (relative to the dataset
+            directory) to hex digests
+
+        Raises:
+            DatasetError: If any indexed file has no checksum; refresh the
+                index with checksums=True first
+        """
+        entries = {}  # type: Dict[str, List[Tuple[str, str, str]]]
+        for path, directory, checksum in self._db.execute("SELECT path, directory, checksum FROM files"):
+            if checksum is None:
+                raise DatasetError(f"File '{path}' has no checksum in the file index")
+            entries.setdefault(directory, []).append((os.path.basename(path), "file", checksum))
+
+        hashes = {}
+        directories = [path for (path,) in self._db.execute("SELECT path FROM directories")]
+        # Hash the deepest directories first, so that subdirectory hashes are known before their parents'
+        for path in sorted(directories, key=lambda path: path.count(os.sep) if path else -1, reverse=True):
+            digest = hashlib.sha256()
+            for name, kind, entry_hash in sorted(entries.get(path, [])):
+                digest.update(f"{kind} {len(name)}:{name} {entry_hash}\n".encode("utf-8", "surrogateescape"))
+            hashes[path] = digest.hexdigest()
+            if path:
+                entries.setdefault(os.path.dirname(path), []).append((os.path.basename(path), "directory", hashes[path]))
+        return hashes
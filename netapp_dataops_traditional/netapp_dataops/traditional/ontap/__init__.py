@@ -3,10 +3,12 @@
 from .volume_operations import (
     create_volume,
     clone_volume, 
+    clone_volumes,
     delete_volume,
     mount_volume,
     unmount_volume,
-    list_volumes
+    list_volumes,
+    list_volumes_multi
 )
 
 from .snapshot_operations import (
@@ -19,7 +21,8 @@ from .snapshot_operations import (
 from .snapmirror_operations import (
     list_snap_mirror_relationships,
     create_snap_mirror_relationship,
-    sync_snap_mirror_relationship
+    sync_snap_mirror_relationship,
+    sync_snap_mirror_relationships
 )
 
 from .flexcache_operations import (
@@ -30,6 +33,12 @@ from .flexcache_operations import (
     create_flexcache
 )
 
+from .job_tracker import (
+    JobTracker,
+    get_job_tracker,
+    wait_for_jobs
+)
+
 from ..protocols.cifs_share_operations import (
     create_cifs_share,
     list_cifs_shares,
@@ -47,10 +56,12 @@ __all__ = [
     # Volume operations
     'create_volume',
     'clone_volume',
+    'clone_volumes',
     'delete_volume',
     'mount_volume',
     'unmount_volume',
     'list_volumes',
+    'list_volumes_multi',
     # Snapshot operations
     'create_snapshot',
     'delete_snapshot',
@@ -60,12 +71,17 @@ __all__ = [
     'list_snap_mirror_relationships',
     'create_snap_mirror_relationship',
     'sync_snap_mirror_relationship',
+    'sync_snap_mirror_relationships',
     # FlexCache operations
     'prepopulate_flex_cache',
     'list_flexcaches',
     'get_flexcache_origin',
     'update_flexcache',
     'create_flexcache',
+    # Job tracking
+    'JobTracker',
+    'get_job_tracker',
+    'wait_for_jobs',
     # CIFS Share operations
     'create_cifs_share',
     'list_cifs_shares',
@@ -22,18 +22,25 @@ from ..core import (
     _convert_bytes_to_pretty_size,
     deprecated
 )
+from ..core.connection import _scoped_host_context
 from .volume_operations import mount_volume
+from .job_tracker import _operation_future, run_job
 
 logger = setup_logger(__name__)
 
 
-def prepopulate_flex_cache(volume_name: str, paths: List[str], print_output: bool = False) -> None:
+@_scoped_host_context
+def prepopulate_flex_cache(volume_name: str, paths: List[str], print_output: bool = False, wait: bool = True):
     """Prepopulate a FlexCache volume with specified paths.
     
     Args:
         volume_name: Name of the FlexCache volume to prepopulate
         paths: List of directory paths to prepopulate
         print_output: If True, print status messages to console
+        wait: If False, return without waiting for the prepopulate job to finish
+
+    Returns:
+        None, or when wait is False a concurrent.futures.Future that resolves to None once the job has finished.
         
     Raises:
         InvalidConfigError: If configuration is invalid
@@ -77,10 +84,16 @@ def prepopulate_flex_cache(volume_name: str, paths: List[str], print_output: boo
                 raise InvalidVolumeParameterError("name")
 
             flexcache.prepopulate = {"dir_paths": paths}
-            flexcache.patch()
+            job = run_job(flexcache, "patch", wait=wait)
 
             if print_output:
-                logger.info("FlexCache prepopulated successfully.")
+                if wait:
+                    logger.info("FlexCache prepopulated successfully.")
+                else:
+                    logger.info("FlexCache prepopulate submitted.")
+
+            if not wait:
+                return _operation_future(job)
 
         except NetAppRestError as err:
             if print_output:
@@ -91,6 +104,7 @@ def prepopulate_flex_cache(volume_name: str, paths: List[str], print_output: boo
         raise ConnectionTypeError()
 
 
+@_scoped_host_context
 def list_flexcaches(cluster_name: str = None, svm_name: str = None, 
                            print_output: bool = False) -> List[Dict[str, Any]]:
     """List all FlexCache volumes with their origin information.
@@ -239,6 +253,7 @@ def list_flexcaches(cluster_name: str = None, svm_name: str = None,
         raise ConnectionTypeError()
 
 
+@_scoped_host_context
 def get_flexcache_origin(volume_name: str, svm_name: str = None, cluster_name: str = None,
                          print_output: bool = False) -> List[Dict[str, Any]]:
     """Retrieve origin details for a FlexCache volume by name.
@@ -351,12 +366,13 @@ def get_flexcache_origin(volume_name: str, svm_name: str = None, cluster_name: s
         raise ConnectionTypeError()
 
 
+@_scoped_host_context
 def update_flexcache(uuid: str = None, volume_name: str = None, svm_name: str = None, 
                      cluster_name: str = None, prepopulate_paths: List[str] = None, 
                      prepopulate_exclude_paths: List[str] = None, writeback_enabled: bool = None,
                      relative_size_enabled: bool = None, relative_size_percentage: int = None,
                      atime_scrub_enabled: bool = None, atime_scrub_period: int = None,
-                     cifs_change_notify_enabled: bool = None, print_output: bool = False) -> None:
+                     cifs_change_notify_enabled: bool = None, print_output: bool = False, wait: bool = True):
     """Update properties of a FlexCache volume.
     
     This function updates the configuration of a FlexCache volume. You can specify the FlexCache
@@ -376,6 +392,10 @@ def update_flexcache(uuid: str = None, volume_name: str = None, svm_name: str =
         atime_scrub_period: Duration in days after which inactive files can be scrubbed (1-365).
         cifs_change_notify_enabled: Enable or disable CIFS change notification.
         print_output: If True, print status messages to console.
+        wait: If False, return without waiting for the update job to finish.
+
+    Returns:
+        None, or when wait is False a concurrent.futures.Future that resolves to None once the job has finished.
         
     Raises:
         InvalidConfigError: If configuration is invalid
@@ -491,7 +511,7 @@ def update_flexcache(uuid: str = None, volume_name: str = None, svm_name: str =
             if not update_dict:
                 if print_output:
                     logger.warning("Warning: No update parameters provided.")
-                return
+                return None if wait else _operation_future()
             
             if print_output:
                 logger.info("Updating FlexCache volume (UUID: %s)...", flexcache_uuid)
@@ -501,10 +521,16 @@ def update_flexcache(uuid: str = None, volume_name: str = None, svm_name: str =
             for key, value in update_dict.items():
                 setattr(flexcache, key, value)
             
-            flexcache.patch(poll=True, poll_timeout=120)
+            job = run_job(flexcache, "patch", wait=wait)
             
             if print_output:
-                logger.info("FlexCache volume updated successfully.")
+                if wait:
+                    logger.info("FlexCache volume updated successfully.")
+                else:
+                    logger.info("FlexCache volume update submitted.")
+
+            if not wait:
+                return _operation_future(job)
 
         except NetAppRestError as err:
             if print_output:
@@ -515,8 +541,10 @@ def update_flexcache(uuid: str = None, volume_name: str = None, svm_name: str =
         raise ConnectionTypeError()
 
 
+@_scoped_host_context
 def create_flexcache(source_vol: str, source_svm: str, flexcache_vol: str, flexcache_svm: str = None, cluster_name: str = None, flexcache_size: str = None, 
-                     junction: str = None, export_policy: str = "default", mountpoint: str = None, readonly: bool = False, print_output: bool = False):
+                     junction: str = None, export_policy: str = "default", mountpoint: str = None, readonly: bool = False, print_output: bool = False,
+                     wait: bool = True):
     """
     Creates a FlexCache volume from a specified source volume.
 
@@ -534,13 +562,20 @@ def create_flexcache(source_vol: str, source_svm: str, flexcache_vol: str, flexc
         mountpoint (str): Local mountpoint to mount the FlexCache volume after creation. If not specified, the volume will not be mounted locally. On Linux hosts, must be run as root if specified.
         readonly (bool): Mount the FlexCache volume as read-only if True.
         print_output (bool): Print detailed output if True.
+        wait (bool): If False, return a concurrent.futures.Future that resolves to None once the creation job has finished, without waiting for it. Cannot be combined with mountpoint.
 
     Raises:
         InvalidConfigError: If configuration is missing or invalid.
-        InvalidVolumeParameterError: If provided parameters are invalid.
+        InvalidVolumeParameterError: If provided parameters are invalid, or if wait=False is combined with mountpoint.
         APIConnectionError: If there is an error connecting to the API.
         ConnectionTypeError: If the connection type is not supported.
     """
+    # The FlexCache has to exist before it can be mounted locally
+    if mountpoint and not wait:
+        if print_output:
+            logger.error("Error: wait=False cannot be combined with a mountpoint.")
+        raise InvalidVolumeParameterError("wait")
+
     # Retrieve config details from config file
     try:
         config = _retrieve_config(print_output=print_output)
@@ -611,11 +646,16 @@ def create_flexcache(source_vol: str, source_svm: str, flexcache_vol: str, flexc
             if print_output:
                 logger.info("Creating FlexCache: %s:%s -> %s:%s", source_svm, source_vol, flexcache_svm, flexcache_vol)
             newFlexCache = NetAppFlexCache.from_dict(newFlexCacheDict)
-            newFlexCache.post(poll=True, poll_timeout=120)
+            job = run_job(newFlexCache, "post", wait=wait)
         except NetAppRestError as err:
             if print_output:
                 logger.error("Error: ONTAP Rest API Error: %s", err)
             raise APIConnectionError(err)
+
+        if not wait:
+            if print_output:
+                logger.info("FlexCache creation submitted.")
+            return _operation_future(job)
         
         # Check if FlexCache was created successfully
         try:
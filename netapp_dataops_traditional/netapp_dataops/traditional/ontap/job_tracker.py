@@ -0,0 +1,233 @@
+"""Asynchronous ONTAP job tracking for NetApp DataOps traditional environments."""
+
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Dict, List, Optional
+
+from netapp_ontap.error import NetAppRestError
+from netapp_ontap.resource import Resource as NetAppResource
+from netapp_ontap.host_connection import HostConnection as NetAppHostConnection
+from netapp_ontap.resources import Job as NetAppJob
+from netapp_ontap.response import NetAppResponse
+
+from netapp_dataops.logging_utils import setup_logger
+
+logger = setup_logger(__name__)
+
+# ONTAP job states after which a job will not change anymore
+TERMINAL_JOB_STATES = ("success", "failure", "cancelled", "expired")
+
+# Maximum number of job UUIDs combined into a single /cluster/jobs query
+JOB_QUERY_BATCH_SIZE = 50
+
+# Number of consecutive failed /cluster/jobs queries after which a job is failed
+JOB_QUERY_MAX_ERRORS = 5
+
+DEFAULT_JOB_TIMEOUT = 120
+
+
+class JobTracker:
+    """Track outstanding ONTAP jobs for a single cluster connection.
+
+    Jobs are registered with ``track()`` or ``track_response()``, which return a
+    ``concurrent.futures.Future`` per job. A single background thread polls all
+    outstanding jobs together with one ``/cluster/jobs?uuid=a|b|c`` query per
+    batch, backing off while nothing changes. Futures resolve to the final job
+    record (a ``netapp_ontap.resources.Job``) on success, or raise
+    ``NetAppRestError`` if the job fails, times out, or could not be queried
+    ``JOB_QUERY_MAX_ERRORS`` times in a row. If polling itself fails
+    unexpectedly, every outstanding future raises that error.
+    """
+
+    def __init__(self, connection: NetAppHostConnection, min_interval: float = 0.5, max_interval: float = 10.0,
+                 backoff_factor: float = 1.5):
+        self._connection = connection
+        self._min_interval = min_interval
+        self._max_interval = max_interval
+        self._backoff_factor = backoff_factor
+        self._jobs = {}  # type: Dict[str, tuple]
+        self._query_errors = {}  # type: Dict[str, int]
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._poller = None  # type: Optional[threading.Thread]
+
+    def track(self, job_uuid: str, timeout: Optional[float] = DEFAULT_JOB_TIMEOUT) -> Future:
+        """Start tracking the job with the given UUID and return a future for its outcome."""
+        future = Future()
+        future.set_running_or_notify_cancel()
+        deadline = time.monotonic() + timeout if timeout else None
+        with self._lock:
+            self._jobs[job_uuid] = (future, deadline)
+            if self._poller is None or not self._poller.is_alive():
+                self._poller = threading.Thread(target=self._poll_jobs, name="ontap-job-tracker", daemon=True)
+                self._poller.start()
+        # Poll promptly for the new job
+        self._wakeup.set()
+        return future
+
+    def track_response(self, response: NetAppResponse, timeout: Optional[float] = DEFAULT_JOB_TIMEOUT) -> Future:
+        """Track the job (if any) returned by a non-polled ONTAP request.
+
+        Requests that completed synchronously return an already resolved future.
+        """
+        job_uuid = _get_job_uuid(response)
+        if not job_uuid:
+            future = Future()
+            future.set_result(None)
+            return future
+        return self.track(job_uuid, timeout=timeout)
+
+    def outstanding(self) -> int:
+        """Return the number of jobs that have not reached a terminal state yet."""
+        with self._lock:
+            return len(self._jobs)
+
+    def _poll_jobs(self) -> None:
+        try:
+            self._poll_until_done()
+        except Exception as err:
+            # Nothing would resolve the outstanding futures once this thread is gone
+            logger.debug("Error tracking ONTAP jobs: %s", err)
+            with self._lock:
+                pending = list(self._jobs.values())
+                self._jobs.clear()
+                self._query_errors.clear()
+                self._poller = None
+            for future, _ in pending:
+                if not future.done():
+                    future.set_exception(err)
+
+    def _poll_until_done(self) -> None:
+        interval = self._min_interval
+        while True:
+            with self._lock:
+                if not self._jobs:
+                    self._poller = None
+                    return
+                pending = dict(self._jobs)
+
+            changed = self._poll_once(pending)
+
+            # Back off while jobs are still running; poll quickly again after progress
+            interval = self._min_interval if changed else min(interval * self._backoff_factor, self._max_interval)
+            if self._wakeup.wait(interval):
+                self._wakeup.clear()
+                interval = self._min_interval
+
+    def _poll_once(self, pending: Dict[str, tuple]) -> bool:
+        changed = False
+        uuids = list(pending)
+        for start in range(0, len(uuids), JOB_QUERY_BATCH_SIZE):
+            batch = uuids[start:start + JOB_QUERY_BATCH_SIZE]
+            queryError = None
+            try:
+                records = NetAppJob.get_collection(connection=self._connection, uuid="|".join(batch),
+                                                   fields="uuid,state,message,code,description")
+                jobs = {job.uuid: job for job in records}
+            except NetAppRestError as err:
+                logger.debug("Error polling ONTAP jobs: %s", err)
+                queryError = err
+                jobs = {}
+
+            for job_uuid in batch:
+                future, deadline = pending[job_uuid]
+                job = jobs.get(job_uuid)
+                state = getattr(job, "state", None)
+                if queryError is None:
+                    self._query_errors.pop(job_uuid, None)
+                    queryErrors = 0
+                else:
+                    queryErrors = self._query_errors.get(job_uuid, 0) + 1
+                    self._query_errors[job_uuid] = queryErrors
+
+                if queryErrors >= JOB_QUERY_MAX_ERRORS:
+                    self._finish(job_uuid)
+                    future.set_exception(NetAppRestError(
+                        "Job %s could not be queried %d times in a row." % (job_uuid, queryErrors), cause=queryError))
+                    changed = True
+                elif state in TERMINAL_JOB_STATES:
+                    self._finish(job_uuid)
+                    if state == "success":
+                        future.set_result(job)
+                    else:
+                        future.set_exception(NetAppRestError(
+                            "Job (%s): %s. Error code: %s" % (state, getattr(job, "message", ""), getattr(job, "code", ""))))
+                    changed = True
+                elif deadline is not None and time.monotonic() > deadline:
+                    self._finish(job_uuid)
+                    future.set_exception(NetAppRestError("Job %s did not complete before the timeout expired." % job_uuid))
+                    changed = True
+        return changed
+
+    def _finish(self, job_uuid: str) -> None:
+        with self._lock:
+            self._jobs.pop(job_uuid, None)
+            self._query_errors.pop(job_uuid, None)
+
+
+def _get_job_uuid(response: NetAppResponse) -> Optional[str]:
+    try:
+        return response.http_response.json()["job"]["uuid"]
+    except (AttributeError, KeyError, TypeError, ValueError):
+        return None
+
+
+_job_trackers = {}  # type: Dict[int, JobTracker]
+_job_trackers_lock = threading.Lock()
+
+
+def get_job_tracker(connection: NetAppHostConnection) -> JobTracker:
+    """Return the process-wide job tracker for the given connection."""
+    with _job_trackers_lock:
+        tracker = _job_trackers.get(id(connection))
+        if tracker is None or tracker._connection is not connection:
+            tracker = JobTracker(connection)
+            _job_trackers[id(connection)] = tracker
+        return tracker
+
+
+def run_job(resource: NetAppResource, method: str, *args, wait: bool = True,
+            timeout: Optional[float] = DEFAULT_JOB_TIMEOUT, **kwargs) -> Future:
+    """Issue a non-polled ``post``, ``patch`` or ``delete`` on a resource and track its job.
+
+    The job is handed to the shared tracker for the resource's connection. With
+    ``wait=True`` this blocks until the job has finished and raises
+    ``NetAppRestError`` if it failed. The job future is returned either way.
+    """
+    connection = resource.get_connection()
+    response = getattr(resource, method)(*args, poll=False, **kwargs)
+    job = get_job_tracker(connection).track_response(response, timeout=timeout)
+    if wait:
+        job.result()
+    return job
+
+
+def _operation_future(job: Optional[Future] = None, result: Any = None) -> Future:
+    """Return the future handed out by an operation called with ``wait=False``.
+
+    The future resolves to ``result``, i.e. to what the operation returns when
+    it waits, once ``job`` (if any) has succeeded, and raises the job's error if
+    it failed. Operations that had no job to submit return a resolved future.
+    """
+    future = Future()
+    future.set_running_or_notify_cancel()
+
+    def _job_done(done: Future) -> None:
+        err = done.exception()
+        if err is not None:
+            future.set_exception(err)
+        else:
+            future.set_result(result)
+
+    if job is None:
+        future.set_result(result)
+    else:
+        job.add_done_callback(_job_done)
+    return future
+
+
+def wait_for_jobs(futures: List[Future], timeout: Optional[float] = None) -> None:
+    """Block until all given job futures have resolved, raising the first job error."""
+    for future in futures:
+        future.result(timeout=timeout)
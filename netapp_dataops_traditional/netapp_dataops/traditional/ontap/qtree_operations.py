@@ -19,14 +19,16 @@ from ..exceptions import (
     ConnectionTypeError
 )
 from ..core.config import _retrieve_config
-from ..core.connection import _instantiate_connection
+from ..core.connection import _instantiate_connection, _scoped_host_context
+from .job_tracker import _operation_future, run_job
 
 logger = setup_logger(__name__)
 
 
+@_scoped_host_context
 def create_qtree(qtree_name: str, volume_name: str, cluster_name: str = None, svm_name: str = None,
                  security_style: str = None, unix_permissions: str = None, export_policy: str = None,
-                 print_output: bool = False):
+                 print_output: bool = False, wait: bool = True):
     """
     Create a new qtree in a volume.
 
@@ -41,6 +43,7 @@ def create_qtree(qtree_name: str, volume_name: str, cluster_name: str = None, sv
         unix_permissions (str): UNIX permissions for the qtree
         export_policy (str): Export policy of the SVM for the qtree.
         print_output (bool): Print detailed output if True.
+        wait (bool): If False, return without waiting for the creation job to finish.
 
     Raises:
         InvalidConfigError: If configuration is missing or invalid.
@@ -48,7 +51,7 @@ def create_qtree(qtree_name: str, volume_name: str, cluster_name: str = None, sv
         APIConnectionError: If there is an error connecting to the API.
 
     Returns:
-        None
+        None, or when wait is False a concurrent.futures.Future that resolves to None once the creation job has finished.
     """
     try:
         config = _retrieve_config(print_output=print_output)
@@ -129,8 +132,13 @@ def create_qtree(qtree_name: str, volume_name: str, cluster_name: str = None, sv
                 qtree.export_policy = {"name": export_policy}
 
             # Create the qtree
-            qtree.post(poll=True, poll_timeout=120)
-            
+            job = run_job(qtree, "post", wait=wait)
+
+            if not wait:
+                if print_output:
+                    logger.info("Qtree '%s' creation submitted.", qtree_name)
+                return _operation_future(job)
+
             if print_output:
                 logger.info("Qtree '%s' created successfully.", qtree_name)
                 logger.info("Qtree ID: %s", str(qtree.id))
@@ -145,6 +153,7 @@ def create_qtree(qtree_name: str, volume_name: str, cluster_name: str = None, sv
         raise InvalidConfigError("Unsupported connection type")
 
 
+@_scoped_host_context
 def list_qtrees(volume_name: str = None, cluster_name: str = None, svm_name: str = None, 
                 print_output: bool = False) -> list:
     """
@@ -260,6 +269,7 @@ def list_qtrees(volume_name: str = None, cluster_name: str = None, svm_name: str
         raise InvalidConfigError("Unsupported connection type")
 
 
+@_scoped_host_context
 def get_qtree(volume_uuid: str, qtree_id: int, cluster_name: str = None, 
               print_output: bool = False) -> dict:
     """
@@ -376,6 +386,7 @@ def get_qtree(volume_uuid: str, qtree_id: int, cluster_name: str = None,
         raise InvalidConfigError("Unsupported connection type")
 
 
+@_scoped_host_context
 def get_qtree_metrics(volume_uuid: str, qtree_id: int, cluster_name: str = None,
                       print_output: bool = False) -> dict:
     """
@@ -1,6 +1,7 @@
 """SnapMirror operations for NetApp DataOps traditional environments."""
 
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional
 
 from netapp_ontap.error import NetAppRestError
@@ -20,13 +21,155 @@ from ..core import (
     _retrieve_config,
     _instantiate_connection,
     _print_invalid_config_error,
+    _convert_bytes_to_pretty_size,
     deprecated
 )
+from ..core.connection import COLLECTION_PAGE_SIZE, _scoped_host_context
+from .job_tracker import _operation_future, run_job
 
 logger = setup_logger(__name__)
 
+SNAPMIRROR_RELATIONSHIP_FIELDS = "uuid,source,destination,policy.type,transfer.state,healthy,lag_time"
+
+# Fields needed to follow running transfers
+SNAPMIRROR_TRANSFER_FIELDS = "uuid,destination.path,healthy,lag_time,transfer.uuid,transfer.state,transfer.bytes_transferred"
+
+# Transfer states that mean a transfer has not finished yet
+SNAPMIRROR_ACTIVE_TRANSFER_STATES = ("queued", "preparing", "transferring", "finalizing")
+
+# Maximum number of relationship UUIDs combined into a single collection query
+SNAPMIRROR_QUERY_BATCH_SIZE = 50
+
+# Seconds during which a relationship may still report its previous transfer
+SNAPMIRROR_TRANSFER_START_GRACE = 10
+
+# Default number of seconds to wait for triggered transfers to complete
+SNAPMIRROR_WAIT_TIMEOUT = 24 * 60 * 60
+
+
+def _get_snap_mirror_relationship_collection(connection, list_destinations_only: bool = False) -> list:
+    # The connection is passed explicitly since this may run in a worker thread
+    query = {}
+    if list_destinations_only:
+        query["list_destinations_only"] = True
+    return list(NetAppSnapmirrorRelationship.get_collection(connection=connection, fields=SNAPMIRROR_RELATIONSHIP_FIELDS,
+                                                            max_records=COLLECTION_PAGE_SIZE, **query))
+
+
+def _wait_for_snap_mirror_transfers(connection, transfers: Dict[str, Optional[str]], print_output: bool = False,
+                                    timeout: Optional[float] = SNAPMIRROR_WAIT_TIMEOUT, min_interval: float = 2.0,
+                                    max_interval: float = 60.0, backoff_factor: float = 1.5) -> Dict[str, Dict[str, Any]]:
+    """Wait for triggered SnapMirror transfers to complete.
+
+    All pending relationships are polled together with one collection query per
+    batch. The poll interval grows while no transfer finishes and is reset when
+    one does.
+
+    Args:
+        connection: ONTAP host connection
+        transfers: Maps relationship UUID to the UUID of the triggered transfer (None if unknown)
+        print_output: Whether to print per-relationship progress
+        timeout: Seconds to wait before giving up on the transfers still pending (None to wait indefinitely)
+
+    Returns:
+        Dict keyed by relationship UUID with keys "UUID", "Destination", "Status"
+        ("success" or "failed"), "Bytes Transferred", "Throughput" (bytes per
+        second), "Lag Time" and "Error". Transfers still pending when the
+        timeout expires are "failed" with the error "timeout".
+
+    Raises:
+        NetAppRestError: If a poll query fails
+    """
+    startTime = time.monotonic()
+    pending = dict(transfers)
+    results = dict()
+    lastResults = dict()
+    interval = min_interval
+
+    while pending:
+        if timeout is not None:
+            remaining = timeout - (time.monotonic() - startTime)
+            if remaining <= 0:
+                break
+            time.sleep(min(interval, remaining))
+        else:
+            time.sleep(interval)
+        elapsed = time.monotonic() - startTime
+        finished = False
+
+        uuids = list(pending)
+        for start in range(0, len(uuids), SNAPMIRROR_QUERY_BATCH_SIZE):
+            batch = uuids[start:start + SNAPMIRROR_QUERY_BATCH_SIZE]
+            relationships = dict((relationship.uuid, relationship) for relationship in NetAppSnapmirrorRelationship.get_collection(
+                connection=connection, uuid="|".join(batch), fields=SNAPMIRROR_TRANSFER_FIELDS))
+
+            for uuid in batch:
+                relationship = relationships.get(uuid)
+                transfer = getattr(relationship, "transfer", None)
+                transferState = getattr(transfer, "state", None)
+                bytesTransferred = getattr(transfer, "bytes_transferred", None) or 0
+
+                # Until the triggered transfer starts, the relationship still reports the previous one
+                if transferState not in SNAPMIRROR_ACTIVE_TRANSFER_STATES:
+                    if pending[uuid] and transfer is not None:
+                        if getattr(transfer, "uuid", None) != pending[uuid]:
+                            transferState = "queued"
+                    elif elapsed < SNAPMIRROR_TRANSFER_START_GRACE:
+                        transferState = "queued"
+
+                result = {
+                    "UUID": uuid,
+                    "Destination": relationship.destination.path if relationship is not None else None,
+                    "Status": transferState,
+                    "Bytes Transferred": bytesTransferred,
+                    "Throughput": bytesTransferred / elapsed,
+                    "Lag Time": getattr(relationship, "lag_time", None),
+                    "Error": None
+                }
+
+                if relationship is None:
+                    result["Status"] = "failed"
+                    result["Error"] = "not found"
+                elif (not transferState) or (transferState == "success"):
+                    if relationship.healthy:
+                        result["Status"] = "success"
+                    else:
+                        result["Status"] = "failed"
+                        result["Error"] = "not healthy"
+                elif transferState not in SNAPMIRROR_ACTIVE_TRANSFER_STATES:
+                    result["Status"] = "failed"
+                    result["Error"] = transferState
+
+                if print_output:
+                    logger.info("Relationship %s (%s): %s, %s transferred (%s/s), lag time: %s", uuid, result["Destination"],
+                                result["Status"], _convert_bytes_to_pretty_size(bytesTransferred),
+                                _convert_bytes_to_pretty_size(result["Throughput"]), result["Lag Time"])
+
+                if result["Status"] in ("success", "failed"):
+                    results[uuid] = result
+                    del pending[uuid]
+                    finished = True
+                else:
+                    lastResults[uuid] = result
+
+        interval = min_interval if finished else min(interval * backoff_factor, max_interval)
+
+    if pending:
+        if print_output:
+            logger.error("Error: %d sync operation(s) did not complete within %d seconds: %s", len(pending), timeout,
+                         ", ".join(sorted(pending)))
+        for uuid in pending:
+            result = lastResults.get(uuid, {"UUID": uuid, "Destination": None, "Bytes Transferred": None,
+                                            "Throughput": None, "Lag Time": None})
+            result.update({"Status": "failed", "Error": "timeout"})
+            results[uuid] = result
+
+    return results
 
-def list_snap_mirror_relationships(print_output: bool = False, cluster_name: Optional[str] = None) -> List[Dict[str, Any]]:
+
+@_scoped_host_context
+def list_snap_mirror_relationships(print_output: bool = False, cluster_name: Optional[str] = None,
+                                   include_source_relationships: bool = False) -> List[Dict[str, Any]]:
     try:
         config = _retrieve_config(print_output=print_output)
     except InvalidConfigError:
@@ -43,25 +186,31 @@ def list_snap_mirror_relationships(print_output: bool = False, cluster_name: Opt
 
     if connectionType == "ONTAP":
         try:
-            _instantiate_connection(config=config, connectionType=connectionType, print_output=print_output)
+            connection = _instantiate_connection(config=config, connectionType=connectionType, print_output=print_output)
         except InvalidConfigError:
             raise
 
         try:
-            # Retrieve all relationships for which destination is on current cluster
-            destinationRelationships = NetAppSnapmirrorRelationship.get_collection()
-
-            # Do not retrieve relationships for which source is on current cluster
-            # Note: Uncomment below line to retrieve all relationships for which source is on current cluster, then add sourceRelationships to for loop
-            # sourceRelationships = NetAppSnapmirrorRelationship.get_collection(list_destinations_only=True)
+            # Retrieve all relationships for which destination is on current cluster. All displayed
+            # fields are requested in the collection query itself.
+            if include_source_relationships:
+                # Also retrieve relationships for which source is on current cluster; both
+                # collections are listed concurrently
+                with ThreadPoolExecutor(max_workers=2) as executor:
+                    destinationFuture = executor.submit(_get_snap_mirror_relationship_collection, connection)
+                    sourceFuture = executor.submit(_get_snap_mirror_relationship_collection, connection, list_destinations_only=True)
+                    relationships = destinationFuture.result() + sourceFuture.result()
+            else:
+                relationships = _get_snap_mirror_relationship_collection(connection)
 
             # Construct list of relationships
             relationshipsList = list()
-            for relationship in destinationRelationships:
-                try:
-                    relationship.get()
-                except NetAppRestError as err:
-                    relationship.get(list_destinations_only=True)
+            seenUuids = set()
+            for relationship in relationships:
+                # Relationships with both endpoints on the current cluster are returned by both queries
+                if relationship.uuid in seenUuids:
+                    continue
+                seenUuids.add(relationship.uuid)
 
                 if hasattr(relationship.source, "cluster"):
                     sourceCluster = relationship.source.cluster.name
@@ -82,11 +231,17 @@ def list_snap_mirror_relationships(print_output: bool = False, cluster_name: Opt
                 else:
                     healthy = "unknown"
 
+                if hasattr(relationship, "policy"):
+                    policyType = relationship.policy.type
+                else:
+                    policyType = None
+
                 relationshipDict = {
                     "UUID": relationship.uuid,
-                    "Type": relationship.policy.type,
+                    "Type": policyType,
                     "Healthy": healthy,
                     "Current Transfer Status": transferState,
+                    "Lag Time": getattr(relationship, "lag_time", None),
                     "Source Cluster": sourceCluster,
                     "Source SVM": relationship.source.svm.name,
                     "Source Volume": relationship.source.path.split(":")[1],
@@ -119,9 +274,10 @@ def list_snap_mirror_relationships(print_output: bool = False, cluster_name: Opt
         raise ConnectionTypeError()
 
 
+@_scoped_host_context
 def create_snap_mirror_relationship(source_svm: str, source_vol: str, target_vol: str, target_svm: Optional[str] = None, 
                                     cluster_name: Optional[str] = None, schedule: str = '', policy: str = 'MirrorAllSnapshots', 
-                                    action: Optional[str] = None, print_output: bool = False) -> None:
+                                    action: Optional[str] = None, print_output: bool = False, wait: bool = True):
     try:
         config = _retrieve_config(print_output=print_output)
     except InvalidConfigError:
@@ -178,7 +334,7 @@ def create_snap_mirror_relationship(source_svm: str, source_vol: str, target_vol
             if print_output:
                 logger.info("Creating snapmirror relationship: %s:%s -> %s:%s", source_svm, source_vol, target_svm, target_vol)
             newRelationship = NetAppSnapmirrorRelationship.from_dict(newRelationDict)
-            newRelationship.post(poll=True, poll_timeout=120)
+            run_job(newRelationship, "post")
         except NetAppRestError as err:
             if print_output:
                 logger.error("Error: ONTAP Rest API Error: %s", err)
@@ -220,18 +376,28 @@ def create_snap_mirror_relationship(source_svm: str, source_vol: str, target_vol
                     logger.info("Setting state to snapmirrored, action: %s", action)
                 patchRelation = NetAppSnapmirrorRelationship(uuid=uuid)
                 patchRelation.state = "snapmirrored"
-                patchRelation.patch(poll=True, poll_timeout=120)
+                job = run_job(patchRelation, "patch", wait=wait)
             except NetAppRestError as err:
                 if print_output:
                     logger.error("Error: ONTAP Rest API Error: %s", err)
                 raise APIConnectionError(err)
 
+            # Let the caller pipeline the initialize/resync job
+            if not wait:
+                return _operation_future(job)
+
+        # Without an action there is no job left to wait for
+        if not wait:
+            return _operation_future()
+
     else:
         raise ConnectionTypeError()
 
 
+@_scoped_host_context
 def sync_snap_mirror_relationship(uuid: Optional[str] = None, svm_name: Optional[str] = None, volume_name: Optional[str] = None, 
-                                 cluster_name: Optional[str] = None, wait_until_complete: bool = False, print_output: bool = False) -> None:
+                                 cluster_name: Optional[str] = None, wait_until_complete: bool = False, print_output: bool = False,
+                                 timeout: Optional[float] = SNAPMIRROR_WAIT_TIMEOUT) -> None:
     try:
         config = _retrieve_config(print_output=print_output)
     except InvalidConfigError:
@@ -248,7 +414,7 @@ def sync_snap_mirror_relationship(uuid: Optional[str] = None, svm_name: Optional
 
     if connectionType == "ONTAP":
         try:
-            _instantiate_connection(config=config, connectionType=connectionType, print_output=print_output)
+            connection = _instantiate_connection(config=config, connectionType=connectionType, print_output=print_output)
         except InvalidConfigError:
             raise
 
@@ -288,7 +454,7 @@ def sync_snap_mirror_relationship(uuid: Optional[str] = None, svm_name: Optional
 
         try:
             transfer = NetAppSnapmirrorTransfer(uuid)
-            transfer.post(poll=True)
+            run_job(transfer, "post")
         except NetAppRestError as err:
             if print_output:
                 logger.error("Error: ONTAP Rest API Error: %s", err)
@@ -298,40 +464,149 @@ def sync_snap_mirror_relationship(uuid: Optional[str] = None, svm_name: Optional
             logger.info("Sync operation successfully triggered.")
 
         if wait_until_complete:
-            logger.info("Waiting for sync operation to complete.")
-            logger.info("Status check will be performed in 10 seconds...")
-            time.sleep(10)
+            if print_output:
+                logger.info("Waiting for sync operation to complete.")
 
-            while True:
-                relationship = NetAppSnapmirrorRelationship.find(uuid=uuid)
-                relationship.get()
+            try:
+                result = _wait_for_snap_mirror_transfers(connection, {uuid: getattr(transfer, "uuid", None)},
+                                                         print_output=print_output, timeout=timeout)[uuid]
+            except NetAppRestError as err:
+                if print_output:
+                    logger.error("Error: ONTAP Rest API Error: %s", err)
+                raise APIConnectionError(err)
 
-                transferState = relationship.transfer.state if hasattr(relationship, "transfer") else None
+            if result["Status"] == "success":
+                if print_output:
+                    logger.info("Success: Sync operation is complete.")
+            elif result["Error"] == "not healthy":
+                if print_output:
+                    logger.error("Error: Relationship is not healthy. Access ONTAP System Manager for details.")
+                raise SnapMirrorSyncOperationError("not healthy")
+            elif result["Error"] == "timeout":
+                raise SnapMirrorSyncOperationError("timeout")
+            else:
+                if print_output:
+                    logger.error("Error: Unknown sync operation status (%s) returned by ONTAP API.", result["Error"])
+                raise SnapMirrorSyncOperationError(result["Error"])
 
-                if (not transferState) or (transferState == "success"):
-                    healthy = relationship.healthy
-                    if healthy:
-                        if print_output:
-                            logger.info("Success: Sync operation is complete.")
-                        break
-                    else:
-                        if print_output:
-                            logger.error("Error: Relationship is not healthy. Access ONTAP System Manager for details.")
-                        raise SnapMirrorSyncOperationError("not healthy")
-                elif transferState != "transferring":
-                    if print_output:
-                        logger.error("Error: Unknown sync operation status (%s) returned by ONTAP API.", transferState)
-                    raise SnapMirrorSyncOperationError(transferState)
-                else:
-                    if print_output:
-                        logger.info("Sync operation is not yet complete. Status: %s", transferState)
-                        logger.info("Checking again in 10 seconds...")
+    else:
+        raise ConnectionTypeError()
 
-                time.sleep(10)
 
-    else:
+@_scoped_host_context
+def sync_snap_mirror_relationships(uuids: List[str], cluster_name: Optional[str] = None, wait_until_complete: bool = True,
+                                   print_output: bool = False, timeout: Optional[float] = SNAPMIRROR_WAIT_TIMEOUT) -> List[Dict[str, Any]]:
+    """Trigger sync operations for several SnapMirror relationships at once.
+
+    All transfers are triggered first. When waiting, all relationships are then
+    polled together, with one collection query per batch and a poll interval
+    that backs off while no transfer finishes.
+
+    Args:
+        uuids: UUIDs of the relationships to sync
+        cluster_name: Non default cluster name
+        wait_until_complete: Whether to wait for all transfers to complete
+        print_output: Whether to print per-relationship progress
+        timeout: Seconds to wait for the transfers before reporting those still
+            pending as failed with the error "timeout" (None to wait indefinitely)
+
+    Returns:
+        List with one dict per relationship, in the same order as uuids, with
+        keys "UUID", "Destination", "Status", "Bytes Transferred", "Throughput"
+        (bytes per second), "Lag Time" and "Error". Status is "triggered" when
+        not waiting, otherwise "success" or "failed". A relationship that
+        fails does not stop the others.
+
+    Raises:
+        InvalidConfigError: If configuration is invalid
+        APIConnectionError: If polling the ONTAP API fails
+        ConnectionTypeError: If connection type is not ONTAP
+    """
+    try:
+        config = _retrieve_config(print_output=print_output)
+    except InvalidConfigError:
+        raise
+    try:
+        connectionType = config["connectionType"]
+    except KeyError:
+        if print_output:
+            _print_invalid_config_error()
+        raise InvalidConfigError()
+
+    if cluster_name:
+        config["hostname"] = cluster_name
+
+    if connectionType != "ONTAP":
         raise ConnectionTypeError()
 
+    try:
+        connection = _instantiate_connection(config=config, connectionType=connectionType, print_output=print_output)
+    except InvalidConfigError:
+        raise
+
+    results = dict((uuid, {"UUID": uuid, "Destination": None, "Status": None, "Bytes Transferred": None,
+                           "Throughput": None, "Lag Time": None, "Error": None}) for uuid in uuids)
+
+    # Trigger all transfers without waiting on each one
+    if print_output:
+        logger.info("Triggering sync operations for %d SnapMirror relationship(s).", len(results))
+    triggered = dict()
+    for uuid in results:
+        transfer = NetAppSnapmirrorTransfer(uuid)
+        transfer.set_connection(connection)
+        try:
+            triggered[uuid] = (transfer, run_job(transfer, "post", wait=False))
+        except NetAppRestError as err:
+            results[uuid]["Status"] = "failed"
+            results[uuid]["Error"] = str(err)
+
+    transfers = dict()
+    for uuid, (transfer, job) in triggered.items():
+        try:
+            job.result()
+            transfers[uuid] = getattr(transfer, "uuid", None)
+            results[uuid]["Status"] = "triggered"
+        except NetAppRestError as err:
+            results[uuid]["Status"] = "failed"
+            results[uuid]["Error"] = str(err)
+
+    for uuid, result in results.items():
+        if result["Status"] == "failed" and print_output:
+            logger.error("Error: Sync operation could not be triggered for relationship %s: %s", uuid, result["Error"])
+
+    if wait_until_complete and transfers:
+        if print_output:
+            logger.info("Waiting for %d sync operation(s) to complete.", len(transfers))
+        try:
+            results.update(_wait_for_snap_mirror_transfers(connection, transfers, print_output=print_output, timeout=timeout))
+        except NetAppRestError as err:
+            if print_output:
+                logger.error("Error: ONTAP Rest API Error: %s", err)
+            raise APIConnectionError(err)
+
+    resultsList = [results[uuid] for uuid in uuids]
+
+    if print_output:
+        try:
+            import pandas as pd
+            from tabulate import tabulate
+            displayList = list()
+            for result in resultsList:
+                displayResult = dict(result)
+                for key in ("Bytes Transferred", "Throughput"):
+                    if displayResult[key] is not None:
+                        displayResult[key] = _convert_bytes_to_pretty_size(displayResult[key])
+                if displayResult["Throughput"] is not None:
+                    displayResult["Throughput"] += "/s"
+                displayList.append(displayResult)
+            resultsDF = pd.DataFrame.from_dict(displayList, dtype="string")
+            logger.info("\n%s", tabulate(resultsDF, showindex=False, headers=resultsDF.columns))
+        except ImportError:
+            for result in resultsList:
+                logger.info(result)
+
+    return resultsList
+
 
 @deprecated
 def listSnapMirrorRelationships(printOutput: bool = False) -> list:
@@ -22,13 +22,22 @@ from ..core import (
     _print_invalid_config_error,
     deprecated
 )
+from ..core.connection import COLLECTION_PAGE_SIZE, _scoped_host_context
+from .job_tracker import _operation_future, run_job
 
 logger = setup_logger(__name__)
 
 
+@_scoped_host_context
 def create_snapshot(volume_name: str, cluster_name: Optional[str] = None, svm_name: Optional[str] = None, 
                    snapshot_name: Optional[str] = None, retention_count: int = 0, retention_days: bool = False, 
-                   snapmirror_label: Optional[str] = None, print_output: bool = False) -> None:
+                   snapmirror_label: Optional[str] = None, print_output: bool = False, wait: bool = True):
+    # Applying the retention count needs the new snapshot to exist
+    if retention_count and int(retention_count) > 0 and not wait:
+        if print_output:
+            logger.error("Error: wait=False cannot be combined with a retention count.")
+        raise InvalidSnapshotParameterError("wait")
+
     try:
         config = _retrieve_config(print_output=print_output)
     except InvalidConfigError:
@@ -86,10 +95,13 @@ def create_snapshot(volume_name: str, cluster_name: Optional[str] = None, svm_na
                 snapshotDict['snapmirror_label'] = snapmirror_label
 
             snapshot = NetAppSnapshot.from_dict(snapshotDict)
-            snapshot.post(poll=True)
+            job = run_job(snapshot, "post", wait=wait)
 
             if print_output:
-                logger.info("Snapshot created successfully.")
+                if wait:
+                    logger.info("Snapshot created successfully.")
+                else:
+                    logger.info("Snapshot creation submitted.")
 
         except NetAppRestError as err:
             if print_output:
@@ -113,8 +125,9 @@ def create_snapshot(volume_name: str, cluster_name: Optional[str] = None, svm_na
 
                 last_snapshot_list = []
                 snapshot_list = []
-                for snapshot in NetAppSnapshot.get_collection(volume.uuid):
-                    snapshot.get()
+                snapshots = NetAppSnapshot.get_collection(volume.uuid, fields="name,create_time", order_by="create_time",
+                                                          max_records=COLLECTION_PAGE_SIZE, name=snapshot_name_original+'.*')
+                for snapshot in snapshots:
                     if snapshot.name.startswith(snapshot_name_original+'.'):
                         if not retention_days:
                             snapshot_list.append(snapshot.name)
@@ -144,12 +157,15 @@ def create_snapshot(volume_name: str, cluster_name: Optional[str] = None, svm_na
     else:
         raise ConnectionTypeError()
     
-    # Return the created snapshot name
+    # Return the created snapshot name, or a future resolving to it when not waiting
+    if not wait:
+        return _operation_future(job, snapshot_name)
     return snapshot_name
 
 
+@_scoped_host_context
 def delete_snapshot(volume_name: str, snapshot_name: str, cluster_name: Optional[str] = None, svm_name: Optional[str] = None, 
-                   skip_owned: bool = False, print_output: bool = False) -> None:
+                   skip_owned: bool = False, print_output: bool = False, wait: bool = True):
     try:
         config = _retrieve_config(print_output=print_output)
     except InvalidConfigError:
@@ -204,12 +220,18 @@ def delete_snapshot(volume_name: str, snapshot_name: str, cluster_name: Optional
                 else:
                     if print_output:
                         logger.warning('Warning: Snapshot cannot be deleted since it has owners: %s', ','.join(snapshot.owners))
-                    return
+                    return None if wait else _operation_future()
 
-            snapshot.delete(poll=True)
+            job = run_job(snapshot, "delete", wait=wait)
 
             if print_output:
-                logger.info("Snapshot deleted successfully.")
+                if wait:
+                    logger.info("Snapshot deleted successfully.")
+                else:
+                    logger.info("Snapshot deletion submitted.")
+
+            if not wait:
+                return _operation_future(job)
 
         except NetAppRestError as err :
             if print_output:
@@ -220,6 +242,7 @@ def delete_snapshot(volume_name: str, snapshot_name: str, cluster_name: Optional
         raise ConnectionTypeError()
 
 
+@_scoped_host_context
 def list_snapshots(volume_name: str, cluster_name: Optional[str] = None, svm_name: Optional[str] = None, print_output: bool = False) -> List[Dict[str, Any]]:
     try:
         config = _retrieve_config(print_output=print_output)
@@ -258,8 +281,7 @@ def list_snapshots(volume_name: str, cluster_name: Optional[str] = None, svm_nam
                 raise InvalidVolumeParameterError("name")
 
             snapshotsList = list()
-            for snapshot in NetAppSnapshot.get_collection(volume.uuid):
-                snapshot.get()
+            for snapshot in NetAppSnapshot.get_collection(volume.uuid, fields="name,create_time,uuid", max_records=COLLECTION_PAGE_SIZE):
                 snapshotDict = {"Snapshot Name": snapshot.name, "Create Time": snapshot.create_time}
                 snapshotsList.append(snapshotDict)
 
@@ -285,7 +307,9 @@ def list_snapshots(volume_name: str, cluster_name: Optional[str] = None, svm_nam
         raise ConnectionTypeError()
 
 
-def restore_snapshot(volume_name: str, snapshot_name: str, cluster_name: Optional[str] = None, svm_name: Optional[str] = None, print_output: bool = False) -> None:
+@_scoped_host_context
+def restore_snapshot(volume_name: str, snapshot_name: str, cluster_name: Optional[str] = None, svm_name: Optional[str] = None, print_output: bool = False,
+                     wait: bool = True):
     try:
         config = _retrieve_config(print_output=print_output)
     except InvalidConfigError:
@@ -331,9 +355,15 @@ def restore_snapshot(volume_name: str, snapshot_name: str, cluster_name: Optiona
                     logger.error("Error: Invalid snapshot name.")
                 raise InvalidSnapshotParameterError("name")
 
-            volume.patch(volume.uuid, **{"restore_to.snapshot.name": snapshot.name, "restore_to.snapshot.uuid": snapshot.uuid}, poll=True)
+            job = run_job(volume, "patch", volume.uuid, wait=wait, **{"restore_to.snapshot.name": snapshot.name, "restore_to.snapshot.uuid": snapshot.uuid})
             if print_output:
-                logger.info("Snapshot restored successfully.")
+                if wait:
+                    logger.info("Snapshot restored successfully.")
+                else:
+                    logger.info("Snapshot restore submitted.")
+
+            if not wait:
+                return _operation_future(job)
 
         except NetAppRestError as err:
             if print_output:
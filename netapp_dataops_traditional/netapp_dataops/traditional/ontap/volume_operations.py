@@ -3,6 +3,9 @@
 import os
 import re
 import subprocess
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
 
 from netapp_ontap.error import NetAppRestError
 from netapp_ontap.resources import Volume as NetAppVolume
@@ -29,10 +32,13 @@ from ..core import (
     _convert_size_string_to_bytes,
     deprecated
 )
+from ..core.connection import COLLECTION_PAGE_SIZE, _scoped_host_context, ontap_connection
+from .job_tracker import _operation_future, get_job_tracker, run_job
 
 logger = setup_logger(__name__)
 
 
+@_scoped_host_context
 def get_volume(volume_name: str, print_output: bool = False):
     """Get details for a specific volume.
     
@@ -155,6 +161,7 @@ def get_volume(volume_name: str, print_output: bool = False):
         raise ConnectionTypeError()
 
 
+@_scoped_host_context
 def clone_volume(new_volume_name: str, source_volume_name: str, cluster_name: str = None, source_snapshot_name: str = None,
                  source_svm: str = None, target_svm: str = None, export_hosts: str = None, export_policy: str = None, split: bool = False,
                  unix_uid: str = None, unix_gid: str = None, mountpoint: str = None, junction: str= None, readonly: bool = False,
@@ -268,7 +275,7 @@ def clone_volume(new_volume_name: str, source_volume_name: str, cluster_name: st
                 export_policy = "netapp_dataops_"+new_volume_name
                 currentExportPolicy = NetAppExportPolicy.find(name=export_policy, svm=targetsvm)
                 if currentExportPolicy:
-                    currentExportPolicy.delete()
+                    run_job(currentExportPolicy, "delete")
         except NetAppRestError as err:
             if print_output:
                 logger.error("Error: ONTAP Rest API Error: %s", err)
@@ -281,14 +288,12 @@ def clone_volume(new_volume_name: str, source_volume_name: str, cluster_name: st
             svmSnapshotPolicy = False
             for snapshotPolicyDetails in snapshotPoliciesDetails:
                 if str(snapshotPolicyDetails.name) == snapshot_policy:
-                    try:
-                        # Get full details to access svm field
-                        snapshotPolicyDetails.get()
-                        if str(snapshotPolicyDetails.svm.name) == targetsvm:
-                            svmSnapshotPolicy = True
-                    except (KeyError, AttributeError):
-                        # Cluster-level policies don't have an svm field
+                    # The svm field is requested by the collection query; cluster-level policies don't have one
+                    policySvm = getattr(getattr(snapshotPolicyDetails, "svm", None), "name", None)
+                    if policySvm is None:
                         clusterSnapshotPolicy = True
+                    elif str(policySvm) == targetsvm:
+                        svmSnapshotPolicy = True
 
             if not clusterSnapshotPolicy and not svmSnapshotPolicy:
                 if print_output:
@@ -370,12 +375,13 @@ def clone_volume(new_volume_name: str, source_volume_name: str, cluster_name: st
                 latest_source_snapshot = None
                 latest_source_snapshot_uuid = None
 
-                # Retrieve all source snapshot from last to 1st
-                for snapshot in NetAppSnapshot.get_collection(sourceVolume.uuid):
-                    snapshot.get()
-                    if snapshot.name.startswith(source_snapshot_prefix):
-                        latest_source_snapshot = snapshot.name
-                        latest_source_snapshot_uuid = snapshot.uuid
+                # Retrieve only the most recent snapshot matching the prefix
+                snapshots = NetAppSnapshot.get_collection(sourceVolume.uuid, fields="name,create_time,uuid", name=source_snapshot_name,
+                                                          order_by="create_time desc", max_records=1)
+                snapshot = next(iter(snapshots), None)
+                if snapshot and snapshot.name.startswith(source_snapshot_prefix):
+                    latest_source_snapshot = snapshot.name
+                    latest_source_snapshot_uuid = snapshot.uuid
 
                 if not latest_source_snapshot:
                     if print_output:
@@ -397,7 +403,7 @@ def clone_volume(new_volume_name: str, source_volume_name: str, cluster_name: st
 
             # Create new volume clone
             newVolume = NetAppVolume.from_dict(newVolumeDict)
-            newVolume.post(poll=True, poll_timeout=120)
+            run_job(newVolume, "post")
             if print_output:
                 logger.info("Clone volume created successfully.")
 
@@ -436,7 +442,7 @@ def clone_volume(new_volume_name: str, source_volume_name: str, cluster_name: st
 
                 # Create new export policy
                 newExportPolicy = NetAppExportPolicy.from_dict(newExportPolicyDict)
-                newExportPolicy.post(poll=True, poll_timeout=120)
+                run_job(newExportPolicy, "post")
 
             except NetAppRestError as err:
                 if print_output:
@@ -451,7 +457,7 @@ def clone_volume(new_volume_name: str, source_volume_name: str, cluster_name: st
             updatedVolumeDetails = NetAppVolume(uuid=volumeDetails.uuid)
             updatedVolumeDetails.nas = {"export_policy": {"name": export_policy}}
             updatedVolumeDetails.snapshot_policy = {"name": snapshot_policy}
-            updatedVolumeDetails.patch(poll=True, poll_timeout=120)
+            run_job(updatedVolumeDetails, "patch")
         except NetAppRestError as err:
             if print_output:
                 logger.error("Error: ONTAP Rest API Error: %s", err)
@@ -466,7 +472,7 @@ def clone_volume(new_volume_name: str, source_volume_name: str, cluster_name: st
                 #get volume details
                 updatedVolumeDetails = NetAppVolume(uuid=volumeDetails.uuid)
                 updatedVolumeDetails.clone = {"split_initiated": True}
-                updatedVolumeDetails.patch()
+                run_job(updatedVolumeDetails, "patch")
 
         except NetAppRestError as err:
             if print_output:
@@ -486,11 +492,308 @@ def clone_volume(new_volume_name: str, source_volume_name: str, cluster_name: st
         raise ConnectionTypeError()
 
 
+@_scoped_host_context
+def clone_volumes(specs: List[Dict[str, Any]], cluster_name: str = None, source_svm: str = None, target_svm: str = None,
+                  max_workers: Optional[int] = None, print_output: bool = False) -> List[Dict[str, Any]]:
+    """Create many clone volumes concurrently.
+
+    Shared inputs (export policies, snapshot policies, source volumes and source
+    snapshots) are validated once with bulk queries. All clone POSTs are then
+    submitted without blocking, and the resulting ONTAP jobs are tracked by a
+    single shared poller.
+
+    Args:
+        specs: One dict per clone. Required keys are "new_volume_name" and
+            "source_volume_name". Optional keys are "source_snapshot_name"
+            (a trailing "*" selects the latest snapshot with that prefix),
+            "junction", "export_policy", "snapshot_policy", "unix_uid",
+            "unix_gid", "split" and "svm_dr_unprotect".
+        cluster_name: Non default cluster name
+        source_svm: Non default source SVM name
+        target_svm: Non default target SVM name
+        max_workers: Maximum number of concurrent API requests
+        print_output: Whether to print output messages
+
+    Returns:
+        List with one dict per spec, in the same order, with keys
+        "Volume Name", "Status" ("created" or "failed"), "Error" (message)
+        and "Reason" (None, or why the clone failed: "exists",
+        "export_policy", "snapshot_policy", "source_volume",
+        "source_snapshot" or "api_error"). "api_error" covers any
+        failure of the clone request or of the steps that follow it.
+
+    Raises:
+        InvalidConfigError: If configuration is invalid
+        APIConnectionError: If the ONTAP API validation queries fail
+        ConnectionTypeError: If connection type is not ONTAP
+    """
+    try:
+        config = _retrieve_config(print_output=print_output)
+    except InvalidConfigError:
+        raise
+    try:
+        connectionType = config["connectionType"]
+    except KeyError:
+        if print_output:
+            _print_invalid_config_error()
+        raise InvalidConfigError()
+
+    if cluster_name:
+        config["hostname"] = cluster_name
+
+    if connectionType != "ONTAP":
+        raise ConnectionTypeError()
+
+    if not specs:
+        return list()
+
+    try:
+        connection = _instantiate_connection(config=config, connectionType=connectionType, print_output=print_output)
+    except InvalidConfigError:
+        raise
+
+    try:
+        sourcesvm = source_svm if source_svm else config["svm"]
+        targetsvm = target_svm if target_svm else sourcesvm
+        defaultExportPolicy = config["defaultExportPolicy"]
+        defaultSnapshotPolicy = config["defaultSnapshotPolicy"]
+        defaultUnixUID = config["defaultUnixUID"]
+        defaultUnixGID = config["defaultUnixGID"]
+    except KeyError:
+        if print_output:
+            _print_invalid_config_error()
+        raise InvalidConfigError()
+
+    # Normalize specs and apply defaults
+    clones = list()
+    results = list()
+    for spec in specs:
+        clone = dict(spec)
+        try:
+            clone["new_volume_name"] = spec["new_volume_name"]
+            clone["source_volume_name"] = spec["source_volume_name"]
+        except KeyError:
+            if print_output:
+                logger.error("Error: Each clone spec requires 'new_volume_name' and 'source_volume_name'.")
+            raise InvalidVolumeParameterError("specs")
+        clone.setdefault("source_snapshot_name", None)
+        clone["junction"] = spec.get("junction") or "/" + clone["new_volume_name"]
+        clone["export_policy"] = spec.get("export_policy") or defaultExportPolicy
+        clone["snapshot_policy"] = spec.get("snapshot_policy") or defaultSnapshotPolicy
+        try:
+            # An explicit 0 (root) is a valid uid/gid, so only fall back to the defaults when unset
+            clone["unix_uid"] = int(spec.get("unix_uid") if spec.get("unix_uid") is not None else defaultUnixUID)
+            clone["unix_gid"] = int(spec.get("unix_gid") if spec.get("unix_gid") is not None else defaultUnixGID)
+        except ValueError:
+            if print_output:
+                logger.error("Error: Invalid unix uid/gid specified for clone '%s'. Value must be an integer.", clone["new_volume_name"])
+            raise InvalidVolumeParameterError("unixUID")
+        clones.append(clone)
+        results.append({"Volume Name": clone["new_volume_name"], "Status": None, "Error": None, "Reason": None})
+
+    def _fail(index: int, reason: str, message: str):
+        results[index]["Status"] = "failed"
+        results[index]["Error"] = message
+        results[index]["Reason"] = reason
+        if print_output:
+            logger.error("Error: clone '%s': %s", results[index]["Volume Name"], message)
+
+    def _fail_with_error(index: int, err: Exception):
+        # Any error is recorded against its own clone, so one clone cannot discard the results of the others
+        if isinstance(err, NetAppRestError):
+            _fail(index, "api_error", "ONTAP Rest API Error: " + str(err))
+        else:
+            _fail(index, "api_error", str(err) or type(err).__name__)
+
+    # Validate shared inputs once, using bulk collection queries
+    try:
+        newVolumeNames = sorted(set(clone["new_volume_name"] for clone in clones))
+        existingVolumes = set(volume.name for volume in NetAppVolume.get_collection(
+            connection=connection, svm=targetsvm, name="|".join(newVolumeNames), fields="name", max_records=COLLECTION_PAGE_SIZE))
+
+        exportPolicyNames = sorted(set(clone["export_policy"] for clone in clones))
+        existingExportPolicies = set(policy.name for policy in NetAppExportPolicy.get_collection(
+            connection=connection, name="|".join(exportPolicyNames), fields="name", **{"svm.name": targetsvm}))
+
+        snapshotPolicyNames = sorted(set(clone["snapshot_policy"] for clone in clones))
+        validSnapshotPolicies = set()
+        for policy in NetAppSnapshotPolicy.get_collection(connection=connection, name="|".join(snapshotPolicyNames), fields="name,svm.name"):
+            # Cluster-level policies don't have an svm field
+            policySvm = getattr(getattr(policy, "svm", None), "name", None)
+            if policySvm is None or policySvm == targetsvm:
+                validSnapshotPolicies.add(policy.name)
+
+        sourceVolumeNames = sorted(set(clone["source_volume_name"] for clone in clones))
+        sourceVolumes = dict((volume.name, volume) for volume in NetAppVolume.get_collection(
+            connection=connection, svm=sourcesvm, name="|".join(sourceVolumeNames), fields="name,uuid", max_records=COLLECTION_PAGE_SIZE))
+
+        # Resolve source snapshots once per (source volume, snapshot name)
+        sourceSnapshots = dict()
+        for clone in clones:
+            sourceVolume = sourceVolumes.get(clone["source_volume_name"])
+            snapshotName = clone["source_snapshot_name"]
+            if not sourceVolume or not snapshotName or (sourceVolume.name, snapshotName) in sourceSnapshots:
+                continue
+            query = dict(fields="name,uuid,create_time", name=snapshotName)
+            if snapshotName.endswith("*"):
+                query.update(order_by="create_time desc", max_records=1)
+            snapshot = next(iter(NetAppSnapshot.get_collection(sourceVolume.uuid, connection=connection, **query)), None)
+            sourceSnapshots[(sourceVolume.name, snapshotName)] = snapshot
+
+    except NetAppRestError as err:
+        if print_output:
+            logger.error("Error: ONTAP Rest API Error: %s", err)
+        raise APIConnectionError(err)
+
+    nameCounts = Counter(clone["new_volume_name"] for clone in clones)
+    newVolumes = dict()
+    for index, clone in enumerate(clones):
+        name = clone["new_volume_name"]
+        sourceVolume = sourceVolumes.get(clone["source_volume_name"])
+        if name in existingVolumes or nameCounts[name] > 1:
+            _fail(index, "exists", "volume already exists or is specified more than once.")
+            continue
+        if clone["export_policy"] not in existingExportPolicies:
+            _fail(index, "export_policy", "export policy '" + clone["export_policy"] + "' does not exist.")
+            continue
+        if clone["snapshot_policy"] not in validSnapshotPolicies:
+            _fail(index, "snapshot_policy", "snapshot-policy '" + clone["snapshot_policy"] + "' could not be found.")
+            continue
+        if not sourceVolume:
+            _fail(index, "source_volume", "invalid source volume name '" + clone["source_volume_name"] + "'.")
+            continue
+
+        newVolumeDict = {
+            "name": name,
+            "svm": {"name": targetsvm},
+            "nas": {
+                "path": clone["junction"]
+            },
+            "clone": {
+                "is_flexclone": True,
+                "parent_svm": {
+                    "name": sourcesvm,
+                },
+                "parent_volume": {
+                    "name": sourceVolume.name,
+                    "uuid": sourceVolume.uuid
+                }
+            }
+        }
+        if clone["unix_uid"] != 0:
+            newVolumeDict["nas"]["uid"] = clone["unix_uid"]
+        if clone["unix_gid"] != 0:
+            newVolumeDict["nas"]["gid"] = clone["unix_gid"]
+
+        if clone["source_snapshot_name"]:
+            sourceSnapshot = sourceSnapshots.get((sourceVolume.name, clone["source_snapshot_name"]))
+            if not sourceSnapshot:
+                _fail(index, "source_snapshot", "invalid source snapshot name '" + clone["source_snapshot_name"] + "'.")
+                continue
+            newVolumeDict["clone"]["parent_snapshot"] = {
+                "name": sourceSnapshot.name,
+                "uuid": sourceSnapshot.uuid
+            }
+
+        # set clone volume comment parameter
+        comment = 'PARENTSVM:'+sourcesvm+',PARENTVOL:'+sourceVolume.name+',CLONESVM:'+targetsvm+',CLONENAME:'+name
+        if clone["source_snapshot_name"]: comment += ' SNAP:'+newVolumeDict["clone"]["parent_snapshot"]["name"]
+        comment += " netapp-dataops"
+        newVolumeDict["comment"] = comment
+
+        newVolume = NetAppVolume.from_dict(newVolumeDict)
+        newVolume.set_connection(connection)
+        newVolumes[index] = newVolume
+
+    if print_output:
+        logger.info("Creating %d clone volume(s) on svm '%s'.", len(newVolumes), targetsvm)
+
+    tracker = get_job_tracker(connection)
+
+    def _submit_clone(index: int):
+        # Submit the clone without waiting for the resulting job
+        return tracker.track_response(newVolumes[index].post(poll=False))
+
+    def _complete_clone(index: int, cloneJob):
+        clone = clones[index]
+        cloneJob.result()
+
+        # Set export policy and snapshot policy
+        updatedVolumeDetails = NetAppVolume(uuid=_get_volume_uuid(newVolumes[index], targetsvm, connection))
+        updatedVolumeDetails.set_connection(connection)
+        updatedVolumeDetails.nas = {"export_policy": {"name": clone["export_policy"]}}
+        updatedVolumeDetails.snapshot_policy = {"name": clone["snapshot_policy"]}
+        tracker.track_response(updatedVolumeDetails.patch(poll=False)).result()
+
+        if clone.get("split"):
+            splitVolume = NetAppVolume(uuid=updatedVolumeDetails.uuid)
+            splitVolume.set_connection(connection)
+            splitVolume.clone = {"split_initiated": True}
+            tracker.track_response(splitVolume.patch(poll=False)).result()
+
+        if clone.get("svm_dr_unprotect"):
+            try:
+                cli = NetAppCLI()
+                cli.set_connection(connection)
+                cli.execute("volume modify", vserver=targetsvm, volume=clone["new_volume_name"],
+                            body={"vserver_dr_protection": "unprotected"})
+            except NetAppRestError as err:
+                if "volume is not part of a Vserver DR configuration" not in str(err):
+                    raise
+                if print_output:
+                    logger.warning("Warning: could not disable svm-dr-protection for clone '%s' since volume is not protected using svm-dr",
+                                   clone["new_volume_name"])
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        submitted = dict()
+        for index in newVolumes:
+            submitted[index] = executor.submit(_submit_clone, index)
+
+        completed = dict()
+        for index, submission in submitted.items():
+            try:
+                cloneJob = submission.result()
+            except Exception as err:
+                _fail_with_error(index, err)
+                continue
+            completed[index] = executor.submit(_complete_clone, index, cloneJob)
+
+        for index, completion in completed.items():
+            try:
+                completion.result()
+                results[index]["Status"] = "created"
+            except Exception as err:
+                _fail_with_error(index, err)
+
+    if print_output:
+        created = len([result for result in results if result["Status"] == "created"])
+        logger.info("%d of %d clone volume(s) created successfully.", created, len(results))
+
+    return results
+
+
+def _get_volume_uuid(volume, svm: str, connection) -> str:
+    # POST responses normally carry the new volume's location; fall back to a lookup by name
+    if getattr(volume, "uuid", None):
+        return volume.uuid
+    foundVolume = NetAppVolume.find(connection=connection, name=volume.name, svm=svm)
+    if not foundVolume:
+        raise NetAppRestError("volume '" + volume.name + "' could not be found after it was created.")
+    return foundVolume.uuid
+
+
+@_scoped_host_context
 def create_volume(volume_name: str, volume_size: str, guarantee_space: bool = False, cluster_name: str = None, svm_name: str = None,
                   volume_type: str = None, unix_permissions: str = None,
                   unix_uid: str = None, unix_gid: str = None, export_policy: str = None, snaplock_type: str = None,
                   snapshot_policy: str = None, aggregate: str = None, mountpoint: str = None, junction: str = None, readonly: bool = False,
-                  print_output: bool = False, tiering_policy: str = None, vol_dp: bool = False):
+                  print_output: bool = False, tiering_policy: str = None, vol_dp: bool = False, wait: bool = True):
+    # The volume has to exist before it can be mounted locally
+    if mountpoint and not wait:
+        if print_output:
+            logger.error("Error: wait=False cannot be combined with a mountpoint.")
+        raise InvalidVolumeParameterError("wait")
+
     try:
         config = _retrieve_config(print_output=print_output)
     except InvalidConfigError:
@@ -649,14 +952,20 @@ def create_volume(volume_name: str, volume_size: str, guarantee_space: bool = Fa
             logger.info("Creating volume '" + volume_name + "' on svm '" + svm + "'")
         try:
             volume = NetAppVolume.from_dict(volumeDict)
-            volume.post(poll=True)
-            if print_output:
-                logger.info("Volume created successfully.")
+            job = run_job(volume, "post", wait=wait)
         except NetAppRestError as err:
             if print_output:
                 logger.error("Error: ONTAP Rest API Error: %s", err)
             raise APIConnectionError(err)
 
+        if not wait:
+            if print_output:
+                logger.info("Volume creation submitted.")
+            return _operation_future(job)
+
+        if print_output:
+            logger.info("Volume created successfully.")
+
         # Optionally mount newly created volume
         if mountpoint:
             try:
@@ -671,8 +980,9 @@ def create_volume(volume_name: str, volume_size: str, guarantee_space: bool = Fa
 
 
 # Need to declare here so clone_volume can call it - will be implemented in next step
+@_scoped_host_context
 def delete_volume(volume_name: str, cluster_name: str = None, svm_name: str = None, delete_mirror: bool = False,
-                delete_non_clone: bool = False, print_output: bool = False):
+                delete_non_clone: bool = False, print_output: bool = False, wait: bool = True):
     # Retrieve config details from config file
     try:
         config = _retrieve_config(print_output=print_output)
@@ -742,7 +1052,7 @@ def delete_volume(volume_name: str, cluster_name: str = None, svm_name: str = No
                     logger.info("Deleting snapmirror relationship: "+svm+":"+volume_name)
                 try:
                     deleteRelation = NetAppSnapmirrorRelationship(uuid=uuid)
-                    deleteRelation.delete(poll=True, poll_timeout=120)
+                    run_job(deleteRelation, "delete")
                 except NetAppRestError as err:
                     if print_output:
                         logger.error("Error: ONTAP Rest API Error: %s", err)
@@ -758,7 +1068,7 @@ def delete_volume(volume_name: str, cluster_name: str = None, svm_name: str = No
                     if print_output:
                         logger.info("release relationship: "+rel.source.path+" -> "+rel.destination.path)
                     deleteRelation = NetAppSnapmirrorRelationship(uuid=uuid)
-                    deleteRelation.delete(poll=True, poll_timeout=120,source_only=True)
+                    run_job(deleteRelation, "delete", source_only=True)
             except NetAppRestError as err:
                 if print_output:
                     logger.error("Error: ONTAP Rest API Error: %s", err)
@@ -797,15 +1107,18 @@ def delete_volume(volume_name: str, cluster_name: str = None, svm_name: str = No
                 if flexcache:
                     # Unmounting flexcache volume
                     volume.nas.path = ""
-                    volume.patch()
+                    run_job(volume, "patch")
                     # Delete flexcache volume
-                    flexcache.delete(poll=True, poll_timeout=120)
+                    job = run_job(flexcache, "delete", wait=wait)
                 else:
                     if print_output:
                         logger.error("Error: Could not find flexcache volume.")
                     raise InvalidVolumeParameterError("name")
                 if print_output:
-                    logger.info("Flexcache volume deleted successfully.")
+                    if wait:
+                        logger.info("Flexcache volume deleted successfully.")
+                    else:
+                        logger.info("Flexcache volume deletion submitted.")
             except NetAppRestError as err:
                 if print_output:
                     logger.error("Error: ONTAP Rest API Error: %s", err)
@@ -815,10 +1128,13 @@ def delete_volume(volume_name: str, cluster_name: str = None, svm_name: str = No
                 if print_output:
                     logger.info("Deleting volume '" + svm+':'+volume_name + "'.")
                 # Delete volume
-                volume.delete(poll=True)
+                job = run_job(volume, "delete", wait=wait)
 
                 if print_output:
-                    logger.info("Volume deleted successfully.")
+                    if wait:
+                        logger.info("Volume deleted successfully.")
+                    else:
+                        logger.info("Volume deletion submitted.")
 
             except NetAppRestError as err:
                 if print_output:
@@ -830,6 +1146,9 @@ def delete_volume(volume_name: str, cluster_name: str = None, svm_name: str = No
                         logger.error("Error: ONTAP Rest API Error: %s", err)
                 raise APIConnectionError(err)
 
+        if not wait:
+            return _operation_future(job)
+
     else:
         raise ConnectionTypeError()
 
@@ -962,7 +1281,9 @@ def unmount_volume(mountpoint: str, print_output: bool = False):
         raise MountOperationError(err)
 
 
-def list_volumes(check_local_mounts: bool = False, include_space_usage_details: bool = False, print_output: bool = False, cluster_name: str = None, svm_name: str = None) -> list:
+@_scoped_host_context
+def list_volumes(check_local_mounts: bool = False, include_space_usage_details: bool = False, print_output: bool = False, cluster_name: str = None, svm_name: str = None,
+                 junction_path: str = None) -> list:
     try:
         config = _retrieve_config(print_output=print_output)
     except InvalidConfigError:
@@ -988,8 +1309,38 @@ def list_volumes(check_local_mounts: bool = False, include_space_usage_details:
             if svm_name:
                 svmname = svm_name
 
-            # Retrieve all volumes for SVM
-            volumes = NetAppVolume.get_collection(svm=svmname)
+            # Retrieve all volumes for SVM, including all required fields, in as few
+            # paged collection calls as possible
+            baseVolumeFields = "name,nas.path,size,style,clone,flexcache_endpoint_type"
+            volumeFields = baseVolumeFields
+            if include_space_usage_details :
+                volumeFields += ",space,constituents"
+            # Optionally let ONTAP filter on junction path (wildcards such as "/root/*" are supported)
+            volumeQuery = dict()
+            if junction_path :
+                volumeQuery["nas.path"] = junction_path
+            try :
+                volumes = list(NetAppVolume.get_collection(svm=svmname, fields=volumeFields, max_records=COLLECTION_PAGE_SIZE, **volumeQuery))
+            except NetAppRestError as err :
+                # Older ONTAP versions do not support the constituents field
+                if not include_space_usage_details :
+                    raise
+                volumeFields = baseVolumeFields + ",space"
+                volumes = list(NetAppVolume.get_collection(svm=svmname, fields=volumeFields, max_records=COLLECTION_PAGE_SIZE, **volumeQuery))
+
+            # Retrieve FlexCache origins for all caches on the SVM with a single collection call
+            flexcacheOrigins = dict()
+            if any(getattr(volume, "flexcache_endpoint_type", None) == "cache" for volume in volumes):
+                try:
+                    for relation in NetAppFlexCache.get_collection(fields="name,origins", max_records=COLLECTION_PAGE_SIZE, **{"svm.name": svmname}):
+                        if getattr(relation, "origins", None):
+                            flexcacheOrigins[relation.name] = relation.origins[0]
+                except NetAppRestError as err:
+                    # FlexCache origins are informational; list the volumes without them
+                    if print_output:
+                        logger.error("Error: ONTAP Rest API Error: %s", err)
+                    else:
+                        logger.debug("Could not retrieve FlexCache origins: %s", err)
 
             # Retrieve local mounts if desired
             if check_local_mounts :
@@ -998,18 +1349,6 @@ def list_volumes(check_local_mounts: bool = False, include_space_usage_details:
             # Construct list of volumes; do not include SVM root volume
             volumesList = list()
             for volume in volumes:
-                baseVolumeFields = "nas.path,size,style,clone,flexcache_endpoint_type"
-                try :
-                    volumeFields = baseVolumeFields
-                    if include_space_usage_details :
-                        volumeFields += ",space,constituents"
-                    volume.get(fields=volumeFields)
-                except NetAppRestError as err :
-                    volumeFields = baseVolumeFields
-                    if include_space_usage_details :
-                        volumeFields += ",space"
-                    volume.get(fields=volumeFields)
-
                 # Retrieve volume export path; handle case where volume is not exported
                 if hasattr(volume, "nas"):
                     volumeExportPath = volume.nas.path
@@ -1051,19 +1390,10 @@ def list_volumes(check_local_mounts: bool = False, include_space_usage_details:
                     # Determine if FlexCache
                     if getattr(volume, "flexcache_endpoint_type", None) == "cache":
                         flexcache = "yes"
-                        try:
-                            flexcache_relationships = NetAppFlexCache.get_collection(name=volume.name, **{"svm.name": svmname})
-                            flexcache_relationships = list(flexcache_relationships)
-                            if flexcache_relationships:
-                                relation = flexcache_relationships[0]
-                                relation.get()
-                                if relation.origins and len(relation.origins) > 0:
-                                    flexcacheParentSvm = getattr(relation.origins[0].svm, "name", "")
-                                    flexcacheParentVolume = getattr(relation.origins[0].volume, "name", "")
-                        except NetAppRestError as err:
-                            if print_output:
-                                logger.error("Error: ONTAP Rest API Error: %s", err)
-                            pass
+                        origin = flexcacheOrigins.get(volume.name)
+                        if origin is not None:
+                            flexcacheParentSvm = getattr(getattr(origin, "svm", None), "name", "")
+                            flexcacheParentVolume = getattr(getattr(origin, "volume", None), "name", "")
 
                     # Convert size in bytes to "pretty" size (size in KB, MB, GB, or TB)
                     prettySize = _convert_bytes_to_pretty_size(size_in_bytes=volume.size)
@@ -1141,6 +1471,74 @@ def list_volumes(check_local_mounts: bool = False, include_space_usage_details:
         raise ConnectionTypeError()
 
 
+def list_volumes_multi(clusters: List[str], check_local_mounts: bool = False, include_space_usage_details: bool = False,
+                       svm_name: str = None, max_workers: Optional[int] = None, print_output: bool = False) -> list:
+    """List volumes across several ONTAP clusters concurrently.
+
+    Runs list_volumes() against each cluster in a thread pool and merges the
+    results. The same credentials are used for every cluster.
+
+    Args:
+        clusters: Cluster management hostnames (or "host:port") to query
+        check_local_mounts: Include the local mountpoint of each volume
+        include_space_usage_details: Include space usage details for each volume
+        svm_name: Non default SVM name, used on every cluster
+        max_workers: Maximum number of clusters queried at once (defaults to one per cluster)
+        print_output: Whether to print output messages
+
+    Returns:
+        List of volume dictionaries as returned by list_volumes(), each with an
+        additional "Cluster" key. A cluster that could not be queried does not
+        discard the results of the others; it contributes a single dictionary
+        with "Cluster" and "Error" keys instead.
+
+    Raises:
+        InvalidConfigError: If configuration is invalid
+        APIConnectionError: If the ONTAP API call fails for every cluster
+        ConnectionTypeError: If connection type is not ONTAP
+    """
+    def _list_cluster_volumes(cluster: str) -> list:
+        with ontap_connection(cluster):
+            clusterVolumes = list_volumes(check_local_mounts=check_local_mounts, include_space_usage_details=include_space_usage_details,
+                                          svm_name=svm_name, print_output=False)
+        for volumeDict in clusterVolumes:
+            volumeDict["Cluster"] = cluster
+        return clusterVolumes
+
+    volumesList = list()
+    if not clusters:
+        return volumesList
+
+    errors = list()
+    with ThreadPoolExecutor(max_workers=max_workers or len(clusters)) as executor:
+        futures = [(cluster, executor.submit(_list_cluster_volumes, cluster)) for cluster in clusters]
+        for cluster, future in futures:
+            try:
+                volumesList.extend(future.result())
+            except (InvalidConfigError, APIConnectionError, ConnectionTypeError) as err:
+                if print_output:
+                    logger.error("Error: Error retrieving volumes from cluster '%s': %s", cluster, err)
+                errors.append(err)
+                volumesList.append({"Cluster": cluster, "Error": str(err) or type(err).__name__})
+
+    # Only fail outright if there is nothing to return
+    if errors and len(errors) == len(clusters):
+        raise errors[0]
+
+    if print_output:
+        try:
+            import pandas as pd
+            from tabulate import tabulate
+            volumesDF = pd.DataFrame.from_dict(volumesList, dtype="string")
+            logger.info("\n%s", tabulate(volumesDF, showindex=False, headers=volumesDF.columns))
+        except ImportError:
+            logger.info("Volumes retrieved successfully")
+            for vol in volumesList:
+                logger.info(vol)
+
+    return volumesList
+
+
 # Backward compatibility functions (deprecated)
 @deprecated
 def cloneVolume(newVolumeName: str, sourceVolumeName: str, sourceSnapshotName: str = None, unixUID: str = None, unixGID: str = None, mountpoint: str = None, printOutput: bool = False):
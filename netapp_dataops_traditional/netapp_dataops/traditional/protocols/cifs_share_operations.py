@@ -18,11 +18,14 @@ from ..core import (
     _instantiate_connection, 
     _print_invalid_config_error
 )
+from ..core.connection import _scoped_host_context
 
+from ..ontap.job_tracker import run_job
 from ...logging_utils import setup_logger
 
 logger = setup_logger(__name__)
 
+@_scoped_host_context
 def create_cifs_share(
     name: str,
     volume_name: str,
@@ -167,7 +170,7 @@ def create_cifs_share(
                 cifs_share.acls = acls
         
             # Create the share
-            cifs_share.post(poll=True)
+            run_job(cifs_share, "post")
             
             if print_output:
                 logger.info("CIFS share '%s' created successfully", name)
@@ -183,6 +186,7 @@ def create_cifs_share(
         raise ConnectionTypeError()
     
 
+@_scoped_host_context
 def list_cifs_shares(
     svm: Optional[str] = None,
     name_pattern: Optional[str] = None,
@@ -328,6 +332,7 @@ def list_cifs_shares(
         raise ConnectionTypeError()
     
 
+@_scoped_host_context
 def get_cifs_share(
     name: str,
     svm: str,
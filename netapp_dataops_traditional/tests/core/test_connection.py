@@ -0,0 +1,73 @@
+import pytest
+from netapp_ontap.host_connection import HostConnection
+from netapp_dataops.traditional.core import connection
+
+
+CONFIG = {"hostname": "cluster.example.com", "username": "admin", "password": "secret"}
+
+
+@pytest.fixture(autouse=True)
+def empty_pool():
+    connection.close_connections()
+    previous_host_context = HostConnection.get_host_context()
+    yield
+    connection.close_connections()
+    connection.netappHostContext.host_context = previous_host_context
+
+
+def test_connections_are_reused():
+    """Test that calls with the same config share one pooled connection"""
+    first = connection._instantiate_connection(dict(CONFIG))
+    second = connection._instantiate_connection(dict(CONFIG))
+    assert first is second
+    assert HostConnection.get_host_context() is first
+
+
+def test_pool_size_is_part_of_the_key():
+    """Test that a different pool size gets a connection of its own, sized as requested"""
+    default = connection._instantiate_connection(dict(CONFIG))
+    large = connection._instantiate_connection(dict(CONFIG), pool_size=32)
+    assert large is not default
+    assert large.session.get_adapter(large.origin)._pool_maxsize == 32
+    assert default.session.get_adapter(default.origin)._pool_maxsize == connection.DEFAULT_CONNECTION_POOL_SIZE
+
+
+def test_custom_port_is_split_from_hostname():
+    """Test that a port given in the hostname is passed to the connection separately"""
+    conn = connection._instantiate_connection(dict(CONFIG, hostname="cluster.example.com:8443"))
+    assert conn.origin == "https://cluster.example.com:8443"
+
+
+def test_password_change_replaces_connection_without_closing_it():
+    """Test that a new password builds a new connection and leaves the old one usable"""
+    old = connection._instantiate_connection(dict(CONFIG))
+    old_session = old.session
+    new = connection._instantiate_connection(dict(CONFIG, password="changed"))
+    assert new is not old
+    assert new.password == "changed"
+    assert old.session is old_session
+    assert connection._instantiate_connection(dict(CONFIG, password="changed")) is new
+
+
+def test_close_connections_empties_the_pool():
+    """Test that closing the pool keeps the sessions of closed connections usable and builds new ones afterwards"""
+    conn = connection._instantiate_connection(dict(CONFIG), pool_size=4)
+    session = conn.session
+    connection.close_connections()
+    assert conn.session is session
+    assert conn.session.get_adapter(conn.origin)._pool_maxsize == 4
+    assert connection._instantiate_connection(dict(CONFIG), pool_size=4) is not conn
+
+
+def test_scoped_host_context_restores_callers_connection():
+    """Test that the connection bound by an operation does not outlive it"""
+    callers = HostConnection("other.example.com", username="admin", password="secret")
+
+    @connection._scoped_host_context
+    def operation():
+        return connection._instantiate_connection(dict(CONFIG))
+
+    with callers:
+        bound = operation()
+        assert HostConnection.get_host_context() is callers
+    assert bound is not callers
@@ -0,0 +1,104 @@
+import errno
+import os
+import pytest
+from unittest.mock import patch
+from netapp_dataops.traditional.core import utilities
+
+
+def _make_tree(root, paths):
+    """Create files (with their path as content) below root"""
+    for path in paths:
+        filepath = os.path.join(root, path)
+        os.makedirs(os.path.dirname(filepath), exist_ok=True)
+        with open(filepath, "w") as fileobj:
+            fileobj.write(path)
+
+
+def test_crawl_in_parallel_visits_every_item():
+    """Test that items added while crawling are crawled too, and all results are yielded"""
+    def crawl(item, add_item):
+        if item < 100:
+            add_item(item * 2 + 1)
+            add_item(item * 2 + 2)
+        yield [item]
+
+    assert sorted(utilities._crawl_in_parallel(0, crawl, maxWorkers=4)) == list(range(0, 201))
+
+
+def test_crawl_in_parallel_reraises_crawl_errors():
+    """Test that an error raised by a crawler is re-raised to the consumer"""
+    def crawl(item, add_item):
+        raise ValueError("unreadable")
+        yield [item]
+
+    with pytest.raises(ValueError, match="unreadable"):
+        list(utilities._crawl_in_parallel(0, crawl, maxWorkers=2))
+
+
+def test_crawl_in_parallel_stops_with_consumer():
+    """Test that the consumer can stop iterating before the crawl is complete"""
+    def crawl(item, add_item):
+        add_item(item + 1)
+        yield [item]
+
+    results = utilities._crawl_in_parallel(0, crawl, maxWorkers=2)
+    assert next(results) == 0
+    results.close()
+
+
+def test_scan_directory_tree_finds_all_files(tmp_path):
+    """Test that all files are found with their relative paths and stat results"""
+    _make_tree(str(tmp_path), ["a", os.path.join("d", "b"), os.path.join("d", "e", "c"), ".hidden"])
+    files = list(utilities._scan_directory_tree(str(tmp_path), maxWorkers=4, batchSize=1))
+    assert sorted(relative for _, relative, _ in files) == sorted([".hidden", "a", os.path.join("d", "b"),
+                                                                   os.path.join("d", "e", "c")])
+    for path, relative, stat in files:
+        assert path == os.path.join(str(tmp_path), relative)
+        assert stat.st_size == len(relative)
+
+
+def test_scan_directory_tree_skips_hidden(tmp_path):
+    """Test that hidden files and directories are skipped on request"""
+    _make_tree(str(tmp_path), ["a", ".hidden", os.path.join(".dir", "b")])
+    files = utilities._scan_directory_tree(str(tmp_path), maxWorkers=2, skipHidden=True)
+    assert [relative for _, relative, _ in files] == ["a"]
+
+
+def test_scan_directory_tree_does_not_follow_directory_links(tmp_path):
+    """Test that symbolic links to directories are not followed"""
+    _make_tree(str(tmp_path), [os.path.join("d", "a")])
+    os.symlink(str(tmp_path / "d"), str(tmp_path / "link"))
+    files = utilities._scan_directory_tree(str(tmp_path), maxWorkers=2)
+    assert [relative for _, relative, _ in files] == [os.path.join("d", "a")]
+
+
+def test_scan_directory_tree_yields_broken_links_without_stat(tmp_path):
+    """Test that files that cannot be stat'ed are yielded with a stat result of None"""
+    os.symlink(str(tmp_path / "missing"), str(tmp_path / "broken"))
+    assert list(utilities._scan_directory_tree(str(tmp_path), maxWorkers=1)) == [
+        (str(tmp_path / "broken"), "broken", None)]
+
+
+def test_scan_directory_tree_records_unreadable_directories(tmp_path):
+    """Test that directories that cannot be read are skipped and reported"""
+    _make_tree(str(tmp_path), ["a", os.path.join("locked", "b")])
+    real_scandir = os.scandir
+
+    def scandir(path):
+        if os.path.basename(path) == "locked":
+            raise PermissionError(errno.EACCES, "Permission denied", path)
+        return real_scandir(path)
+
+    unreadable = []
+    with patch("os.scandir", side_effect=scandir):
+        files = list(utilities._scan_directory_tree(str(tmp_path), maxWorkers=2, unreadableDirectories=unreadable))
+    assert [relative for _, relative, _ in files] == ["a"]
+    assert unreadable == [str(tmp_path / "locked")]
+
+
+def test_scan_directory_tree_records_missing_root(tmp_path):
+    """Test that a missing root directory is reported as unreadable"""
+    unreadable = []
+    root = str(tmp_path / "missing")
+    assert list(utilities._scan_directory_tree(root, maxWorkers=1, unreadableDirectories=unreadable)) == []
+    assert unreadable == [root]
@@ -0,0 +1,107 @@
+import errno
+import os
+import re
+import pytest
+from unittest.mock import patch
+from netapp_dataops.traditional.datasets import dataset as dataset_module
+from netapp_dataops.traditional.datasets.exceptions import DatasetError, DatasetExistsError, DatasetVolumeError
+
+
+def _dataset(path, name="source"):
+    """Build a Dataset bound to a local directory, without an ONTAP lookup"""
+    ds = dataset_module.Dataset.__new__(dataset_module.Dataset)
+    ds.name = name
+    ds.print_output = False
+    ds.max_size = "10GB"
+    ds.local_file_path = str(path)
+    ds._root_volume_name = "datasets"
+    ds._root_mountpoint = os.path.dirname(str(path))
+    ds._root_export_policy = "datasets-policy"
+    return ds
+
+
+def _write(root, relative_path, data="data"):
+    path = os.path.join(str(root), relative_path)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as fileobj:
+        fileobj.write(data)
+
+
+def test_iter_files_lists_all_files(tmp_path):
+    """Test that iter_files yields every file, including hidden ones, with its size"""
+    _write(tmp_path, "a", "xx")
+    _write(tmp_path, os.path.join("d", "b"), "yyy")
+    _write(tmp_path, ".hidden", "z")
+    files = sorted((os.path.relpath(file.filepath, str(tmp_path)), file.size) for file in _dataset(tmp_path).iter_files())
+    assert files == [(".hidden", 1), ("a", 2), (os.path.join("d", "b"), 3)]
+
+
+def test_iter_files_of_missing_directory(tmp_path):
+    """Test that a dataset without a local directory has no files"""
+    assert list(_dataset(tmp_path / "missing").iter_files()) == []
+
+
+def test_get_files_raises_for_broken_link(tmp_path):
+    """Test that a file that cannot be stat'ed raises DatasetError"""
+    _write(tmp_path, "a")
+    os.symlink(str(tmp_path / "missing"), str(tmp_path / "broken"))
+    with pytest.raises(DatasetError):
+        _dataset(tmp_path).get_files()
+
+
+def test_fingerprint_matches_copy(tmp_path):
+    """Test that a dataset and a copy of it have the same fingerprint"""
+    _write(tmp_path / "source", os.path.join("d", "a"), "content")
+    _write(tmp_path / "copy", os.path.join("d", "a"), "content")
+    source = _dataset(tmp_path / "source").fingerprint(index_path=str(tmp_path / "source.sqlite"))
+    copy = _dataset(tmp_path / "copy", name="copy").fingerprint(index_path=str(tmp_path / "copy.sqlite"))
+    assert source == copy
+
+
+def test_fingerprint_raises_for_unreadable_directory(tmp_path):
+    """Test that fingerprinting a dataset whose directory cannot be read raises DatasetError"""
+    with pytest.raises(DatasetError):
+        _dataset(tmp_path / "missing").fingerprint(index_path=str(tmp_path / "index.sqlite"))
+
+
+def _unreadable(name):
+    """Return an os.scandir replacement that fails for directories with the given name"""
+    real_scandir = os.scandir
+
+    def scandir(path):
+        if os.path.basename(str(path).rstrip(os.sep)) == name:
+            raise PermissionError(errno.EACCES, "Permission denied", path)
+        return real_scandir(path)
+
+    return scandir
+
+
+@pytest.mark.parametrize("indexed_before", [False, True])
+def test_fingerprint_raises_for_unreadable_subdirectory(tmp_path, indexed_before):
+    """Test that fingerprinting raises DatasetError naming a subdirectory that cannot be read, indexed or not"""
+    _write(tmp_path / "source", os.path.join("d", "a"), "content")
+    _write(tmp_path / "source", "b", "content")
+    ds = _dataset(tmp_path / "source")
+    index_path = str(tmp_path / "index.sqlite")
+    if indexed_before:
+        ds.fingerprint(index_path=index_path)
+    with patch("os.scandir", side_effect=_unreadable("d")):
+        with pytest.raises(DatasetError, match=re.escape(str(tmp_path / "source" / "d"))):
+            ds.fingerprint(index_path=index_path)
+
+
+def test_clone_raises_exists_error_for_existing_name(tmp_path):
+    """Test that clone maps the "exists" reason of clone_volumes to DatasetExistsError"""
+    result = [{"Volume Name": "clone", "Status": "failed", "Error": "volume already exists", "Reason": "exists"}]
+    with patch.object(dataset_module, "clone_volumes", return_value=result):
+        with pytest.raises(DatasetExistsError):
+            _dataset(tmp_path).clone("clone")
+
+
+def test_clone_raises_volume_error_for_other_failures(tmp_path):
+    """Test that other clone failures raise DatasetVolumeError"""
+    result = [{"Volume Name": "clone", "Status": "failed", "Error": "invalid source volume name 'source'.",
+               "Reason": "source_volume"}]
+    with patch.object(dataset_module, "clone_volumes", return_value=result):
+        with pytest.raises(DatasetVolumeError):
+            _dataset(tmp_path).clone("clone")
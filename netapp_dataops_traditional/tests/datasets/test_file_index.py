@@ -0,0 +1,146 @@
+import errno
+import hashlib
+import os
+import shutil
+import pytest
+from unittest.mock import patch
+from netapp_dataops.traditional.datasets.exceptions import DatasetError
+from netapp_dataops.traditional.datasets import file_index
+from netapp_dataops.traditional.datasets.file_index import DatasetFileIndex
+
+
+def _write(root, relative_path, data="data"):
+    path = os.path.join(str(root), relative_path)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as fileobj:
+        fileobj.write(data)
+
+
+@pytest.fixture
+def dataset(tmp_path):
+    root = tmp_path / "dataset"
+    _write(root, "top.txt", "top")
+    _write(root, os.path.join("a", "x.csv"), "xx")
+    _write(root, os.path.join("a", "b", "y.csv"), "yyy")
+    _write(root, os.path.join("c", "z.bin"), "zzzz")
+    return root
+
+
+@pytest.fixture
+def index(dataset, tmp_path):
+    with DatasetFileIndex(str(dataset), str(tmp_path / "index" / "dataset.sqlite")) as index:
+        index.refresh()
+        yield index
+
+
+def _indexed_paths(index):
+    return sorted(os.path.relpath(file.filepath, index.dataset_path) for file in index.iter_files())
+
+
+def test_refresh_indexes_all_files(index):
+    """Test that a refresh records every file with its size"""
+    assert index.count() == 4
+    assert index.total_size() == 12
+    assert index.count("a/*") == 2
+    assert index.count_by_extension() == {".bin": 1, ".csv": 2, ".txt": 1}
+
+
+def test_refresh_picks_up_added_and_removed_files(index, dataset):
+    """Test that files added and removed since the last refresh are reflected"""
+    _write(dataset, os.path.join("c", "new.txt"))
+    os.remove(str(dataset / "top.txt"))
+    index.refresh(full=True)
+    assert _indexed_paths(index) == sorted([os.path.join("a", "x.csv"), os.path.join("a", "b", "y.csv"),
+                                            os.path.join("c", "z.bin"), os.path.join("c", "new.txt")])
+
+
+def test_refresh_prunes_removed_directories(index, dataset):
+    """Test that directories that no longer exist are dropped from the index"""
+    shutil.rmtree(str(dataset / "a"))
+    index.refresh()
+    assert _indexed_paths(index) == [os.path.join("c", "z.bin"), "top.txt"]
+
+
+def test_refresh_keeps_directories_that_fail_to_read(index, dataset):
+    """Test that a transient error reading a directory keeps its indexed files"""
+    real_scandir = os.scandir
+
+    def scandir(path):
+        if os.path.basename(path.rstrip(os.sep)) == "a":
+            raise OSError(errno.EIO, "I/O error", path)
+        return real_scandir(path)
+
+    before = _indexed_paths(index)
+    with patch("os.scandir", side_effect=scandir):
+        index.refresh(full=True)
+    assert _indexed_paths(index) == before
+    assert index.unreadable_directories == ["a"]
+    index.refresh(full=True)
+    assert index.unreadable_directories == []
+
+
+def test_refresh_keeps_directories_that_fail_to_stat(index, dataset):
+    """Test that a transient error stat'ing a directory keeps its indexed files and subdirectories"""
+    real_stat = os.stat
+    directory = str(dataset / "a")
+
+    def stat(path, *args, **kwargs):
+        if path == directory:
+            raise PermissionError(errno.EACCES, "Permission denied", path)
+        return real_stat(path, *args, **kwargs)
+
+    before = _indexed_paths(index)
+    with patch("os.stat", side_effect=stat):
+        index.refresh(full=True)
+    assert _indexed_paths(index) == before
+
+
+def test_refresh_raises_for_unreadable_dataset_directory(index, dataset):
+    """Test that a dataset directory that cannot be read raises DatasetError"""
+    shutil.rmtree(str(dataset))
+    with pytest.raises(DatasetError):
+        index.refresh()
+    assert index.count() == 4
+
+
+def test_checksums_are_kept_for_unchanged_files(index, dataset):
+    """Test that only new and changed files are checksummed again"""
+    index.refresh(checksums=True)
+    checksum = index.get_checksum("top.txt")
+    assert checksum
+    _write(dataset, os.path.join("c", "z.bin"), "changed")
+    index.refresh(full=True)
+    assert index.get_checksum("top.txt") == checksum
+    assert index.get_checksum(os.path.join("c", "z.bin")) is None
+
+
+def test_directory_hashes_match_identical_trees(index, dataset, tmp_path):
+    """Test that identical trees have the same hash, and that changing a file changes it"""
+    index.refresh(checksums=True)
+    copy = tmp_path / "copy"
+    shutil.copytree(str(dataset), str(copy))
+    with DatasetFileIndex(str(copy), str(tmp_path / "index" / "copy.sqlite")) as copy_index:
+        copy_index.refresh(checksums=True)
+        assert copy_index.directory_hashes() == index.directory_hashes()
+
+        _write(copy, os.path.join("a", "b", "y.csv"), "different")
+        copy_index.refresh(full=True, checksums=True)
+        hashes = copy_index.directory_hashes()
+    original = index.directory_hashes()
+    assert hashes[""] != original[""]
+    assert hashes[os.path.join("a", "b")] != original[os.path.join("a", "b")]
+    assert hashes["c"] == original["c"]
+
+
+def test_directory_hashes_require_checksums(index):
+    """Test that hashing without checksums raises DatasetError"""
+    with pytest.raises(DatasetError):
+        index.directory_hashes()
+
+
+def test_checksum_file_reads_in_chunks(tmp_path):
+    """Test that a file larger than the read buffer is checksummed in full"""
+    data = os.urandom(10000)
+    (tmp_path / "file").write_bytes(data)
+    with patch.object(file_index, "DATASET_CHECKSUM_BUFFER_SIZE", 4096):
+        assert file_index._checksum_file(str(tmp_path / "file")) == hashlib.sha256(data).hexdigest()
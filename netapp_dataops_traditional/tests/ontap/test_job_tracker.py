@@ -0,0 +1,180 @@
+import pytest
+from concurrent.futures import Future
+from types import SimpleNamespace
+from unittest.mock import patch, MagicMock
+from netapp_ontap.error import NetAppRestError
+from netapp_dataops.traditional.ontap import job_tracker
+
+
+def _job_response(job_uuid):
+    """Build a non-polled ONTAP response carrying a job UUID"""
+    response = MagicMock()
+    response.http_response.json.return_value = {"job": {"uuid": job_uuid}}
+    return response
+
+
+def _jobs_in_state(states):
+    """Return a fake Job.get_collection reporting each queried job in the given state"""
+    queries = []
+
+    def get_collection(connection=None, uuid=None, fields=None):
+        batch = uuid.split("|")
+        queries.append(batch)
+        return [SimpleNamespace(uuid=job_uuid, state=states(job_uuid), message="boom", code=42) for job_uuid in batch]
+
+    return get_collection, queries
+
+
+def _tracker():
+    """Tracker polling quickly, so that tests do not wait on backoff"""
+    return job_tracker.JobTracker(MagicMock(), min_interval=0.01, max_interval=0.05)
+
+
+def test_track_resolves_to_job_record_on_success():
+    """Test that a successful job resolves its future to the job record"""
+    get_collection, _ = _jobs_in_state(lambda job_uuid: "success")
+    with patch.object(job_tracker.NetAppJob, "get_collection", side_effect=get_collection):
+        future = _tracker().track("job-1")
+        assert future.result(timeout=5).uuid == "job-1"
+
+
+def test_track_raises_on_failed_job():
+    """Test that a failed job raises NetAppRestError with its message and code"""
+    get_collection, _ = _jobs_in_state(lambda job_uuid: "failure")
+    with patch.object(job_tracker.NetAppJob, "get_collection", side_effect=get_collection):
+        future = _tracker().track("job-1")
+        with pytest.raises(NetAppRestError, match="boom. Error code: 42"):
+            future.result(timeout=5)
+
+
+def test_track_times_out_running_job():
+    """Test that a job still running after its timeout raises NetAppRestError"""
+    get_collection, _ = _jobs_in_state(lambda job_uuid: "running")
+    with patch.object(job_tracker.NetAppJob, "get_collection", side_effect=get_collection):
+        tracker = _tracker()
+        future = tracker.track("job-1", timeout=0.05)
+        with pytest.raises(NetAppRestError, match="timeout"):
+            future.result(timeout=5)
+        assert tracker.outstanding() == 0
+
+
+def test_jobs_are_polled_in_batches():
+    """Test that outstanding jobs are polled together, at most JOB_QUERY_BATCH_SIZE per query"""
+    get_collection, queries = _jobs_in_state(lambda job_uuid: "success")
+    with patch.object(job_tracker.NetAppJob, "get_collection", side_effect=get_collection):
+        tracker = _tracker()
+        # Register all jobs before the poller gets to run
+        with tracker._lock:
+            futures = [Future() for _ in range(120)]
+            for index, future in enumerate(futures):
+                future.set_running_or_notify_cancel()
+                tracker._jobs["job-%d" % index] = (future, None)
+        tracker.track("job-last")
+        job_tracker.wait_for_jobs(futures, timeout=5)
+
+    # 121 jobs, each polled once, in three queries
+    assert [len(batch) for batch in queries] == [50, 50, 21]
+    assert len(set(job_uuid for batch in queries for job_uuid in batch)) == 121
+
+
+def test_track_response_without_job_is_resolved():
+    """Test that a request that completed synchronously returns a resolved future"""
+    response = MagicMock()
+    response.http_response.json.return_value = {}
+    future = _tracker().track_response(response)
+    assert future.done()
+    assert future.result() is None
+
+
+def test_run_job_waits_for_job():
+    """Test that run_job issues a non-polled request and waits for its job"""
+    get_collection, _ = _jobs_in_state(lambda job_uuid: "success")
+    resource = MagicMock()
+    resource.post.return_value = _job_response("job-1")
+    with patch.object(job_tracker.NetAppJob, "get_collection", side_effect=get_collection):
+        job = job_tracker.run_job(resource, "post")
+    resource.post.assert_called_once_with(poll=False)
+    assert job.done()
+
+
+def test_get_job_tracker_is_shared_per_connection():
+    """Test that one tracker is kept per connection"""
+    connection = MagicMock()
+    assert job_tracker.get_job_tracker(connection) is job_tracker.get_job_tracker(connection)
+    assert job_tracker.get_job_tracker(connection) is not job_tracker.get_job_tracker(MagicMock())
+
+
+def test_operation_future_resolves_to_result():
+    """Test that an operation future resolves to the operation's result once its job succeeds"""
+    job = Future()
+    future = job_tracker._operation_future(job, "snapshot-1")
+    assert not future.done()
+    job.set_result(SimpleNamespace(state="success"))
+    assert future.result() == "snapshot-1"
+
+
+def test_operation_future_raises_job_error():
+    """Test that an operation future raises the error of its job"""
+    job = Future()
+    future = job_tracker._operation_future(job)
+    job.set_exception(NetAppRestError("failed"))
+    with pytest.raises(NetAppRestError):
+        future.result()
+
+
+def test_operation_future_without_job():
+    """Test that an operation without a job returns a resolved future"""
+    assert job_tracker._operation_future(result="x").result() == "x"
+
+
+def test_track_times_out_while_queries_fail():
+    """Test that the timeout still applies when the job query keeps failing"""
+    with patch.object(job_tracker.NetAppJob, "get_collection", side_effect=NetAppRestError("unreachable")), \
+         patch.object(job_tracker, "JOB_QUERY_MAX_ERRORS", 1000):
+        tracker = _tracker()
+        future = tracker.track("job-1", timeout=0.05)
+        with pytest.raises(NetAppRestError, match="timeout"):
+            future.result(timeout=5)
+        assert tracker.outstanding() == 0
+
+
+def test_track_fails_after_consecutive_query_errors():
+    """Test that a job without a timeout fails once its query failed JOB_QUERY_MAX_ERRORS times in a row"""
+    get_collection = MagicMock(side_effect=NetAppRestError("unreachable"))
+    with patch.object(job_tracker.NetAppJob, "get_collection", get_collection):
+        tracker = _tracker()
+        future = tracker.track("job-1", timeout=None)
+        with pytest.raises(NetAppRestError, match="could not be queried 5 times in a row"):
+            future.result(timeout=5)
+    assert get_collection.call_count == job_tracker.JOB_QUERY_MAX_ERRORS
+    assert tracker.outstanding() == 0
+
+
+def test_track_resets_query_errors_after_successful_query():
+    """Test that only consecutive query errors count towards failing a job"""
+    unreachable = NetAppRestError("unreachable")
+    replies = iter([unreachable] * 4 + ["running"] + [unreachable] * 4 + ["success"])
+
+    def get_collection(connection=None, uuid=None, fields=None):
+        reply = next(replies)
+        if isinstance(reply, Exception):
+            raise reply
+        return [SimpleNamespace(uuid=uuid, state=reply)]
+
+    with patch.object(job_tracker.NetAppJob, "get_collection", side_effect=get_collection):
+        future = _tracker().track("job-1", timeout=None)
+        assert future.result(timeout=5).uuid == "job-1"
+
+
+def test_unexpected_poll_error_fails_outstanding_jobs():
+    """Test that an error escaping the poller fails every outstanding job and lets a new poller start"""
+    with patch.object(job_tracker.NetAppJob, "get_collection", side_effect=RuntimeError("bug")):
+        tracker = _tracker()
+        future = tracker.track("job-1")
+        with pytest.raises(RuntimeError, match="bug"):
+            future.result(timeout=5)
+        assert tracker.outstanding() == 0
+
+    get_collection, _ = _jobs_in_state(lambda job_uuid: "success")
+    with patch.object(job_tracker.NetAppJob, "get_collection", side_effect=get_collection):
+        assert tracker.track("job-2").result(timeout=5).uuid == "job-2"
@@ -0,0 +1,113 @@
+import pytest
+from concurrent.futures import Future
+from types import SimpleNamespace
+from unittest.mock import patch, MagicMock
+from netapp_ontap.error import NetAppRestError
+from netapp_dataops.traditional.exceptions import SnapMirrorSyncOperationError
+from netapp_dataops.traditional.ontap import snapmirror_operations
+
+
+def _relationships(states):
+    """Return a fake relationship collection query reporting the next state of each relationship per poll"""
+    queries = []
+
+    def get_collection(connection=None, uuid=None, fields=None):
+        queries.append(uuid)
+        relationships = list()
+        for relationship_uuid in uuid.split("|"):
+            state = states[relationship_uuid].pop(0) if len(states[relationship_uuid]) > 1 else states[relationship_uuid][0]
+            transfer = SimpleNamespace(uuid="transfer-" + relationship_uuid, state=state, bytes_transferred=100 * len(queries))
+            relationships.append(SimpleNamespace(uuid=relationship_uuid, destination=SimpleNamespace(path="svm:" + relationship_uuid),
+                                                 healthy=True, lag_time="PT1S", transfer=transfer))
+        return relationships
+
+    return get_collection, queries
+
+
+def _wait(transfers, **kwargs):
+    return snapmirror_operations._wait_for_snap_mirror_transfers(MagicMock(), transfers, min_interval=0.01,
+                                                                 max_interval=0.02, **kwargs)
+
+
+def test_wait_polls_relationships_together():
+    """Test that pending relationships are polled with one query per batch until all transfers finish"""
+    get_collection, queries = _relationships({"a": ["transferring", "success"], "b": ["transferring", "transferring", "success"]})
+    with patch.object(snapmirror_operations.NetAppSnapmirrorRelationship, "get_collection", side_effect=get_collection):
+        results = _wait({"a": "transfer-a", "b": "transfer-b"})
+    assert queries == ["a|b", "a|b", "b"]
+    assert (results["a"]["Status"], results["b"]["Status"]) == ("success", "success")
+    assert results["b"]["Bytes Transferred"] == 300
+    assert results["a"]["Destination"] == "svm:a"
+
+
+def test_wait_reports_failed_transfer():
+    """Test that a transfer ending in another state fails with that state as error"""
+    get_collection, _ = _relationships({"a": ["failed"]})
+    with patch.object(snapmirror_operations.NetAppSnapmirrorRelationship, "get_collection", side_effect=get_collection):
+        results = _wait({"a": "transfer-a"})
+    assert (results["a"]["Status"], results["a"]["Error"]) == ("failed", "failed")
+
+
+def test_wait_reports_pending_transfers_on_timeout():
+    """Test that transfers still running when the timeout expires are reported as failed with a timeout error"""
+    get_collection, _ = _relationships({"a": ["success"], "b": ["transferring"]})
+    with patch.object(snapmirror_operations.NetAppSnapmirrorRelationship, "get_collection", side_effect=get_collection):
+        results = _wait({"a": "transfer-a", "b": "transfer-b"}, timeout=0.1)
+    assert results["a"]["Status"] == "success"
+    assert (results["b"]["Status"], results["b"]["Error"]) == ("failed", "timeout")
+    assert results["b"]["Destination"] == "svm:b"
+    assert results["b"]["Bytes Transferred"] > 0
+
+
+def _patch_sync(transfer_errors=()):
+    """Patch config, connection and transfer triggering for the sync functions"""
+    def run_job(transfer, method, wait=True):
+        # Posting a transfer fills in the UUID of the transfer it started
+        job = Future()
+        if transfer.relationship_uuid in transfer_errors:
+            job.set_exception(NetAppRestError("transfer rejected"))
+        else:
+            transfer.uuid = "transfer-" + transfer.relationship_uuid
+            job.set_result(None)
+        return job
+
+    def transfer(uuid):
+        return MagicMock(relationship_uuid=uuid, uuid=None)
+
+    config = {"connectionType": "ONTAP", "hostname": "cluster", "username": "admin", "password": "secret", "svm": "svm0"}
+    return [patch.object(snapmirror_operations, "_retrieve_config", return_value=config),
+            patch.object(snapmirror_operations, "_instantiate_connection", return_value=MagicMock()),
+            patch.object(snapmirror_operations, "NetAppSnapmirrorTransfer", side_effect=transfer),
+            patch.object(snapmirror_operations, "run_job", side_effect=run_job)]
+
+
+def test_sync_relationships_keeps_going_after_failed_trigger():
+    """Test that a relationship whose transfer cannot be triggered does not stop the others"""
+    get_collection, _ = _relationships({"a": ["success"]})
+    patches = _patch_sync(transfer_errors=("b",))
+    for patcher in patches:
+        patcher.start()
+    try:
+        with patch.object(snapmirror_operations.NetAppSnapmirrorRelationship, "get_collection", side_effect=get_collection), \
+             patch.object(snapmirror_operations.time, "sleep"):
+            results = snapmirror_operations.sync_snap_mirror_relationships(["a", "b"])
+    finally:
+        for patcher in reversed(patches):
+            patcher.stop()
+    assert [(result["UUID"], result["Status"]) for result in results] == [("a", "success"), ("b", "failed")]
+    assert results[1]["Error"] == "transfer rejected"
+
+
+def test_sync_relationship_raises_on_timeout():
+    """Test that waiting for a single sync raises SnapMirrorSyncOperationError when the timeout expires"""
+    get_collection, _ = _relationships({"a": ["transferring"]})
+    patches = _patch_sync()
+    for patcher in patches:
+        patcher.start()
+    try:
+        with patch.object(snapmirror_operations.NetAppSnapmirrorRelationship, "get_collection", side_effect=get_collection):
+            with pytest.raises(SnapMirrorSyncOperationError):
+                snapmirror_operations.sync_snap_mirror_relationship(uuid="a", wait_until_complete=True, timeout=0.1)
+    finally:
+        for patcher in reversed(patches):
+            patcher.stop()
@@ -0,0 +1,210 @@
+import pytest
+from concurrent.futures import Future
+from types import SimpleNamespace
+from unittest.mock import patch, MagicMock
+from netapp_ontap.error import NetAppRestError
+from netapp_dataops.traditional.core import connection
+from netapp_dataops.traditional.exceptions import APIConnectionError
+from netapp_dataops.traditional.ontap import volume_operations
+
+
+def _list_volumes_by_cluster(volumes):
+    """Return a list_volumes replacement that answers for the cluster selected by ontap_connection()"""
+    def list_volumes(**kwargs):
+        cluster = connection._get_context_cluster_name()
+        if isinstance(volumes[cluster], Exception):
+            raise volumes[cluster]
+        return [{"Volume Name": name} for name in volumes[cluster]]
+    return list_volumes
+
+
+def test_list_volumes_multi_merges_clusters():
+    """Test that the volumes of every cluster are returned, tagged with their cluster"""
+    volumes = {"a": ["v1", "v2"], "b": ["v3"]}
+    with patch.object(volume_operations, "list_volumes", side_effect=_list_volumes_by_cluster(volumes)):
+        result = volume_operations.list_volumes_multi(["a", "b"])
+    assert result == [{"Volume Name": "v1", "Cluster": "a"}, {"Volume Name": "v2", "Cluster": "a"},
+                      {"Volume Name": "v3", "Cluster": "b"}]
+    assert connection._get_context_cluster_name() is None
+
+
+def test_list_volumes_multi_keeps_partial_results():
+    """Test that a failing cluster is reported without discarding the volumes of the others"""
+    volumes = {"a": ["v1"], "b": APIConnectionError("unreachable")}
+    with patch.object(volume_operations, "list_volumes", side_effect=_list_volumes_by_cluster(volumes)):
+        result = volume_operations.list_volumes_multi(["a", "b"])
+    assert result == [{"Volume Name": "v1", "Cluster": "a"}, {"Cluster": "b", "Error": "unreachable"}]
+
+
+def test_list_volumes_multi_raises_when_every_cluster_fails():
+    """Test that the error is raised when no cluster could be queried"""
+    volumes = {"a": APIConnectionError("unreachable"), "b": APIConnectionError("unreachable")}
+    with patch.object(volume_operations, "list_volumes", side_effect=_list_volumes_by_cluster(volumes)):
+        with pytest.raises(APIConnectionError):
+            volume_operations.list_volumes_multi(["a", "b"])
+
+
+def test_list_volumes_multi_without_clusters():
+    """Test that an empty cluster list queries nothing"""
+    with patch.object(volume_operations, "list_volumes") as list_volumes:
+        assert volume_operations.list_volumes_multi([]) == []
+    list_volumes.assert_not_called()
+
+
+CONFIG = {"connectionType": "ONTAP", "hostname": "cluster", "username": "admin", "password": "secret", "svm": "svm0",
+          "defaultExportPolicy": "default", "defaultSnapshotPolicy": "none", "defaultUnixUID": "1000", "defaultUnixGID": "1000"}
+
+
+class FakeTracker:
+    """Job tracker whose futures are already resolved; a response that is an exception fails its job"""
+
+    def track_response(self, response):
+        future = Future()
+        if isinstance(response, Exception):
+            future.set_exception(response)
+        else:
+            future.set_result(response)
+        return future
+
+
+class FakeOntap:
+    """Mocked ONTAP resources for clone_volumes, holding the volumes, policies and snapshots that exist"""
+
+    def __init__(self):
+        self.volumes = {"source": "source-uuid"}
+        self.export_policies = ["default"]
+        self.snapshot_policies = [SimpleNamespace(name="none")]
+        self.snapshots = [SimpleNamespace(name="snap", uuid="snap-uuid")]
+        self.failing_jobs = {}
+        self.created = []
+        self.volume = MagicMock()
+        self.volume.get_collection.side_effect = self._get_volumes
+        self.volume.from_dict.side_effect = self._new_volume
+        self.volume.find.side_effect = lambda connection, name, svm: None
+        self.volume.side_effect = lambda uuid: MagicMock(uuid=uuid)
+
+    def _get_volumes(self, connection, svm, name, fields, max_records):
+        return [SimpleNamespace(name=volume, uuid=uuid) for volume, uuid in self.volumes.items() if volume in name.split("|")]
+
+    def _new_volume(self, volumeDict):
+        self.created.append(volumeDict)
+        volume = MagicMock(uuid=volumeDict["name"] + "-uuid")
+        volume.name = volumeDict["name"]
+        volume.post.return_value = self.failing_jobs.get(volumeDict["name"], "created")
+        return volume
+
+    def patches(self):
+        export_policy = MagicMock()
+        export_policy.get_collection.side_effect = lambda connection, name, fields, **kwargs: [
+            SimpleNamespace(name=policy) for policy in self.export_policies]
+        snapshot_policy = MagicMock()
+        snapshot_policy.get_collection.side_effect = lambda connection, name, fields: self.snapshot_policies
+        snapshot = MagicMock()
+        snapshot.get_collection.side_effect = lambda uuid, connection, fields, name, **kwargs: [
+            found for found in self.snapshots if found.name == name]
+        return [patch.object(volume_operations, "_retrieve_config", side_effect=lambda print_output: dict(CONFIG)),
+                patch.object(volume_operations, "_instantiate_connection", return_value=MagicMock()),
+                patch.object(volume_operations, "get_job_tracker", return_value=FakeTracker()),
+                patch.object(volume_operations, "NetAppVolume", self.volume),
+                patch.object(volume_operations, "NetAppExportPolicy", export_policy),
+                patch.object(volume_operations, "NetAppSnapshotPolicy", snapshot_policy),
+                patch.object(volume_operations, "NetAppSnapshot", snapshot)]
+
+
+@pytest.fixture
+def ontap():
+    fake = FakeOntap()
+    patches = fake.patches()
+    for patcher in patches:
+        patcher.start()
+    yield fake
+    for patcher in reversed(patches):
+        patcher.stop()
+
+
+def test_clone_volumes_creates_every_clone(ontap):
+    """Test that all clones are created from bulk validation queries"""
+    specs = [{"new_volume_name": "c1", "source_volume_name": "source"},
+             {"new_volume_name": "c2", "source_volume_name": "source", "source_snapshot_name": "snap"}]
+    results = volume_operations.clone_volumes(specs)
+    assert [(result["Volume Name"], result["Status"], result["Reason"]) for result in results] == [
+        ("c1", "created", None), ("c2", "created", None)]
+    assert ontap.volume.get_collection.call_count == 2
+    assert "parent_snapshot" not in ontap.created[0]["clone"]
+    assert ontap.created[1]["clone"]["parent_snapshot"] == {"name": "snap", "uuid": "snap-uuid"}
+
+
+def test_clone_volumes_honours_root_uid_and_gid(ontap):
+    """Test that an explicit uid/gid of 0 is not replaced by the configured default"""
+    volume_operations.clone_volumes([{"new_volume_name": "c1", "source_volume_name": "source"},
+                                     {"new_volume_name": "c2", "source_volume_name": "source", "unix_uid": 0, "unix_gid": 0}])
+    assert (ontap.created[0]["nas"]["uid"], ontap.created[0]["nas"]["gid"]) == (1000, 1000)
+    assert "uid" not in ontap.created[1]["nas"] and "gid" not in ontap.created[1]["nas"]
+
+
+def test_clone_volumes_without_specs(ontap):
+    """Test that an empty spec list queries nothing"""
+    assert volume_operations.clone_volumes([]) == []
+    ontap.volume.get_collection.assert_not_called()
+
+
+def test_clone_volumes_records_failed_job_per_clone(ontap):
+    """Test that a failed clone job fails only its own clone"""
+    ontap.failing_jobs["c1"] = NetAppRestError("no space left")
+    results = volume_operations.clone_volumes([{"new_volume_name": "c1", "source_volume_name": "source"},
+                                               {"new_volume_name": "c2", "source_volume_name": "source"}])
+    assert results[0] == {"Volume Name": "c1", "Status": "failed", "Error": "ONTAP Rest API Error: no space left",
+                          "Reason": "api_error"}
+    assert results[1]["Status"] == "created"
+
+
+def test_clone_volumes_records_missing_clone_per_clone(ontap):
+    """Test that a clone that cannot be found after its job completed fails only its own clone"""
+    new_volume = ontap.volume.from_dict.side_effect
+
+    def from_dict(volumeDict):
+        volume = new_volume(volumeDict)
+        if volume.name == "c1":
+            volume.uuid = None
+        return volume
+
+    ontap.volume.from_dict.side_effect = from_dict
+    results = volume_operations.clone_volumes([{"new_volume_name": "c1", "source_volume_name": "source"},
+                                               {"new_volume_name": "c2", "source_volume_name": "source"}])
+    assert (results[0]["Status"], results[0]["Reason"]) == ("failed", "api_error")
+    assert "could not be found" in results[0]["Error"]
+    assert results[1]["Status"] == "created"
+
+
+def test_clone_volumes_records_unexpected_errors_per_clone(ontap):
+    """Test that an error other than an ONTAP API error fails only its own clone"""
+    ontap.failing_jobs["c1"] = KeyError("job")
+    results = volume_operations.clone_volumes([{"new_volume_name": "c1", "source_volume_name": "source"},
+                                               {"new_volume_name": "c2", "source_volume_name": "source"}])
+    assert (results[0]["Status"], results[0]["Reason"]) == ("failed", "api_error")
+    assert results[1]["Status"] == "created"
+
+
+@pytest.mark.parametrize("spec, reason", [
+    ({"new_volume_name": "source"}, "exists"),
+    ({"export_policy": "missing"}, "export_policy"),
+    ({"snapshot_policy": "missing"}, "snapshot_policy"),
+    ({"source_volume_name": "missing"}, "source_volume"),
+    ({"source_snapshot_name": "missing"}, "source_snapshot"),
+])
+def test_clone_volumes_reports_reason_per_clone(ontap, spec, reason):
+    """Test that a clone failing validation reports why, without creating it or failing the others"""
+    spec = dict({"new_volume_name": "c1", "source_volume_name": "source"}, **spec)
+    results = volume_operations.clone_volumes([spec, {"new_volume_name": "c2", "source_volume_name": "source"}])
+    assert (results[0]["Status"], results[0]["Reason"]) == ("failed", reason)
+    assert results[0]["Error"]
+    assert (results[1]["Status"], results[1]["Reason"]) == ("created", None)
+    assert [created["name"] for created in ontap.created] == ["c2"]
+
+
+def test_clone_volumes_rejects_duplicate_names(ontap):
+    """Test that a name given to more than one clone fails every clone of that name"""
+    results = volume_operations.clone_volumes([{"new_volume_name": "c1", "source_volume_name": "source"},
+                                               {"new_volume_name": "c1", "source_volume_name": "source"}])
+    assert [(result["Status"], result["Reason"]) for result in results] == [("failed", "exists"), ("failed", "exists")]
+    assert ontap.created == []
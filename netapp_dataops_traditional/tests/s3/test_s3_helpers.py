@@ -0,0 +1,249 @@
+import io
+import json
+import os
+import pytest
+from unittest.mock import patch, MagicMock
+from netapp_dataops.traditional.data_movement import s3_operations
+from netapp_dataops.traditional.exceptions import APIConnectionError
+
+
+def test_latency_histogram_percentiles():
+    """Test that percentiles are accurate to within one 5% bucket"""
+    histogram = s3_operations._LatencyHistogram()
+    for millis in range(1, 1001):
+        histogram.add(millis / 1000)
+    assert histogram.percentile(50) == pytest.approx(0.5, rel=0.05)
+    assert histogram.percentile(99) == pytest.approx(0.99, rel=0.05)
+    assert histogram.percentile(100) == 1.0
+    assert histogram.max == 1.0
+
+
+def test_latency_histogram_empty():
+    """Test that an empty histogram has no percentiles"""
+    assert s3_operations._LatencyHistogram().percentile(50) is None
+
+
+def test_latency_histogram_merge():
+    """Test that merged histograms combine counts and maximums"""
+    first = s3_operations._LatencyHistogram()
+    second = s3_operations._LatencyHistogram()
+    first.add(0.01)
+    second.add(2.0)
+    second.add(2.0)
+    first.merge(second)
+    assert first.count == 3
+    assert first.max == 2.0
+    assert first.percentile(50) == pytest.approx(2.0, rel=0.05)
+
+
+def test_token_bucket_allows_burst():
+    """Test that up to one second's worth of tokens is available without waiting"""
+    bucket = s3_operations._TokenBucket(rate=100)
+    with patch.object(s3_operations.time, "sleep") as sleep:
+        bucket.consume(100)
+    sleep.assert_not_called()
+
+
+def test_token_bucket_sleeps_off_debt():
+    """Test that taking more tokens than available sleeps for the shortfall at the configured rate"""
+    bucket = s3_operations._TokenBucket(rate=100)
+    with patch.object(s3_operations.time, "sleep") as sleep:
+        bucket.consume(150)
+    assert sleep.call_args[0][0] == pytest.approx(0.5, abs=0.05)
+
+
+def test_throttled_stream_consumes_bytes_read():
+    """Test that a throttled stream draws one token per byte read"""
+    consumed = []
+
+    class Bucket:
+        def consume(self, amount):
+            consumed.append(amount)
+
+    stream = s3_operations._ThrottledStream(io.BytesIO(b"x" * 2500), Bucket())
+    assert b"".join(stream.iter_chunks(1000)) == b"x" * 2500
+    assert consumed == [1000, 1000, 500]
+    assert stream.tell() == 2500
+
+
+def _journal(path, direction="push", prefix="p/"):
+    journal = s3_operations._S3TransferJournal(str(path), direction=direction, s3Bucket="bucket", s3ObjectKeyPrefix=prefix)
+    journal.open()
+    return journal
+
+
+def test_transfer_journal_resumes_completed_objects(tmp_path):
+    """Test that objects recorded as done are known after reopening the journal"""
+    path = tmp_path / "journal"
+    journal = _journal(path)
+    journal.record_done("p/a", size=1, mtime_ns=2)
+    journal.close()
+
+    journal = _journal(path)
+    assert journal.is_done("p/a", size=1, mtime_ns=2)
+    assert not journal.is_done("p/a", size=1, mtime_ns=3)
+    assert not journal.is_done("p/b")
+    journal.close()
+
+
+def test_transfer_journal_drops_incomplete_record(tmp_path):
+    """Test that a record cut short by an interruption is discarded"""
+    path = tmp_path / "journal"
+    journal = _journal(path)
+    journal.record_done("p/a", etag="1")
+    journal.close()
+    with open(str(path), "a") as journal_file:
+        journal_file.write('{"op": "done", "key": "p/b"')
+
+    journal = _journal(path)
+    assert journal.is_done("p/a", etag="1")
+    assert not journal.is_done("p/b")
+    journal.close()
+    for line in open(str(path)):
+        json.loads(line)
+
+
+def test_transfer_journal_compacts_records(tmp_path):
+    """Test that reopening rewrites the journal with one record per object"""
+    path = tmp_path / "journal"
+    journal = _journal(path)
+    journal.record_upload("p/a", upload_id="u1", part_size=8, size=16, mtime_ns=1)
+    journal.record_done("p/a", size=16, mtime_ns=1)
+    journal.record_done("p/a", size=16, mtime_ns=1)
+    journal.record_upload("p/b", upload_id="u2", part_size=8, size=16, mtime_ns=1)
+    journal.close()
+
+    journal = _journal(path)
+    journal.close()
+    records = [json.loads(line) for line in open(str(path))]
+    assert [(record["op"], record.get("key")) for record in records] == [("start", None), ("done", "p/a"), ("upload", "p/b")]
+    assert journal.get_upload("p/a") is None
+    assert journal.get_upload("p/b")["upload_id"] == "u2"
+
+
+def test_transfer_journal_discards_other_transfer(tmp_path):
+    """Test that a journal written for another transfer is not resumed"""
+    path = tmp_path / "journal"
+    journal = _journal(path, prefix="p/")
+    journal.record_done("p/a")
+    journal.close()
+
+    journal = _journal(path, prefix="q/")
+    assert not journal.is_done("p/a")
+    journal.close()
+
+
+def test_transfer_pipeline_does_not_retry_local_file_errors():
+    """Test that missing or unreadable local files fail at once while other errors are retried"""
+    calls = []
+
+    def transfer(name, err):
+        calls.append(name)
+        raise err
+
+    tasks = [(name, 1, {"name": name, "err": err}) for name, err in
+             [("missing", APIConnectionError(FileNotFoundError(2, "No such file"))),
+              ("denied", PermissionError(13, "Permission denied")),
+              ("flaky", APIConnectionError(ConnectionError("reset")))]]
+    with patch.object(s3_operations.time, "sleep"):
+        result = s3_operations._run_transfer_pipeline(tasks, transfer, max_workers=1, max_queue_size=4, retries=2)
+    assert sorted(calls) == ["denied", "flaky", "flaky", "flaky", "missing"]
+    assert result.retries == 2
+    assert len(result.failures) == 3
+
+
+class FakeMultipartClient:
+    """Fake S3 client holding the parts of multipart uploads"""
+
+    def __init__(self):
+        self.parts = {}
+        self.completed = None
+
+    def create_multipart_upload(self, Bucket, Key, **kwargs):
+        return {"UploadId": "u1"}
+
+    def upload_part(self, Bucket, Key, UploadId, PartNumber, Body):
+        assert not isinstance(Body, bytes)
+        data = Body.read()
+        self.parts[PartNumber] = data
+        return {"ETag": "etag-%d" % PartNumber}
+
+    def get_paginator(self, operation):
+        parts = [{"PartNumber": number, "ETag": "etag-%d" % number, "Size": len(data)} for number, data in self.parts.items()]
+        paginator = MagicMock()
+        paginator.paginate.return_value = [{"Parts": parts}]
+        return paginator
+
+    def complete_multipart_upload(self, Bucket, Key, UploadId, MultipartUpload):
+        self.completed = MultipartUpload["Parts"]
+
+
+def test_upload_in_parts_streams_parts_from_file(tmp_path):
+    """Test that each part is uploaded from its slice of the file and that the parts reassemble it"""
+    data = os.urandom(2500)
+    (tmp_path / "file").write_bytes(data)
+    client = FakeMultipartClient()
+    journal = _journal(tmp_path / "journal")
+    config = s3_operations.TransferConfig(multipart_chunksize=1000, max_concurrency=2)
+    s3_operations._upload_in_parts(client, "bucket", "p/file", str(tmp_path / "file"), {}, config, journal)
+    journal.close()
+    assert b"".join(client.parts[number] for number in sorted(client.parts)) == data
+    assert client.completed == [{"PartNumber": number, "ETag": "etag-%d" % number} for number in (1, 2, 3)]
+
+
+def test_upload_in_parts_skips_uploaded_parts(tmp_path):
+    """Test that resuming an upload sends only the parts not already stored in S3"""
+    data = os.urandom(2500)
+    (tmp_path / "file").write_bytes(data)
+    stat = os.stat(str(tmp_path / "file"))
+    client = FakeMultipartClient()
+    client.parts = {1: data[:1000], 2: data[1000:2000]}
+    journal = _journal(tmp_path / "journal")
+    journal.record_upload("p/file", upload_id="u0", part_size=1000, size=stat.st_size, mtime_ns=stat.st_mtime_ns)
+    config = s3_operations.TransferConfig(multipart_chunksize=1000, max_concurrency=1)
+    with patch.object(client, "upload_part", wraps=client.upload_part) as upload_part:
+        s3_operations._upload_in_parts(client, "bucket", "p/file", str(tmp_path / "file"), {}, config, journal)
+    journal.close()
+    assert [call.kwargs["PartNumber"] for call in upload_part.call_args_list] == [3]
+    assert b"".join(client.parts[number] for number in sorted(client.parts)) == data
+
+
+def test_sync_manifest_round_trip(tmp_path):
+    """Test that recorded entries are saved and loaded for the same bucket and prefix"""
+    local_file = tmp_path / "a"
+    local_file.write_text("data")
+    path = str(tmp_path / "manifest.json")
+    manifest = s3_operations._S3SyncManifest(path, s3Bucket="bucket", s3ObjectKeyPrefix="p/")
+    manifest.record("p/a", str(local_file), etag='"e1"')
+    manifest.save()
+
+    loaded = s3_operations._S3SyncManifest(path, s3Bucket="bucket", s3ObjectKeyPrefix="p/")
+    loaded.load()
+    assert loaded.get("p/a")["etag"] == '"e1"'
+    assert loaded.matches_local_file("p/a", os.stat(str(local_file)))
+
+    other = s3_operations._S3SyncManifest(path, s3Bucket="bucket", s3ObjectKeyPrefix="q/")
+    other.load()
+    assert other.get("p/a") is None
+
+
+def test_sync_manifest_detects_modified_file(tmp_path):
+    """Test that a file modified since it was recorded no longer matches"""
+    local_file = tmp_path / "a"
+    local_file.write_text("data")
+    manifest = s3_operations._S3SyncManifest(str(tmp_path / "manifest.json"), s3Bucket="bucket", s3ObjectKeyPrefix="")
+    manifest.record("a", str(local_file))
+    local_file.write_text("changed")
+    assert not manifest.matches_local_file("a", os.stat(str(local_file)))
+    assert not manifest.matches_local_file("a", None)
+    manifest.remove("a")
+    assert manifest.get("a") is None
+
+
+def test_sync_manifest_ignores_unreadable_file(tmp_path):
+    """Test that a corrupt manifest is treated as empty"""
+    path = tmp_path / "manifest.json"
+    path.write_text("{not json")
+    manifest = s3_operations._S3SyncManifest(str(path), s3Bucket="bucket", s3ObjectKeyPrefix="")
+    manifest.load()
+    assert manifest.get("a") is None
@@ -0,0 +1,254 @@
+import datetime
+import errno
+import hashlib
+import io
+import os
+import pytest
+from unittest.mock import patch, MagicMock
+from netapp_dataops.traditional.core import connection
+from netapp_dataops.traditional.data_movement import s3_operations
+from netapp_dataops.traditional.exceptions import APIConnectionError
+
+
+class FakeS3:
+    """In-memory stand-in for the boto3 S3 resource used by bulk transfers"""
+
+    def __init__(self):
+        self.objects = {}  # key -> (data, last modified)
+        self.uploads = []
+        self.downloads = []
+        self.meta = MagicMock()
+        self.meta.client.get_paginator.side_effect = lambda name: self
+        self.meta.client.get_object.side_effect = self.get_object
+        self.Object = lambda bucket, key: FakeObject(self, key)
+        self.Bucket = lambda bucket: self
+
+    def put(self, key, data):
+        self.objects[key] = (data, datetime.datetime.now(datetime.timezone.utc))
+
+    def paginate(self, Bucket, Prefix="", Delimiter=None):
+        contents = [{"Key": key, "Size": len(data), "ETag": '"%s"' % hashlib.md5(data).hexdigest(),
+                     "LastModified": modified}
+                    for key, (data, modified) in sorted(self.objects.items()) if key.startswith(Prefix)]
+        yield {"Contents": contents}
+
+    def get_object(self, Bucket, Key, Range, IfMatch):
+        start, end = (int(offset) for offset in Range[len("bytes="):].split("-"))
+        return {"Body": FakeBody(self.objects[Key][0][start:end + 1])}
+
+    def delete_objects(self, Delete):
+        for obj in Delete["Objects"]:
+            self.objects.pop(obj["Key"])
+        return {}
+
+
+class FakeBody(io.BytesIO):
+    def iter_chunks(self, chunk_size):
+        return iter(lambda: self.read(chunk_size), b"")
+
+
+class FakeObject:
+    def __init__(self, s3, key):
+        self.s3 = s3
+        self.key = key
+
+    @property
+    def content_length(self):
+        return len(self.s3.objects[self.key][0])
+
+    @property
+    def e_tag(self):
+        return '"%s"' % hashlib.md5(self.s3.objects[self.key][0]).hexdigest()
+
+    def upload_file(self, local_file, ExtraArgs=None, Config=None):
+        self.s3.uploads.append(self.key)
+        with open(local_file, "rb") as fileobj:
+            self.s3.put(self.key, fileobj.read())
+
+    def download_file(self, local_file, Config=None):
+        self.s3.downloads.append(self.key)
+        with open(local_file, "wb") as fileobj:
+            fileobj.write(self.s3.objects[self.key][0])
+
+
+@pytest.fixture
+def fake_s3():
+    s3 = FakeS3()
+    with patch.object(s3_operations, "_instantiate_s3_session", return_value=s3), \
+         patch.object(connection, "_instantiate_s3_session", return_value=s3), \
+         patch.object(s3_operations, "_retrieve_s3_access_details", return_value=("http://s3", "key", "secret", True, None)):
+        yield s3
+
+
+def _write(root, relative_path, data="data"):
+    path = os.path.join(str(root), relative_path)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as fileobj:
+        fileobj.write(data)
+
+
+def _unreadable(name):
+    """Return an os.scandir replacement that fails for directories with the given name"""
+    real_scandir = os.scandir
+
+    def scandir(path):
+        if os.path.basename(path) == name:
+            raise PermissionError(errno.EACCES, "Permission denied", path)
+        return real_scandir(path)
+    return scandir
+
+
+def test_push_sync_skips_unchanged_files(tmp_path, fake_s3):
+    """Test that a second sync pushes nothing"""
+    _write(tmp_path, "a")
+    _write(tmp_path, os.path.join("d", "b"))
+    result = s3_operations.push_directory_to_s3("bucket", str(tmp_path), "p/", sync=True)
+    assert result.objects_transferred == 2
+    result = s3_operations.push_directory_to_s3("bucket", str(tmp_path), "p/", sync=True)
+    assert result.objects_transferred == 0
+    assert result.objects_skipped == 2
+
+
+def test_push_sync_delete_removes_extraneous_objects(tmp_path, fake_s3):
+    """Test that objects without a local file are deleted"""
+    _write(tmp_path, "a")
+    fake_s3.put("p/gone", b"x")
+    result = s3_operations.push_directory_to_s3("bucket", str(tmp_path), "p/", sync=True, delete=True)
+    assert result.objects_deleted == 1
+    assert sorted(fake_s3.objects) == ["p/a"]
+
+
+def test_push_sync_delete_rejects_prefix_without_slash(tmp_path, fake_s3):
+    """Test that delete refuses a prefix whose listing would include sibling prefixes"""
+    _write(tmp_path, "a")
+    fake_s3.put("run10/a", b"x")
+    fake_s3.put("run1-old/a", b"x")
+    with pytest.raises(ValueError):
+        s3_operations.push_directory_to_s3("bucket", str(tmp_path), "run1", sync=True, delete=True)
+    assert sorted(fake_s3.objects) == ["run1-old/a", "run10/a"]
+
+
+def test_push_sync_delete_leaves_sibling_prefixes(tmp_path, fake_s3):
+    """Test that only objects under the prefix directory are deleted"""
+    _write(tmp_path, "a")
+    fake_s3.put("run1/gone", b"x")
+    fake_s3.put("run10/a", b"x")
+    result = s3_operations.push_directory_to_s3("bucket", str(tmp_path), "run1/", sync=True, delete=True)
+    assert result.objects_deleted == 1
+    assert sorted(fake_s3.objects) == ["run1/a", "run10/a"]
+
+
+def test_push_sync_delete_keeps_hidden_objects(tmp_path, fake_s3):
+    """Test that objects with a hidden name below the prefix are never deleted, since hidden files are never pushed"""
+    _write(tmp_path, "a")
+    _write(tmp_path, ".hidden")
+    fake_s3.put("p/.hidden", b"x")
+    fake_s3.put("p/.dir/b", b"x")
+    result = s3_operations.push_directory_to_s3("bucket", str(tmp_path), "p/", sync=True, delete=True)
+    assert result.objects_deleted == 0
+    assert sorted(fake_s3.objects) == ["p/.dir/b", "p/.hidden", "p/a"]
+
+
+def test_push_sync_delete_skipped_for_unreadable_directory(tmp_path, fake_s3):
+    """Test that nothing is deleted when a local directory could not be read"""
+    _write(tmp_path, "a")
+    _write(tmp_path, os.path.join("locked", "b"))
+    s3_operations.push_directory_to_s3("bucket", str(tmp_path), "p/", sync=True)
+    fake_s3.put("p/gone", b"x")
+
+    with patch("os.scandir", side_effect=_unreadable("locked")):
+        result = s3_operations.push_directory_to_s3("bucket", str(tmp_path), "p/", sync=True, delete=True)
+    assert result.unreadable_directories == [os.path.join(str(tmp_path), "locked")]
+    assert result.objects_deleted == 0
+    assert sorted(fake_s3.objects) == ["p/a", "p/gone", "p/locked/b"]
+
+
+def test_push_sync_delete_skipped_for_missing_directory(tmp_path, fake_s3):
+    """Test that a missing local directory does not empty the prefix"""
+    fake_s3.put("p/a", b"x")
+    result = s3_operations.push_directory_to_s3("bucket", str(tmp_path / "missing"), "p/", sync=True, delete=True,
+                                                manifest_file=str(tmp_path / "manifest.json"))
+    assert result.objects_deleted == 0
+    assert sorted(fake_s3.objects) == ["p/a"]
+
+
+def test_push_journal_resumes_transfer(tmp_path, fake_s3):
+    """Test that files recorded in the journal are not pushed again"""
+    source = tmp_path / "source"
+    for name in ["a", "b", "c"]:
+        _write(source, name)
+    journal_file = str(tmp_path / "journal")
+    s3_operations.push_directory_to_s3("bucket", str(source), "p/", journal_file=journal_file)
+    _write(source, "d")
+
+    result = s3_operations.push_directory_to_s3("bucket", str(source), "p/", journal_file=journal_file)
+    assert result.objects_transferred == 1
+    assert result.objects_skipped == 3
+    assert fake_s3.uploads.count("p/d") == 1
+
+
+def test_push_pipeline_error_raises_api_connection_error(tmp_path, fake_s3):
+    """Test that errors outside of individual uploads are raised as APIConnectionError"""
+    with patch.object(s3_operations, "_scan_directory_in_parallel", side_effect=RuntimeError("scan failed")):
+        with pytest.raises(APIConnectionError):
+            s3_operations.push_directory_to_s3("bucket", str(tmp_path), "p/")
+
+
+def test_pull_sync_delete_removes_extraneous_files(tmp_path, fake_s3):
+    """Test that local files without an object are deleted, except hidden files"""
+    fake_s3.put("p/a", b"x")
+    _write(tmp_path, os.path.join("p", "gone"))
+    _write(tmp_path, os.path.join("p", ".hidden"))
+    result = s3_operations.pull_bucket_from_s3("bucket", str(tmp_path) + os.sep, "p/", sync=True, delete=True)
+    assert result.objects_deleted == 1
+    assert sorted(os.listdir(str(tmp_path / "p"))) == [".hidden", "a"]
+
+
+def test_pull_sync_delete_keeps_manifest_and_journal(tmp_path, fake_s3):
+    """Test that the manifest and journal are never deleted, even when placed in the local directory"""
+    fake_s3.put("a", b"x")
+    manifest_file = str(tmp_path / "manifest.json")
+    journal_file = str(tmp_path / "journal.log")
+    result = s3_operations.pull_bucket_from_s3("bucket", str(tmp_path) + os.sep, sync=True, delete=True,
+                                               manifest_file=manifest_file, journal_file=journal_file)
+    assert result.objects_deleted == 0
+    assert sorted(os.listdir(str(tmp_path))) == ["a", "journal.log", "manifest.json"]
+
+
+def test_pull_journal_resumes_transfer(tmp_path, fake_s3):
+    """Test that objects recorded in the journal with an unchanged ETag are not pulled again"""
+    for key in ["a", "b"]:
+        fake_s3.put(key, key.encode())
+    destination = str(tmp_path / "data") + os.sep
+    journal_file = str(tmp_path / "journal")
+    s3_operations.pull_bucket_from_s3("bucket", destination, journal_file=journal_file)
+    fake_s3.put("b", b"changed")
+
+    result = s3_operations.pull_bucket_from_s3("bucket", destination, journal_file=journal_file)
+    assert result.objects_transferred == 1
+    assert result.objects_skipped == 1
+    assert fake_s3.downloads.count("b") == 2
+    with open(destination + "b") as fileobj:
+        assert fileobj.read() == "changed"
+
+
+def test_pull_object_downloads_large_object_in_ranges(tmp_path, fake_s3):
+    """Test that a single large object is fetched in byte ranges written into place"""
+    data = os.urandom(5 * 1024 * 1024 + 1)
+    fake_s3.put("big", data)
+    local_file = str(tmp_path / "big")
+    s3_operations.pull_object_from_s3("bucket", "big", local_file, multipart_threshold=1024 * 1024,
+                                      multipart_chunksize=1024 * 1024)
+    with open(local_file, "rb") as fileobj:
+        assert fileobj.read() == data
+    assert fake_s3.meta.client.get_object.call_count == 6
+    assert fake_s3.downloads == []
+
+
+def test_bulk_pull_downloads_large_objects_whole(tmp_path, fake_s3):
+    """Test that bulk pulls leave large objects to the regular download, one object per worker"""
+    fake_s3.put("big", os.urandom(2 * 1024 * 1024))
+    s3_operations.pull_bucket_from_s3("bucket", str(tmp_path) + os.sep, multipart_threshold=1024 * 1024,
+                                      multipart_chunksize=1024 * 1024)
+    assert fake_s3.downloads == ["big"]
+    fake_s3.meta.client.get_object.assert_not_called()